@@ -5,7 +5,7 @@ import random
 import json
 import threading
 import requests
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs  # URL 쿼리 파라미터 처리용
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QWidget, QFrame, QDialog,
@@ -79,6 +79,7 @@ class RouletteSignals(QObject):
     update_images = pyqtSignal(list)
     finish_animation = pyqtSignal(int)
     play_tick_sound = pyqtSignal()  # 틱 소리 재생 신호 추가
+    request_received = pyqtSignal(int, object)  # HTTP 스레드 → 메인 스레드 요청 전달 (프로필 인덱스, 닉네임)
 
 # 룰렛 항목 클래스
 class RouletteItem:
@@ -1100,6 +1101,7 @@ class RouletteApp(QMainWindow):
         self.signals.start_roulette.connect(self.spin_roulette)
         self.signals.update_images.connect(self.update_roulette_display)
         self.signals.finish_animation.connect(self.finish_roulette)
+        self.signals.request_received.connect(self.add_roulette_request)  # HTTP 요청은 메인 스레드에서 처리
         self.signals.play_tick_sound.connect(self.play_tick_sound)  # 틱 소리 신호 연결
         
         # 중앙 위젯 설정
@@ -2131,6 +2133,10 @@ class RouletteApp(QMainWindow):
                              f"프로필 '{self.current_profile.name}'의 URL이 클립보드에 복사되었습니다:\n{url}\n\n"
                              f"이 URL에서 'nickname=' 부분을 수정하여 사용자 닉네임을 지정할 수 있습니다.")
 
+    def request_roulette(self, profile_index, nickname=None):
+        """룰렛 요청 (HTTP 스레드에서 호출 - 신호를 통해 메인 스레드에서 처리)"""
+        self.signals.request_received.emit(profile_index, nickname)
+
     def add_roulette_request(self, profile_index, nickname=None):
         """룰렛 요청을 큐에 추가하고 처리"""
         # 최대 큐 크기 제한
@@ -2389,8 +2395,8 @@ class RouletteHandler(BaseHTTPRequestHandler):
                 
                 if hasattr(self.server, 'app') and self.server.app:
                     profile_index = profile_number - 1
-                    # 룰렛 요청 추가 (닉네임 포함)
-                    self.server.app.add_roulette_request(profile_index, nickname)
+                    # 룰렛 요청 추가 (닉네임 포함) - 큐와 위젯은 메인 스레드에서만 다룸
+                    self.server.app.request_roulette(profile_index, nickname)
                 
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
@@ -2421,8 +2427,8 @@ class RouletteHandler(BaseHTTPRequestHandler):
                 
                 if hasattr(self.server, 'app') and self.server.app:
                     profile_index = profile_number - 1
-                    # 룰렛 요청 추가 (닉네임 포함)
-                    self.server.app.add_roulette_request(profile_index, nickname)
+                    # 룰렛 요청 추가 (닉네임 포함) - 큐와 위젯은 메인 스레드에서만 다룸
+                    self.server.app.request_roulette(profile_index, nickname)
                 
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
@@ -2447,7 +2453,8 @@ class RouletteHandler(BaseHTTPRequestHandler):
 
 def start_server(app):
     try:
-        server = HTTPServer(('127.0.0.1', 8080), RouletteHandler)
+        server = ThreadingHTTPServer(('127.0.0.1', 8080), RouletteHandler)
+        server.daemon_threads = True  # 느린 클라이언트가 다른 요청을 막지 않도록 요청마다 스레드 처리
         server.app = app  # 서버에 앱 참조 저장
         
         # 사용 가능한 URL 경로 표시
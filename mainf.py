@@ -1,291 +1,375 @@
 import sys
 import os
 import time
-import random
 import json
 import threading
-import requests
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs  # URL 쿼리 파라미터 처리용
+import queue
+import zlib
+from collections import OrderedDict, deque
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
                             QVBoxLayout, QHBoxLayout, QWidget, QFrame, QDialog,
                             QListWidget, QLineEdit, QFormLayout, QDoubleSpinBox,
                             QFileDialog, QMessageBox, QListWidgetItem, QTabWidget,
                             QGridLayout, QGroupBox, QSpinBox, QComboBox, QInputDialog,
-                            QFontComboBox, QColorDialog, QCheckBox, QTextEdit)
-from PyQt5.QtGui import QPixmap, QFont, QPalette, QBrush, QImage, QIcon, QColor
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QSize, QUrl
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent  # 소리 재생용 추가
-
-# mcrcon 라이브러리 가져오기 (설치 필요: pip install mcrcon)
-try:
-    from mcrcon import MCRcon
-except ImportError:
-    # MCRCON 라이브러리가 설치되지 않은 경우 대체 클래스 제공
-    class MCRcon:
-        def __init__(self, host, password, port=25575):
-            self.host = host
-            self.password = password
-            self.port = port
-        
-        def connect(self):
-            print(f"MCRCON 라이브러리가 설치되지 않았습니다. pip install mcrcon 명령으로 설치해주세요.")
-            print(f"MCRCON 연결 시도: {self.host}:{self.port}")
-        
-        def command(self, cmd):
-            print(f"MCRCON 명령어 실행 (라이브러리 없음): {cmd}")
-            return "MCRCON 라이브러리가 설치되지 않아 명령을 실행할 수 없습니다."
-        
-        def __enter__(self):
-            self.connect()
-            return self
-            
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            self.disconnect()
-        
-        def disconnect(self):
-            pass
-
-# 기본 폴더 설정
-CONFIG_FOLDER = "config"
-IMAGE_FOLDER = "images"
-SOUND_FOLDER = "sounds"  # 소리 파일 저장할 폴더 추가
-DEFAULT_CONFIG_FILE = os.path.join(CONFIG_FOLDER, "profile_1.json")
-DEFAULT_SOUND_URL = "https://cdn.dpvm.xyz/sound.mp3"  # 기본 소리 URL
-DEFAULT_SOUND_FILE = os.path.join(SOUND_FOLDER, "default_sound.mp3")  # 기본 소리 파일 경로
-DEFAULT_TICK_SOUND_URL = "https://docs.google.com/uc?export=download&id=15No95c9IjxJCbP_2xx6UKRY3uhNbyCPZ"  # 기본 틱 소리 URL (없으면 생성해야 함)
-DEFAULT_TICK_SOUND_FILE = os.path.join(SOUND_FOLDER, "tick.mp3")  # 기본 틱 소리 파일 경로
-DEFAULT_FINISH_SOUND_URL = "https://docs.google.com/uc?export=download&id=1UbFAUtkoUjj6L_rvMffuSq2B-N0p2nCH"  # 완료 소리 URL
-DEFAULT_FINISH_SOUND_FILE = os.path.join(SOUND_FOLDER, "finish.mp3")  # 완료 소리 파일 경로
+                            QFontComboBox, QColorDialog, QCheckBox, QTextEdit, QShortcut)
+from PyQt5.QtGui import (QPixmap, QFont, QPalette, QBrush, QImage, QIcon, QColor, QPainter, QPen,
+                         QFontMetrics, QKeySequence)
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QObject, QSize, QUrl, QElapsedTimer, QEasingCurve,
+                          QRectF, QPointF)
+# 요청 큐, 추첨, 프로필 저장, 부가 작업은 Qt 없이 동작하는 엔진에서 처리
+from roulette_engine import (RouletteEngine, Profile, RouletteItem, MCRCONSettings, WebhookSettings,
+                             SoundSettings, DisplaySettings, TurboSettings, get_mcrcon_class, start_server,
+                             CONFIG_FOLDER, IMAGE_FOLDER, SOUND_FOLDER,
+                             DEFAULT_SOUND_URL, DEFAULT_SOUND_FILE,
+                             DEFAULT_TICK_SOUND_URL, DEFAULT_TICK_SOUND_FILE,
+                             DEFAULT_FINISH_SOUND_URL, DEFAULT_FINISH_SOUND_FILE,
+                             SERVER_HOST, SERVER_PORT, MAX_QUEUE_SIZE,
+                             log, setup_logging, stop_logging)
+# requests, mcrcon, PIL, QtMultimedia는 시작 시간을 줄이기 위해 처음 사용할 때 불러옴
+
+# 시작 설정
+FAST_START = True  # 창과 HTTP 서버를 먼저 띄우고 이미지/소리 다운로드는 백그라운드에서 진행
+IMAGE_PACKAGE_URL = "https://docs.google.com/uc?export=download&id=1gMJXIwkvcS6BmEbjD9JppHD9dtw2R80S"  # 이미지 패키지(zip) URL
+ASSET_MANIFEST_FILE = "asset_manifest.json"  # 받은 이미지/소리 파일의 ETag와 CRC 기록 (이미지/소리 폴더 옆)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # 다운로드/압축 해제 시 한 번에 처리하는 크기
+IMAGE_EXTRACT_WORKERS = 4  # 이미지 패키지를 동시에 풀 스레드 수 (1이면 순서대로)
+
+# 프로필 저장 설정
+PROFILE_SAVE_DELAY_MS = 500  # 마지막 변경 후 저장까지 기다리는 시간 (연속 변경은 한 번에 저장)
+
+# 애니메이션 설정
+ANIMATION_FRAME_INTERVAL_MS = 16  # 프레임 타이머 간격 (약 60fps)
+ANIMATION_STEPS_PER_SECOND = 4  # 회전 시간 1초당 이동할 평균 칸 수
+ANIMATION_EASING_CURVE = QEasingCurve.OutCubic  # 점점 느려지는 회전 곡선
+INSTANT_SUMMARY_MAX_ENTRIES = 8  # 빠른 처리 결과 요약에 표시할 최대 요청 수
+
+# 이미지 캐시 설정
+PIXMAP_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 스케일된 이미지 캐시 메모리 한도 (64MB)
+
+# 룰렛 릴 설정
+REEL_TILE_MARGIN = 4  # 타일 테두리와 이미지 사이 여백
+REEL_TILE_SPACING = 6  # 타일 사이 간격 (이미지와 이름 사이 간격에도 사용)
+REEL_STRIP_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 미리 그려 둔 띠를 보관할 메모리 한도 (64MB, 최근 프로필부터 유지)
+REEL_CHUNK_MAX_PIXELS = 8192  # 띠 조각 하나의 최대 가로 픽셀 (QPainter는 32767픽셀 너머를 그리지 못함)
+
+# 프레임 시간 측정 설정
+FRAME_STATS_WINDOW = 600  # 오버레이 히스토그램에 사용할 최근 프레임 수 (60fps 기준 약 10초)
+FRAME_HISTOGRAM_BUCKETS_MS = (8, 16.7, 20, 25, 33.4, 50, 100)  # 프레임 간격 히스토그램 구간 상한 (밀리초)
+FRAME_STATS_FILE = os.path.join(CONFIG_FOLDER, "frame_stats.jsonl")  # 회전마다 프레임 통계를 JSON 한 줄로 기록
+FRAME_STATS_MAX_BYTES = 1024 * 1024  # 통계 파일이 이 크기를 넘으면 .1로 옮기고 새로 시작
+FRAME_OVERLAY_SHORTCUT = "F3"  # 프레임 통계 오버레이 표시/숨김 키
+FRAME_OVERLAY_REFRESH_MS = 250  # 오버레이 갱신 간격
+
+# 효과음 설정
+TICK_PLAYER_POOL_SIZE = 3  # 틱 소리가 겹쳐도 끊기지 않도록 미리 준비해 둘 플레이어 수
 
 # 폴더가 없으면 생성
 for folder in [CONFIG_FOLDER, IMAGE_FOLDER, SOUND_FOLDER]:
     if not os.path.exists(folder):
         os.makedirs(folder)
 
-# 룰렛 요청 정보를 저장하는 클래스
-class RouletteRequest:
-    """룰렛 요청 정보를 저장하는 클래스"""
-    def __init__(self, profile_index, nickname=None):
-        self.profile_index = profile_index
-        self.nickname = nickname  # None이면 닉네임 없음
-        self.timestamp = time.time()
-    
-    def __str__(self):
-        nickname_display = self.nickname if self.nickname else "익명"
-        return f"요청: 프로필 {self.profile_index+1}, 닉네임: {nickname_display}"
-
 # 신호 클래스 정의 (스레드 간 통신용)
 class RouletteSignals(QObject):
     start_roulette = pyqtSignal()
-    update_images = pyqtSignal(list)
-    finish_animation = pyqtSignal(int)
-    play_tick_sound = pyqtSignal()  # 틱 소리 재생 신호 추가
-
-# 룰렛 항목 클래스
-# RouletteItem 클래스에 key_press 속성 추가
-class RouletteItem:
-    def __init__(self, name="룰렛 항목", image_path="", command="", probability=25.0, 
-                 display_text="", webhook_url="", key_press=""):
-        self.name = name
-        self.image_path = image_path
-        self.command = command
-        self.probability = probability
-        self.display_text = display_text  # 텍스트 모드에서 표시할 텍스트
-        self.multiplier = "X1"  # 배율 기본값
-        self.webhook_url = webhook_url  # 개별 항목의 웹훅 URL
-        self.key_press = key_press  # 눌릴 키 (예: "a", "space", "enter" 등)
-    
-    def to_dict(self):
-        return {
-            'name': self.name,
-            'image_path': self.image_path,
-            'command': self.command,
-            'probability': self.probability,
-            'display_text': self.display_text,
-            'multiplier': getattr(self, 'multiplier', 'X1'),
-            'webhook_url': getattr(self, 'webhook_url', ''),
-            'key_press': getattr(self, 'key_press', '')  # 키 설정 저장
-        }
+    request_received = pyqtSignal(int, object, int, object)  # HTTP 스레드 → 메인 스레드 요청 전달 (프로필 인덱스, 닉네임, 횟수, 추적 ID)
+    profile_save_failed = pyqtSignal(str)  # 프로필 저장 스레드 → 메인 스레드 오류 전달
+    asset_progress = pyqtSignal(str)  # 다운로드 스레드 → 메인 스레드 진행 상황 전달
+    assets_ready = pyqtSignal()  # 이미지/소리 다운로드 완료
+
+# 이미지 캐시 클래스
+class PixmapCache:
+    """스케일된 QPixmap을 (경로, 수정 시간, 크기) 기준으로 보관하는 LRU 캐시
     
-    @staticmethod
-    def from_dict(data):
-        item = RouletteItem(
-            name=data.get('name', "룰렛 항목"),
-            image_path=data.get('image_path', ""),
-            command=data.get('command', ""),
-            probability=data.get('probability', 25.0),
-            display_text=data.get('display_text', ""),
-            webhook_url=data.get('webhook_url', ""),
-            key_press=data.get('key_press', "")  # 키 설정 로드
-        )
-        item.multiplier = data.get('multiplier', 'X1')
-        return item
-    
-# MCRCON 설정 클래스
-class MCRCONSettings:
-    def __init__(self, host="localhost", port=25575, password="", enabled=False):
-        self.host = host
-        self.port = port
-        self.password = password
-        self.enabled = enabled
-    
-    def to_dict(self):
-        return {
-            'host': self.host,
-            'port': self.port,
-            'password': self.password,
-            'enabled': self.enabled
-        }
+    파일이 수정되면 수정 시간이 바뀌므로 자동으로 새로 읽습니다. 전체 크기가
+    max_bytes를 넘으면 가장 오래 사용하지 않은 이미지부터 제거합니다.
+    메인(Qt) 스레드에서만 사용해야 합니다.
+    """
+    def __init__(self, max_bytes=PIXMAP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()  # 키 → (픽스맵, 바이트 수)
+        self.hits = 0
+        self.misses = 0
     
-    @staticmethod
-    def from_dict(data):
-        return MCRCONSettings(
-            host=data.get('host', 'localhost'),
-            port=data.get('port', 25575),
-            password=data.get('password', ''),
-            enabled=data.get('enabled', False)
-        )
-
-# 웹훅 설정 클래스
-class WebhookSettings:
-    def __init__(self, url="", username="룰렛 봇", avatar_url="", enabled=False):
-        self.url = url
-        self.username = username
-        self.avatar_url = avatar_url
-        self.enabled = enabled
+    def get(self, path, width, height):
+        """path의 이미지를 width x height 안에 맞게 스케일해서 반환 (파일이 없으면 None)"""
+        if not path:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        
+        key = (path, mtime, width, height)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        
+        self.misses += 1
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+        pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        size = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        
+        self._entries[key] = (pixmap, size)
+        self.total_bytes += size
+        self._evict()
+        return pixmap
     
-    def to_dict(self):
-        return {
-            'url': self.url,
-            'username': self.username,
-            'avatar_url': self.avatar_url,
-            'enabled': self.enabled
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+    
+    def _evict(self):
+        # 마지막으로 넣은 항목은 한도를 넘더라도 유지
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+
+# 모든 룰렛 표시 경로에서 공유하는 이미지 캐시
+pixmap_cache = PixmapCache()
+
+# 효과음 미리 불러오기 클래스
+class SoundBank:
+    """시작/틱/당첨 효과음을 미리 불러와 두고 바로 재생하는 클래스
+    
+    파일 확인과 로드는 load()에서 프로필 소리 설정이 바뀔 때 한 번만 합니다.
+    WAV 파일은 지연이 적은 QSoundEffect로, 그 외 형식은 미리 setMedia 해둔
+    QMediaPlayer로 재생합니다. 틱 소리는 여러 플레이어를 번갈아 사용합니다.
+    """
+    def __init__(self, tick_pool_size=TICK_PLAYER_POOL_SIZE):
+        self.tick_pool_size = tick_pool_size
+        self.paths = {}  # 종류('start', 'tick', 'finish') → 불러온 파일 경로 (없으면 None)
+        self._players = {}  # 종류 → 플레이어 리스트
+        self._next_player = {}  # 종류 → 다음에 사용할 플레이어 인덱스
+        self._keys = {}  # 종류 → 불러올 때 사용한 (경로, 볼륨, 플레이어 수)
+    
+    def load(self, sound_settings):
+        """소리 설정의 파일을 확인하고 미리 불러옴 (바뀐 항목만 다시 불러옴)"""
+        finish_path = sound_settings.finish_sound_path
+        if not os.path.exists(finish_path):
+            # 기본 당첨 소리로 대체
+            finish_path = DEFAULT_FINISH_SOUND_FILE
+        
+        sources = {
+            'start': (sound_settings.sound_path, 1),
+            'tick': (sound_settings.tick_sound_path, self.tick_pool_size),
+            'finish': (finish_path, 1),
         }
+        for kind, (path, pool_size) in sources.items():
+            if not path or not os.path.exists(path):
+                path = None
+            key = (path, sound_settings.volume, pool_size)
+            if self._keys.get(kind) == key:
+                continue
+            
+            self._release(kind)
+            self._keys[kind] = key
+            self.paths[kind] = path
+            if path is None:
+                log.warning("효과음 파일이 존재하지 않습니다 (%s): %s", kind, sources[kind][0])
+                continue
+            self._players[kind] = [self._create_player(path, sound_settings.volume)
+                                   for _ in range(pool_size)]
+            self._next_player[kind] = 0
+    
+    def play(self, kind):
+        """미리 불러온 효과음 재생 (불러온 파일이 없으면 False)"""
+        players = self._players.get(kind)
+        if not players:
+            return False
+        index = self._next_player[kind]
+        self._next_player[kind] = (index + 1) % len(players)
+        
+        from PyQt5.QtMultimedia import QSoundEffect
+        player = players[index]
+        if isinstance(player, QSoundEffect):
+            player.play()
+        else:
+            # 이미 불러온 미디어를 처음부터 다시 재생
+            player.setPosition(0)
+            player.play()
+        return True
+    
+    def _create_player(self, path, volume):
+        from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QSoundEffect  # 소리 재생용
+        if path.lower().endswith('.wav'):
+            effect = QSoundEffect()
+            effect.setSource(QUrl.fromLocalFile(os.path.abspath(path)))
+            effect.setVolume(volume / 100.0)
+            return effect
+        player = QMediaPlayer()
+        player.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(path))))
+        player.setVolume(volume)
+        return player
+    
+    def _release(self, kind):
+        for player in self._players.pop(kind, []):
+            player.stop()
+            player.deleteLater()
+        self.paths.pop(kind, None)
+
+# 프레임 시간 측정 클래스
+class FrameStats:
+    """회전 애니메이션의 프레임 시간 측정
+    
+    한 번의 회전 동안 프레임 간격, 타이머 호출부터 그리기 시작까지의 지연,
+    그리기 시간, 틱 소리 지연(프레임 시작부터 재생 호출 완료까지)을 기록합니다.
+    프레임 간격은 최근 FRAME_STATS_WINDOW개를 회전과 관계없이 보관해
+    오버레이의 히스토그램에 사용합니다. 메인(Qt) 스레드에서만 사용해야 합니다.
+    회전별 보고서 파일 기록은 submit_report()로 전용 스레드에 맡깁니다.
+    """
+    METRICS = ('interval', 'latency', 'paint', 'tick_lag')
+    
+    def __init__(self, window=FRAME_STATS_WINDOW, frame_budget_ms=ANIMATION_FRAME_INTERVAL_MS):
+        self.frame_budget_ms = frame_budget_ms
+        self.recent_intervals = deque(maxlen=window)  # 최근 프레임 간격 (밀리초)
+        self.recording = False
+        self._samples = {metric: [] for metric in self.METRICS}
+        self._spin_start = 0.0
+        self._last_frame = None
+        self._pending_frame = None  # 그리기를 기다리는 프레임의 시작 시각
+        self._paint_start = None
+        self._reports = None  # 파일 기록 스레드로 넘길 보고서 큐 (처음 기록할 때 시작)
+    
+    def begin_spin(self):
+        for samples in self._samples.values():
+            samples.clear()
+        self._spin_start = time.perf_counter()
+        self._last_frame = None
+        self._pending_frame = None
+        self.recording = True
+    
+    def frame(self):
+        """프레임 타이머 호출 시작 시 호출 (프레임 시작 시각 반환)"""
+        now = time.perf_counter()
+        if self.recording:
+            if self._last_frame is not None:
+                interval = (now - self._last_frame) * 1000.0
+                self._samples['interval'].append(interval)
+                self.recent_intervals.append(interval)
+            self._last_frame = now
+            self._pending_frame = now
+        return now
+    
+    def paint_started(self):
+        if self.recording:
+            now = time.perf_counter()
+            if self._pending_frame is not None:
+                self._samples['latency'].append((now - self._pending_frame) * 1000.0)
+                self._pending_frame = None
+            self._paint_start = now
+    
+    def paint_finished(self):
+        if self.recording and self._paint_start is not None:
+            self._samples['paint'].append((time.perf_counter() - self._paint_start) * 1000.0)
+            self._paint_start = None
+    
+    def tick_played(self, frame_start):
+        if self.recording:
+            self._samples['tick_lag'].append((time.perf_counter() - frame_start) * 1000.0)
+    
+    def dropped_frames(self, intervals):
+        """예정 간격의 1.5배를 넘은 프레임 수 (그 사이 빠진 프레임 수만큼 계산)"""
+        budget = self.frame_budget_ms
+        return sum(int(interval / budget + 0.5) - 1 for interval in intervals if interval > budget * 1.5)
+    
+    def histogram(self, intervals=None):
+        """프레임 간격 히스토그램 [(구간 상한 밀리초 또는 None, 프레임 수), ...]"""
+        intervals = self.recent_intervals if intervals is None else intervals
+        counts = [0] * (len(FRAME_HISTOGRAM_BUCKETS_MS) + 1)
+        for interval in intervals:
+            for i, bound in enumerate(FRAME_HISTOGRAM_BUCKETS_MS):
+                if interval <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return list(zip(FRAME_HISTOGRAM_BUCKETS_MS + (None,), counts))
     
     @staticmethod
-    def from_dict(data):
-        return WebhookSettings(
-            url=data.get('url', ''),
-            username=data.get('username', '룰렛 봇'),
-            avatar_url=data.get('avatar_url', ''),
-            enabled=data.get('enabled', False)
-        )
-
-# 소리 설정 클래스 - 결과 효과음 옵션 추가
-class SoundSettings:
-    def __init__(self, sound_path=DEFAULT_SOUND_FILE, enabled=True, volume=80, 
-                 tick_enabled=True, tick_sound_path=DEFAULT_TICK_SOUND_FILE,
-                 finish_sound_path=DEFAULT_FINISH_SOUND_FILE, finish_enabled=True):
-        self.sound_path = sound_path
-        self.enabled = enabled
-        self.volume = volume  # 0-100 범위의 볼륨
-        self.tick_enabled = tick_enabled  # 틱 소리 활성화 여부
-        self.tick_sound_path = tick_sound_path  # 틱 소리 파일 경로
-        self.finish_sound_path = finish_sound_path  # 결과 효과음 파일 경로
-        self.finish_enabled = finish_enabled  # 결과 효과음 활성화 여부
-    
-    def to_dict(self):
+    def summarize(samples):
+        """표본의 개수, 평균, p50/p95/p99, 최댓값 (밀리초)"""
+        if not samples:
+            return {'count': 0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
         return {
-            'sound_path': self.sound_path,
-            'enabled': self.enabled,
-            'volume': self.volume,
-            'tick_enabled': self.tick_enabled,
-            'tick_sound_path': self.tick_sound_path,
-            'finish_sound_path': self.finish_sound_path,
-            'finish_enabled': self.finish_enabled
+            'count': len(ordered),
+            'mean': round(sum(ordered) / len(ordered), 3),
+            'p50': round(ordered[int(last * 0.50)], 3),
+            'p95': round(ordered[int(last * 0.95)], 3),
+            'p99': round(ordered[int(last * 0.99)], 3),
+            'max': round(ordered[-1], 3)
         }
     
-    @staticmethod
-    def from_dict(data):
-        return SoundSettings(
-            sound_path=data.get('sound_path', DEFAULT_SOUND_FILE),
-            enabled=data.get('enabled', True),
-            volume=data.get('volume', 80),
-            tick_enabled=data.get('tick_enabled', True),
-            tick_sound_path=data.get('tick_sound_path', DEFAULT_TICK_SOUND_FILE),
-            finish_sound_path=data.get('finish_sound_path', DEFAULT_FINISH_SOUND_FILE),
-            finish_enabled=data.get('finish_enabled', True)
-        )
-
-# 폰트 및 표시 설정 클래스
-class DisplaySettings:
-    def __init__(self, font_family="Arial", font_size=12, text_color="#ffffff", 
-                 use_text_mode=False, title_font_size=16, fixed_slot_count=0):
-        self.font_family = font_family
-        self.font_size = font_size
-        self.text_color = text_color
-        self.use_text_mode = use_text_mode
-        self.title_font_size = title_font_size
-        self.fixed_slot_count = fixed_slot_count  # 0 = 자동, 그 외 = 고정 슬롯 수
-    
-    def to_dict(self):
-        return {
-            'font_family': self.font_family,
-            'font_size': self.font_size,
-            'text_color': self.text_color,
-            'use_text_mode': self.use_text_mode,
-            'title_font_size': self.title_font_size,
-            'fixed_slot_count': self.fixed_slot_count
+    def end_spin(self, **info):
+        """회전 측정을 끝내고 보고서(사전) 반환 (info는 보고서에 그대로 추가)"""
+        self.recording = False
+        duration = time.perf_counter() - self._spin_start
+        intervals = self._samples['interval']
+        report = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'duration_s': round(duration, 3),
+            'frames': len(intervals) + 1 if intervals else 0,
+            'fps': round(len(intervals) / duration, 1) if duration > 0 else 0.0,
+            'frame_budget_ms': self.frame_budget_ms,
+            'dropped_frames': self.dropped_frames(intervals),
+            'histogram': [[bound, count] for bound, count in self.histogram(intervals)],
         }
+        for metric, samples in self._samples.items():
+            report[metric + '_ms'] = self.summarize(samples)
+        report.update(info)
+        return report
+    
+    def submit_report(self, report):
+        """보고서 파일 기록을 전용 스레드에 맡김 (Qt 스레드는 파일 입출력을 기다리지 않음)"""
+        if self._reports is None:
+            self._reports = queue.SimpleQueue()
+            threading.Thread(target=self._write_reports, args=(self._reports,), daemon=True,
+                             name="frame-stats-writer").start()
+        self._reports.put(report)
     
     @staticmethod
-    def from_dict(data):
-        return DisplaySettings(
-            font_family=data.get('font_family', 'Arial'),
-            font_size=data.get('font_size', 12),
-            text_color=data.get('text_color', '#ffffff'),
-            use_text_mode=data.get('use_text_mode', False),
-            title_font_size=data.get('title_font_size', 16),
-            fixed_slot_count=data.get('fixed_slot_count', 0)
-        )
-
-# 프로필 클래스 - 소리 설정 추가
-class Profile:
-    def __init__(self, name="프로필 1", items=None, webhook=None, mcrcon=None, display=None, sound=None):
-        self.name = name
-        self.items = items if items else []
-        self.webhook = webhook if webhook else WebhookSettings()
-        self.mcrcon = mcrcon if mcrcon else MCRCONSettings()
-        self.display = display if display else DisplaySettings()
-        self.sound = sound if sound else SoundSettings()  # 소리 설정 추가
-        self.rotation_time = 5.0  # 기본 회전 시간
-    
-    def to_dict(self):
-        return {
-            'name': self.name,
-            'items': [item.to_dict() for item in self.items],
-            'webhook': self.webhook.to_dict(),
-            'mcrcon': self.mcrcon.to_dict(),
-            'display': self.display.to_dict(),
-            'sound': self.sound.to_dict(),  # 소리 설정 저장
-            'rotation_time': self.rotation_time
-        }
+    def _write_reports(reports):
+        while True:
+            FrameStats.write_report(reports.get())
     
     @staticmethod
-    def from_dict(data):
-        profile = Profile(
-            name=data.get('name', "프로필 1")
-        )
-        profile.rotation_time = data.get('rotation_time', 5.0)
-        
-        if 'items' in data:
-            profile.items = [RouletteItem.from_dict(item_data) for item_data in data['items']]
-        
-        if 'webhook' in data:
-            profile.webhook = WebhookSettings.from_dict(data['webhook'])
-        
-        if 'mcrcon' in data:
-            profile.mcrcon = MCRCONSettings.from_dict(data['mcrcon'])
-            
-        if 'display' in data:
-            profile.display = DisplaySettings.from_dict(data['display'])
-            
-        # 소리 설정 로드
-        if 'sound' in data:
-            profile.sound = SoundSettings.from_dict(data['sound'])
-            
-        return profile
+    def write_report(report, path=FRAME_STATS_FILE, max_bytes=FRAME_STATS_MAX_BYTES):
+        """보고서를 JSON 한 줄로 추가 (파일이 max_bytes를 넘으면 .1로 옮기고 새로 시작)"""
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > max_bytes:
+                os.replace(path, path + ".1")
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+        except OSError as e:
+            log.error("프레임 통계 저장 오류: %s", e)
+    
+    def overlay_text(self):
+        """오버레이에 표시할 최근 프레임 간격 요약과 히스토그램"""
+        intervals = list(self.recent_intervals)
+        summary = self.summarize(intervals)
+        if not summary['count']:
+            return "프레임 통계: 아직 회전 기록이 없습니다"
+        lines = [
+            f"최근 {summary['count']}프레임  평균 {summary['mean']:.1f}ms  "
+            f"p95 {summary['p95']:.1f}ms  최대 {summary['max']:.1f}ms",
+            f"끊김 {self.dropped_frames(intervals)}프레임 (기준 {self.frame_budget_ms}ms)",
+        ]
+        for metric, label in (('latency', "그리기 지연"), ('paint', "그리기 시간"), ('tick_lag', "틱 소리 지연")):
+            stats = self.summarize(self._samples[metric])
+            if stats['count']:
+                lines.append(f"{label}: 평균 {stats['mean']:.2f}ms  p95 {stats['p95']:.2f}ms")
+        histogram = self.histogram(intervals)
+        peak = max(count for _, count in histogram) or 1
+        for bound, count in histogram:
+            label = f"<={bound:g}ms" if bound is not None else "초과"
+            lines.append(f"{label:>8} {'#' * round(count * 20 / peak):<20} {count}")
+        return "\n".join(lines)
 
 # 룰렛 항목 편집 대화상자
 class ItemEditDialog(QDialog):
@@ -345,12 +429,7 @@ class ItemEditDialog(QDialog):
         self.multiplier_spin.setPrefix("X")
         
         # 현재 배율 값 설정
-        try:
-            current_value = int(self.item.multiplier.replace('X', ''))
-        except (ValueError, AttributeError):
-            current_value = 1
-        
-        self.multiplier_spin.setValue(current_value)
+        self.multiplier_spin.setValue(self.item.multiplier)
         self.multiplier_spin.setToolTip("MCRCON 명령어와 웹훅 알림의 반복 횟수를 설정합니다.")
         form_layout.addRow("배율(반복 횟수):", self.multiplier_spin)
         
@@ -392,9 +471,9 @@ class ItemEditDialog(QDialog):
             self.update_preview()
     
     def update_preview(self):
-        if os.path.exists(self.image_path_edit.text()):
-            pixmap = QPixmap(self.image_path_edit.text())
-            self.preview.setPixmap(pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = pixmap_cache.get(self.image_path_edit.text(), 150, 150)
+        if pixmap is not None:
+            self.preview.setPixmap(pixmap)
         else:
             self.preview.setText("이미지 없음")
     
@@ -404,7 +483,7 @@ class ItemEditDialog(QDialog):
         self.item.command = self.command_edit.text()
         self.item.probability = self.probability_spin.value()
         self.item.display_text = self.display_text_edit.toPlainText()
-        self.item.multiplier = f"X{self.multiplier_spin.value()}"
+        self.item.multiplier = self.multiplier_spin.value()
         self.item.webhook_url = self.webhook_edit.text()
         self.item.key_press = self.key_press_edit.text()  # 키 입력 저장
         super().accept()
@@ -443,6 +522,12 @@ class WebhookSettingsTab(QWidget):
         self.webhook_avatar = QLineEdit(self.webhook_settings.avatar_url)
         form_layout.addRow("아바타 URL:", self.webhook_avatar)
         
+        # 반복 알림 합치기
+        self.coalesce_check = QCheckBox("반복 알림을 하나의 메시지로 합치기")
+        self.coalesce_check.setChecked(self.webhook_settings.coalesce)
+        self.coalesce_check.setToolTip("배율만큼 메시지를 반복 전송하지 않고, 반복 횟수를 표시한 메시지 하나만 전송합니다.")
+        form_layout.addRow("", self.coalesce_check)
+        
         layout.addLayout(form_layout)
         layout.addStretch()
     
@@ -462,6 +547,7 @@ class WebhookSettingsTab(QWidget):
             if self.webhook_avatar.text():
                 payload["avatar_url"] = self.webhook_avatar.text()
             
+            import requests
             response = requests.post(url, json=payload, timeout=3)
             
             if response.status_code == 204:  # Discord 웹훅 성공 응답코드
@@ -476,6 +562,7 @@ class WebhookSettingsTab(QWidget):
         self.webhook_settings.username = self.webhook_username.text()
         self.webhook_settings.avatar_url = self.webhook_avatar.text()
         self.webhook_settings.enabled = self.enabled_check.isChecked()
+        self.webhook_settings.coalesce = self.coalesce_check.isChecked()
         return self.webhook_settings
 
 # MCRCON 설정 탭
@@ -507,6 +594,15 @@ class MCRCONSettingsTab(QWidget):
         self.password_edit.setEchoMode(QLineEdit.Password)
         form_layout.addRow("RCON 비밀번호:", self.password_edit)
         
+        # 초당 명령어 수 제한
+        self.rate_limit_spin = QDoubleSpinBox()
+        self.rate_limit_spin.setRange(0, 1000)
+        self.rate_limit_spin.setValue(self.mcrcon_settings.rate_limit)
+        self.rate_limit_spin.setSuffix("회/초")
+        self.rate_limit_spin.setSpecialValueText("제한 없음")  # 0일 때는 "제한 없음"으로 표시
+        self.rate_limit_spin.setToolTip("배율만큼 반복되는 명령어를 서버에 보내는 최대 속도입니다.")
+        form_layout.addRow("명령어 속도 제한:", self.rate_limit_spin)
+        
         # MCRCON 테스트 버튼
         test_layout = QHBoxLayout()
         self.test_button = QPushButton("RCON 연결 테스트")
@@ -535,7 +631,7 @@ class MCRCONSettingsTab(QWidget):
             return
         
         try:
-            with MCRcon(host, password, port) as mcr:
+            with get_mcrcon_class()(host, password, port) as mcr:
                 response = mcr.command("list")  # 간단한 명령어로 테스트
                 QMessageBox.information(self, "MCRCON 테스트", f"RCON 연결 성공!\n응답: {response}")
         except Exception as e:
@@ -546,6 +642,7 @@ class MCRCONSettingsTab(QWidget):
         self.mcrcon_settings.port = self.port_spin.value()
         self.mcrcon_settings.password = self.password_edit.text()
         self.mcrcon_settings.enabled = self.enabled_check.isChecked()
+        self.mcrcon_settings.rate_limit = self.rate_limit_spin.value()
         return self.mcrcon_settings
 
 # 소리 설정 탭 - 틱 소리 설정 추가
@@ -651,6 +748,7 @@ class SoundSettingsTab(QWidget):
         layout.addLayout(test_layout)
         
         # 소리 플레이어 초기화
+        from PyQt5.QtMultimedia import QMediaPlayer  # 소리 모듈은 설정 창을 열 때 불러옴
         self.sound_player = QMediaPlayer()
         self.tick_player = QMediaPlayer()
         
@@ -683,6 +781,7 @@ class SoundSettingsTab(QWidget):
             self.sound_player.stop()
             
             # 새 소리 파일 로드
+            from PyQt5.QtMultimedia import QMediaContent
             self.sound_player.setMedia(QMediaContent(QUrl.fromLocalFile(sound_path)))
             
             # 볼륨 설정
@@ -692,57 +791,51 @@ class SoundSettingsTab(QWidget):
             # 소리 재생
             self.sound_player.play()
             
-            print(f"당첨 효과음 테스트: {sound_path} (볼륨: {volume}%)")
+            log.debug("당첨 효과음 테스트: %s (볼륨: %s%%)", sound_path, volume)
             
         except Exception as e:
             QMessageBox.critical(self, "당첨 효과음 테스트", f"소리 재생 중 오류 발생: {e}")
     def download_default_sound(self):
         """기본 소리 파일을 다운로드"""
         try:
-            print(f"기본 소리 파일 다운로드 중: {DEFAULT_SOUND_URL}")
-            response = requests.get(DEFAULT_SOUND_URL, stream=True)
-            
-            if response.status_code == 200:
-                with open(DEFAULT_SOUND_FILE, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                print(f"기본 소리 파일이 다운로드되었습니다: {DEFAULT_SOUND_FILE}")
+            log.info("기본 소리 파일 다운로드 중: %s", DEFAULT_SOUND_URL)
+            # 이미 받은 파일이면 조건부 요청으로 바뀐 경우에만 다시 받음
+            status = download_file(DEFAULT_SOUND_URL, DEFAULT_SOUND_FILE)
+            
+            if status in (200, 304):
+                log.info("기본 소리 파일이 다운로드되었습니다: %s", DEFAULT_SOUND_FILE)
                 return True
             else:
-                print(f"소리 파일 다운로드 실패: {response.status_code}")
+                log.warning("소리 파일 다운로드 실패: %s", status)
                 self.create_default_tick_sound()
                 return False
                 
         except Exception as e:
-            print(f"소리 파일 다운로드 오류: {e}")
+            log.error("소리 파일 다운로드 오류: %s", e)
             return False
     
     def download_tick_sound(self):
         """기본 틱 소리 파일을 다운로드 또는 생성"""
         try:
             # 기본 틱 소리가 없으면 생성 시도
-            print(f"기본 틱 소리 파일 다운로드 중: {DEFAULT_TICK_SOUND_URL}")
+            log.info("기본 틱 소리 파일 다운로드 중: %s", DEFAULT_TICK_SOUND_URL)
             
             try:
-                response = requests.get(DEFAULT_TICK_SOUND_URL, stream=True)
+                # 이미 받은 파일이면 조건부 요청으로 바뀐 경우에만 다시 받음
+                status = download_file(DEFAULT_TICK_SOUND_URL, DEFAULT_TICK_SOUND_FILE)
                 
-                if response.status_code == 200:
-                    with open(DEFAULT_TICK_SOUND_FILE, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    print(f"기본 틱 소리 파일이 다운로드되었습니다: {DEFAULT_TICK_SOUND_FILE}")
+                if status in (200, 304):
+                    log.info("기본 틱 소리 파일이 다운로드되었습니다: %s", DEFAULT_TICK_SOUND_FILE)
                     return True
                 else:
-                    print("틱 소리 다운로드 실패, 기본 파일 생성을 시도합니다.")
+                    log.warning("틱 소리 다운로드 실패, 기본 파일 생성을 시도합니다.")
                     return self.create_default_tick_sound()
             except Exception as e:
-                print(f"틱 소리 다운로드 오류: {e}")
+                log.error("틱 소리 다운로드 오류: %s", e)
                 return self.create_default_tick_sound()
                 
         except Exception as e:
-            print(f"틱 소리 준비 오류: {e}")
+            log.error("틱 소리 준비 오류: %s", e)
             return False
     
     def create_default_tick_sound(self):
@@ -753,16 +846,16 @@ class SoundSettingsTab(QWidget):
             if os.path.exists(DEFAULT_SOUND_FILE):
                 import shutil
                 shutil.copy2(DEFAULT_SOUND_FILE, DEFAULT_TICK_SOUND_FILE)
-                print(f"기본 소리 파일을 틱 소리로 복사했습니다: {DEFAULT_TICK_SOUND_FILE}")
+                log.info("기본 소리 파일을 틱 소리로 복사했습니다: %s", DEFAULT_TICK_SOUND_FILE)
                 return True
                 
             # 기본 틱 소리를 생성하는 로직 (파이썬 wave, numpy 등 라이브러리 필요)
             # 생략 - 적절한 라이브러리로 구현 필요
                 
-            print("틱 소리 파일 생성 실패")
+            log.warning("틱 소리 파일 생성 실패")
             return False
         except Exception as e:
-            print(f"틱 소리 파일 생성 오류: {e}")
+            log.error("틱 소리 파일 생성 오류: %s", e)
             return False
     
     def browse_sound(self):
@@ -793,6 +886,7 @@ class SoundSettingsTab(QWidget):
             self.sound_player.stop()
             
             # 새 소리 파일 로드
+            from PyQt5.QtMultimedia import QMediaContent
             self.sound_player.setMedia(QMediaContent(QUrl.fromLocalFile(sound_path)))
             
             # 볼륨 설정 (0-100 범위를 0.0-1.0으로 변환)
@@ -802,7 +896,7 @@ class SoundSettingsTab(QWidget):
             # 소리 재생
             self.sound_player.play()
             
-            print(f"소리 테스트: {sound_path} (볼륨: {volume}%)")
+            log.debug("소리 테스트: %s (볼륨: %s%%)", sound_path, volume)
             
         except Exception as e:
             QMessageBox.critical(self, "소리 테스트", f"소리 재생 중 오류 발생: {e}")
@@ -819,6 +913,7 @@ class SoundSettingsTab(QWidget):
             self.tick_player.stop()
             
             # 새 소리 파일 로드
+            from PyQt5.QtMultimedia import QMediaContent
             self.tick_player.setMedia(QMediaContent(QUrl.fromLocalFile(sound_path)))
             
             # 볼륨 설정 (0-100 범위를 0.0-1.0으로 변환)
@@ -828,7 +923,7 @@ class SoundSettingsTab(QWidget):
             # 소리 재생
             self.tick_player.play()
             
-            print(f"틱 소리 테스트: {sound_path} (볼륨: {volume}%)")
+            log.debug("틱 소리 테스트: %s (볼륨: %s%%)", sound_path, volume)
             
         except Exception as e:
             QMessageBox.critical(self, "틱 소리 테스트", f"소리 재생 중 오류 발생: {e}")
@@ -988,6 +1083,56 @@ class DisplaySettingsTab(QWidget):
         # text_color는 choose_color 메서드에서 이미 업데이트됨
         return self.display_settings
 
+# 빠른 진행 설정 탭
+class TurboSettingsTab(QWidget):
+    def __init__(self, turbo_settings=None):
+        super().__init__()
+        self.turbo_settings = turbo_settings or TurboSettings()
+        
+        layout = QVBoxLayout(self)
+        form_layout = QFormLayout()
+        
+        # 사용 여부
+        self.enabled_check = QCheckBox("대기 요청이 많으면 회전을 빠르게")
+        self.enabled_check.setChecked(self.turbo_settings.enabled)
+        form_layout.addRow("", self.enabled_check)
+        
+        # 배율 곡선
+        self.curve_edit = QLineEdit(self.turbo_settings.curve_text)
+        self.curve_edit.setToolTip("'대기 요청 수:배율' 형식을 쉼표로 구분합니다. (예: 0:1, 2:0.7, 5:0.4, 10:0.2)\n"
+                                   "회전 시간과 다음 요청까지의 대기 시간에 배율을 곱하며, 점 사이는 직선으로 이어집니다.")
+        form_layout.addRow("배율 곡선:", self.curve_edit)
+        
+        # 최소 회전 시간
+        self.min_rotation_spin = QDoubleSpinBox()
+        self.min_rotation_spin.setRange(0.1, 10)
+        self.min_rotation_spin.setSingleStep(0.1)
+        self.min_rotation_spin.setValue(self.turbo_settings.min_rotation_time)
+        self.min_rotation_spin.setSuffix("초")
+        form_layout.addRow("최소 회전 시간:", self.min_rotation_spin)
+        
+        # 즉시 처리 기준
+        self.instant_spin = QSpinBox()
+        self.instant_spin.setRange(0, MAX_QUEUE_SIZE)
+        self.instant_spin.setValue(self.turbo_settings.instant_threshold)
+        self.instant_spin.setSpecialValueText("사용 안 함")
+        self.instant_spin.setSuffix("개 이상")
+        self.instant_spin.setToolTip("대기 요청이 이 수 이상이면 애니메이션 없이 바로 추첨하고 결과를 요약해서 표시합니다.")
+        form_layout.addRow("즉시 처리 기준:", self.instant_spin)
+        
+        layout.addLayout(form_layout)
+        layout.addStretch()
+    
+    def save_settings(self):
+        self.turbo_settings.enabled = self.enabled_check.isChecked()
+        try:
+            self.turbo_settings.curve = TurboSettings.parse_curve(self.curve_edit.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "빠른 진행 설정", f"배율 곡선 형식이 올바르지 않아 이전 값을 유지합니다.\n{e}")
+        self.turbo_settings.min_rotation_time = self.min_rotation_spin.value()
+        self.turbo_settings.instant_threshold = self.instant_spin.value()
+        return self.turbo_settings
+
 # 설정 대화상자
 class SettingsDialog(QDialog):
     def __init__(self, parent=None, profile=None):
@@ -1052,6 +1197,9 @@ class SettingsDialog(QDialog):
         # 소리 설정 탭 추가
         sound_tab = SoundSettingsTab(self.profile.sound)
         
+        # 빠른 진행 설정 탭
+        turbo_tab = TurboSettingsTab(self.profile.turbo)
+        
         # 탭 추가
         tabs.addTab(items_tab, "룰렛 항목")
         tabs.addTab(general_tab, "기본 설정")
@@ -1059,6 +1207,7 @@ class SettingsDialog(QDialog):
         tabs.addTab(mcrcon_tab, "MCRCON 설정")
         tabs.addTab(display_tab, "표시 설정")
         tabs.addTab(sound_tab, "소리 설정")  # 소리 탭 추가
+        tabs.addTab(turbo_tab, "빠른 진행")
         
         main_layout.addWidget(tabs)
         
@@ -1086,14 +1235,17 @@ class SettingsDialog(QDialog):
         self.mcrcon_tab = mcrcon_tab
         self.display_tab = display_tab
         self.sound_tab = sound_tab  # 소리 탭 참조 저장
+        self.turbo_tab = turbo_tab
     
     def update_items_list(self):
+        # 목록이 갱신되는 모든 경우(추가/편집/삭제/정규화)는 항목 또는 확률 변경이므로 캐시 무효화
+        self.profile.invalidate_sampler()
         self.items_list.clear()
         for item in self.profile.items:
             list_item = QListWidgetItem(f"{item.name} ({item.probability}%)")
-            if os.path.exists(item.image_path):
-                icon = QIcon(item.image_path)
-                list_item.setIcon(icon)
+            pixmap = pixmap_cache.get(item.image_path, 32, 32)
+            if pixmap is not None:
+                list_item.setIcon(QIcon(pixmap))
             self.items_list.addItem(list_item)
     
     def add_item(self):
@@ -1143,8 +1295,222 @@ class SettingsDialog(QDialog):
         self.profile.mcrcon = self.mcrcon_tab.save_settings()
         self.profile.display = self.display_tab.save_settings()
         self.profile.sound = self.sound_tab.save_settings()  # 소리 설정 저장
+        self.profile.turbo = self.turbo_tab.save_settings()
+        self.profile.invalidate_sampler()
         super().accept()
 
+# 룰렛 릴 위젯 (미리 그려 둔 띠에서 보이는 부분만 복사)
+class RouletteReel(QWidget):
+    """항목 타일(이미지, 이름, 배율)을 가로 띠에 미리 그려 두고, 매 프레임에는
+    보이는 구간만 복사해서 그리는 룰렛 릴
+    
+    띠는 REEL_CHUNK_MAX_PIXELS보다 좁은 조각 여러 개로 나눠 그리므로 항목이
+    수백 개여도 모든 타일이 그려집니다. 띠는 항목이나 표시 설정이 바뀔 때만 다시
+    그리며, 최근 프로필의 띠를 REEL_STRIP_CACHE_MAX_BYTES까지 보관합니다.
+    offset은 소수도 가능하며 (칸 사이 위치), 가운데 칸에는 항목
+    offset + 항목 수 // 2가 표시됩니다.
+    """
+    IDLE, SPINNING, RESULT = range(3)
+    
+    TILE_COLOR = QColor(50, 50, 50, 200)
+    TILE_BORDER_COLOR = QColor("#00AAFF")
+    IMAGE_COLOR = QColor(60, 60, 60, 200)
+    IMAGE_BORDER_COLOR = QColor("#888888")
+    MULTIPLIER_COLOR = QColor("#FF6B6B")
+    SPIN_BORDER_COLOR = QColor("#00aaff")
+    RESULT_COLOR = QColor(100, 150, 100, 110)
+    RESULT_BORDER_COLOR = QColor("gold")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+        self._strips = OrderedDict()  # 띠 키 → (조각 픽스맵 리스트, 조각당 타일 수, 바이트 수)
+        self._strip_bytes = 0
+        self._strip = None
+        self._item_count = 0
+        self.slot_count = 0
+        self.pitch = 0  # 칸 하나의 가로 간격 (타일 + 여백)
+        self.tile_width = 0
+        self.tile_height = 0
+        self.offset = 0.0
+        self.state = self.IDLE
+        self.frame_stats = None  # 그리기 시간을 기록할 FrameStats (없으면 측정 안 함)
+    
+    def set_items(self, items, slot_count, item_width, item_height, display,
+                  text_font, name_font, title_font):
+        """표시할 항목과 칸 크기 지정 (같은 띠가 캐시에 있으면 다시 그리지 않음)"""
+        key = (tuple((id(item), item.name, item.display_text, item.image_path, item.multiplier,
+                      self._image_mtime(item.image_path)) for item in items),
+               item_width, item_height, display.use_text_mode, display.text_color,
+               text_font.key(), name_font.key(), title_font.key(), self.devicePixelRatioF())
+        
+        name_height = QFontMetrics(name_font).lineSpacing() * 2  # 이름은 최대 두 줄
+        title_height = QFontMetrics(title_font).height()
+        self.tile_width = item_width + REEL_TILE_MARGIN * 2
+        self.tile_height = (REEL_TILE_MARGIN * 2 + item_height + name_height + title_height
+                            + REEL_TILE_SPACING)
+        self.pitch = self.tile_width + REEL_TILE_SPACING
+        self.slot_count = slot_count
+        self._item_count = len(items)
+        self.setFixedSize(self.pitch * slot_count, self.tile_height)
+        
+        cached = self._strips.get(key)
+        if cached is None:
+            cached = self._render_strip(items, item_width, item_height, name_height, title_height,
+                                        display, text_font, name_font, title_font)
+            self._strips[key] = cached
+            self._strip_bytes += cached[2]
+            # 지금 띠는 한도를 넘더라도 유지
+            while self._strip_bytes > REEL_STRIP_CACHE_MAX_BYTES and len(self._strips) > 1:
+                _, (_, _, size) = self._strips.popitem(last=False)
+                self._strip_bytes -= size
+        else:
+            self._strips.move_to_end(key)
+        self._strip = cached
+        self.offset = 0.0
+        self.state = self.IDLE
+        self.update()
+    
+    def set_offset(self, offset):
+        self.offset = offset
+        self.update()
+    
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.update()
+    
+    def clear_cache(self):
+        self._strips.clear()
+        self._strip_bytes = 0
+    
+    @staticmethod
+    def _image_mtime(path):
+        # 이미지가 새로 받아지거나 바뀌면 띠를 다시 그리도록 키에 포함
+        try:
+            return os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            return None
+    
+    def _render_strip(self, items, item_width, item_height, name_height, title_height,
+                      display, text_font, name_font, title_font):
+        """모든 항목 타일을 조각 띠들에 그림 (조각 경계는 항상 칸 경계)"""
+        ratio = self.devicePixelRatioF()
+        chunk_tiles = max(1, int(REEL_CHUNK_MAX_PIXELS // (self.pitch * ratio)))
+        chunks = []
+        size = 0
+        for start in range(0, len(items), chunk_tiles):
+            chunk = self._render_chunk(items[start:start + chunk_tiles], ratio, item_width, item_height,
+                                       name_height, title_height, display, text_font, name_font, title_font)
+            chunks.append(chunk)
+            size += chunk.width() * chunk.height() * max(chunk.depth(), 8) // 8
+        return chunks, chunk_tiles, size
+    
+    def _render_chunk(self, items, ratio, item_width, item_height, name_height, title_height,
+                      display, text_font, name_font, title_font):
+        """items의 타일을 가로 띠 조각 하나에 그림"""
+        chunk = QPixmap(int(self.pitch * len(items) * ratio), int(self.tile_height * ratio))
+        chunk.setDevicePixelRatio(ratio)
+        chunk.fill(Qt.transparent)
+        
+        text_color = QColor(display.text_color)
+        painter = QPainter(chunk)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        try:
+            for i, item in enumerate(items):
+                left = i * self.pitch + REEL_TILE_SPACING / 2
+                
+                # 타일 배경
+                painter.setPen(QPen(self.TILE_BORDER_COLOR, 1))
+                painter.setBrush(self.TILE_COLOR)
+                painter.drawRect(QRectF(left + 0.5, 0.5, self.tile_width - 1, self.tile_height - 1))
+                
+                # 이미지 또는 텍스트
+                image_rect = QRectF(left + REEL_TILE_MARGIN, REEL_TILE_MARGIN, item_width, item_height)
+                pixmap = None if display.use_text_mode else pixmap_cache.get(item.image_path, item_width, item_height)
+                if pixmap is not None:
+                    painter.setPen(QPen(self.IMAGE_BORDER_COLOR, 1))
+                    painter.setBrush(self.IMAGE_COLOR)
+                    painter.drawRect(image_rect)
+                    painter.drawPixmap(QPointF(image_rect.center().x() - pixmap.width() / 2,
+                                               image_rect.center().y() - pixmap.height() / 2), pixmap)
+                else:
+                    # 텍스트 모드이거나 이미지가 없으면 텍스트로
+                    painter.setPen(QPen(self.IMAGE_BORDER_COLOR, 1))
+                    painter.setBrush(self.IMAGE_COLOR)
+                    painter.drawRect(image_rect)
+                    painter.setPen(text_color)
+                    painter.setFont(text_font)
+                    text = (item.display_text or item.name) if display.use_text_mode else item.name
+                    painter.drawText(image_rect, Qt.AlignCenter | Qt.TextWordWrap, text)
+                
+                # 이름
+                top = REEL_TILE_MARGIN + item_height + REEL_TILE_SPACING / 2
+                painter.setPen(text_color)
+                painter.setFont(name_font)
+                painter.drawText(QRectF(left, top, self.tile_width, name_height),
+                                 Qt.AlignCenter | Qt.TextWordWrap, item.name)
+                
+                # 배율
+                painter.setPen(self.MULTIPLIER_COLOR)
+                painter.setFont(title_font)
+                painter.drawText(QRectF(left, top + name_height, self.tile_width, title_height),
+                                 Qt.AlignCenter, item.multiplier_text)
+        finally:
+            painter.end()
+        return chunk
+    
+    def paintEvent(self, event):
+        if self._strip is None or not self._item_count:
+            return
+        stats = self.frame_stats
+        if stats is not None:
+            stats.paint_started()
+        painter = QPainter(self)
+        try:
+            # 왼쪽 끝 칸에 표시할 위치 (가운데 칸에 offset + 항목 수 // 2가 오도록)
+            first = self.offset + self._item_count // 2 - self.slot_count // 2
+            chunks, chunk_tiles, _ = self._strip
+            chunk_width = self.pitch * chunk_tiles
+            ratio = chunks[0].devicePixelRatio()
+            source_x = (first * self.pitch) % (self.pitch * self._item_count)
+            width = self.width()
+            x = 0.0
+            # 조각 끝에 닿으면 다음 조각에서, 띠 끝에 닿으면 처음부터 이어서 복사
+            while x < width:
+                index = min(int(source_x // chunk_width), len(chunks) - 1)
+                chunk = chunks[index]
+                local_x = source_x - index * chunk_width
+                span = min(chunk.width() / ratio - local_x, width - x)
+                if span <= 0:
+                    # 부동소수점 오차로 조각 끝에 걸린 경우
+                    source_x = ((index + 1) * chunk_width) % (self.pitch * self._item_count)
+                    continue
+                painter.drawPixmap(QRectF(x, 0, span, self.tile_height), chunk,
+                                   QRectF(local_x * ratio, 0, span * ratio, self.tile_height * ratio))
+                x += span
+                source_x = (source_x + span) % (self.pitch * self._item_count)
+            
+            if self.state == self.SPINNING:
+                # 회전 중에는 보이는 타일 테두리를 강조
+                painter.setPen(QPen(self.SPIN_BORDER_COLOR, 2))
+                painter.setBrush(Qt.NoBrush)
+                shift = (first % 1) * self.pitch
+                for i in range(self.slot_count + 1):
+                    left = i * self.pitch - shift + REEL_TILE_SPACING / 2
+                    painter.drawRect(QRectF(left + 1, 1, self.tile_width - 2, self.tile_height - 2))
+            elif self.state == self.RESULT:
+                # 가운데 칸(당첨 항목) 강조
+                left = (self.slot_count // 2) * self.pitch + REEL_TILE_SPACING / 2
+                painter.setPen(QPen(self.RESULT_BORDER_COLOR, 3))
+                painter.setBrush(self.RESULT_COLOR)
+                painter.drawRect(QRectF(left + 1.5, 1.5, self.tile_width - 3, self.tile_height - 3))
+        finally:
+            painter.end()
+            if stats is not None:
+                stats.paint_finished()
+
 # 메인 애플리케이션 클래스
 class RouletteApp(QMainWindow):
     def __init__(self):
@@ -1168,26 +1534,29 @@ class RouletteApp(QMainWindow):
         # 숨김 타이머 변수 추가
         self.hide_timer = None  # 요소 숨기기 타이머
         
-        # 소리 플레이어 초기화
-        self.sound_player = QMediaPlayer()
-        self.tick_player = QMediaPlayer()
-        self.finish_player = QMediaPlayer()  # 완료 소리 재생용 플레이어 추가
-        
-        # 프로필 관리
-        self.profiles = self.load_profiles()
-        self.current_profile_index = 0  # 현재 사용 중인 프로필 인덱스
-        self.current_profile = self.profiles[self.current_profile_index] if self.profiles else Profile()
-        self.selected_items = []  # 현재 표시 중인 아이템들
-        
-        # 요청 큐 초기화
-        self.request_queue = []  # 대기 중인 룰렛 요청을 저장할 큐
+        # 효과음 미리 불러오기 (프로필 소리 설정이 바뀔 때 다시 불러옴)
+        self.sound_bank = SoundBank()
+        self.sounds_loaded = False  # 창을 띄운 뒤 처음 불러오기 전까지는 QtMultimedia를 불러오지 않음
         
         # 신호 객체 초기화
         self.signals = RouletteSignals()
         self.signals.start_roulette.connect(self.spin_roulette)
-        self.signals.update_images.connect(self.update_roulette_display)
-        self.signals.finish_animation.connect(self.finish_roulette)
-        self.signals.play_tick_sound.connect(self.play_tick_sound)  # 틱 소리 신호 연결
+        self.signals.request_received.connect(self.add_roulette_request)  # HTTP 요청은 메인 스레드에서 처리
+        self.signals.profile_save_failed.connect(self.on_profile_save_failed)
+        self.signals.asset_progress.connect(self.show_asset_progress)
+        self.signals.assets_ready.connect(self.on_assets_ready)
+        
+        # 룰렛 엔진 (프로필, 요청 큐, 추첨, 부가 작업) - 창은 엔진 이벤트를 받아 화면만 갱신
+        self.engine = RouletteEngine()
+        self.engine.subscribe(self.on_engine_event)
+        self.load_profiles()
+        self.selected_items = []  # 현재 표시 중인 아이템들
+        self.spin_result = None  # 현재 회전의 추첨 결과 (SpinResult)
+        
+        # 프로필 저장 예약 (변경된 프로필만, 엔진의 저장 스레드에서)
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.write_dirty_profiles)
         
         # 중앙 위젯 설정
         central_widget = QWidget(self)
@@ -1253,6 +1622,12 @@ class RouletteApp(QMainWindow):
         self.roulette_layout = QHBoxLayout(self.roulette_frame)
         self.roulette_frame.hide()  # 초기에 숨김
         
+        # 룰렛 릴 (항목 타일을 미리 그려 두고 회전 중에는 복사만 함)
+        self.frame_stats = FrameStats()  # 회전 애니메이션 프레임 시간 측정
+        self.reel = RouletteReel()
+        self.reel.frame_stats = self.frame_stats
+        self.roulette_layout.addWidget(self.reel, 0, Qt.AlignCenter)
+        
         # 룰렛 프레임을 메인 레이아웃에 추가
         main_layout.addWidget(self.roulette_frame)
         
@@ -1264,9 +1639,6 @@ class RouletteApp(QMainWindow):
         main_layout.addWidget(self.placeholder_spacer)
         self.placeholder_spacer.hide()  # 초기에 숨김
         
-        # 이미지 라벨 컨테이너
-        self.item_widgets = []
-        
         # 중간 여백 추가
         spacer = QWidget()
         spacer.setFixedHeight(30)
@@ -1294,6 +1666,12 @@ class RouletteApp(QMainWindow):
         
         button_layout.addStretch()
         
+        # 다운로드 진행 상황 표시
+        self.asset_status_label = QLabel("")
+        self.asset_status_label.setStyleSheet("color: white; background-color: transparent;")
+        self.asset_status_label.hide()
+        button_layout.addWidget(self.asset_status_label)
+        
         # 종료 버튼 - 타이틀바 없을 때 필요
         self.exit_button = QPushButton("X")
         self.exit_button.setFixedSize(30, 30)
@@ -1320,103 +1698,196 @@ class RouletteApp(QMainWindow):
         # 마우스 드래그 이벤트를 위한 변수
         self.drag_position = None
         
-        # 닉네임 추적
-        self._last_nickname = None
-        
-        # 기본 사운드 파일 다운로드 확인
-        self.check_default_sound()
+        # 창을 띄운 뒤 이미 있는 소리 파일만 불러옴 (없는 파일은 start_asset_downloads에서 받은 뒤 불러옴)
+        QTimer.singleShot(0, self.load_sounds)
         
         # 틱 사운드 관련 변수
         self.last_tick_time = 0  # 마지막 틱 소리 재생 시간
         self.tick_interval = 0.1  # 초기 틱 소리 간격 (초)
+        
+        # 애니메이션 프레임 타이머 (메인 스레드에서 실행)
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setTimerType(Qt.PreciseTimer)
+        self.animation_timer.setInterval(ANIMATION_FRAME_INTERVAL_MS)
+        self.animation_timer.timeout.connect(self.advance_animation)
+        self.animation_clock = QElapsedTimer()
+        self.animation_easing = QEasingCurve(ANIMATION_EASING_CURVE)
+        self.animation_offset = 0  # 현재 표시 중인 항목 링의 시작 위치
+        self.animation_total_steps = 0  # 이번 회전에서 이동할 총 칸 수
+        self.animation_duration_ms = 0
+        self.animation_result_index = -1  # 이번 회전의 당첨 항목 인덱스
+        self.animation_updates = 0
+        
+        # 프레임 통계 오버레이 (F3으로 표시/숨김)
+        self.frame_overlay = QLabel(central_widget)
+        self.frame_overlay.setFont(QFont("Monospace", 9))
+        self.frame_overlay.setStyleSheet("color: #7CFC00; background-color: rgba(0, 0, 0, 180); padding: 6px;")
+        self.frame_overlay.move(24, 60)
+        self.frame_overlay.hide()
+        self.frame_overlay_timer = QTimer(self)
+        self.frame_overlay_timer.setInterval(FRAME_OVERLAY_REFRESH_MS)
+        self.frame_overlay_timer.timeout.connect(self.refresh_frame_overlay)
+        self.frame_overlay_shortcut = QShortcut(QKeySequence(FRAME_OVERLAY_SHORTCUT), self)
+        self.frame_overlay_shortcut.activated.connect(self.toggle_frame_overlay)
+        
+        # 이전 실행에서 처리하지 못한 요청 복구
+        if self.engine.restore_requests():
+            QTimer.singleShot(1000, self.process_next_request)
+    
+    # 엔진 상태 (창은 읽기만 함)
+    @property
+    def profiles(self):
+        return self.engine.profiles
+    
+    @property
+    def current_profile(self):
+        return self.engine.current_profile
+    
+    @property
+    def current_profile_index(self):
+        return self.engine.current_profile_index
+    
+    @property
+    def request_queue(self):
+        return self.engine.request_queue
+    
+    def request_roulette(self, profile_index, nickname=None, count=1, trace_id=None):
+        """룰렛 요청 (HTTP 스레드에서 호출 - 신호를 통해 메인 스레드에서 처리)"""
+        self.signals.request_received.emit(profile_index, nickname, count, trace_id)
+    
+    def on_engine_event(self, event, data):
+        """엔진 이벤트를 화면에 반영"""
+        if event == 'profile_changed':
+            index = data['index']
+            self.profile_combo.blockSignals(True)
+            self.profile_combo.setCurrentIndex(index)
+            self.profile_combo.blockSignals(False)
+            # 링크 복사 버튼 텍스트 업데이트
+            self.copy_link_button.setToolTip(f"프로필 {index + 1} ({data['profile'].name})의 링크 복사")
+            self.update_roulette_items()
+        elif event == 'request_started':
+            # 닉네임 표시
+            self.update_indicator(data['request'].nickname)
+        elif event == 'profile_save_failed':
+            # 저장 스레드에서 호출되므로 신호로 메인 스레드에 전달
+            self.signals.profile_save_failed.emit(str(data['error']))
+
+    def start_asset_downloads(self, include_images=True, background=FAST_START):
+        """기본 소리와 이미지 패키지 다운로드 (background=True면 작업 스레드에서 진행)"""
+        if background:
+            threading.Thread(target=self.download_assets, args=(include_images,),
+                             daemon=True, name="asset-download").start()
+        else:
+            self.download_assets(include_images)  # 끝나면 assets_ready 신호로 on_assets_ready 호출
+    
+    def download_assets(self, include_images=True):
+        """파일 다운로드 (메인 스레드가 아닐 수 있으므로 화면은 신호로만 갱신)"""
+        progress = self.signals.asset_progress.emit
+        try:
+            progress("소리 파일 확인 중...")
+            self.check_default_sound()
+            if include_images:
+                download_and_extract_images(progress=progress)
+        finally:
+            self.signals.assets_ready.emit()
+    
+    def show_asset_progress(self, message):
+        self.asset_status_label.setText(message)
+        self.asset_status_label.show()
+    
+    def on_assets_ready(self):
+        """다운로드가 끝나면 새로 받은 소리와 이미지를 반영"""
+        self.asset_status_label.hide()
+        if self.animation_active:
+            # 회전 중에는 화면을 다시 만들지 않고 소리만 불러옴 (이미지는 다음 갱신 때 반영)
+            self.load_sounds()
+        else:
+            self.sounds_loaded = True
+            self.update_roulette_items()
+    
+    def load_sounds(self):
+        """현재 프로필의 효과음을 불러옴 (이후 프로필/항목 갱신 때마다 바뀐 것만 다시 불러옴)"""
+        self.sounds_loaded = True
+        self.sound_bank.load(self.current_profile.sound)
 
     def check_default_sound(self):
         """기본 사운드 파일이 있는지 확인하고 없으면 다운로드"""
         try:
             # 기본 소리 파일 확인
             if not os.path.exists(DEFAULT_SOUND_FILE):
-                print("기본 소리 파일이 없습니다. 다운로드를 시도합니다.")
+                log.info("기본 소리 파일이 없습니다. 다운로드를 시도합니다.")
                 self.download_default_sound()
                 
             # 기본 틱 소리 파일 확인
             if not os.path.exists(DEFAULT_TICK_SOUND_FILE):
-                print("기본 틱 소리 파일이 없습니다. 다운로드를 시도합니다.")
+                log.info("기본 틱 소리 파일이 없습니다. 다운로드를 시도합니다.")
                 self.download_tick_sound()
                 
             # 완료 소리 파일 확인
             if not os.path.exists(DEFAULT_FINISH_SOUND_FILE):
-                print("완료 소리 파일이 없습니다. 다운로드를 시도합니다.")
+                log.info("완료 소리 파일이 없습니다. 다운로드를 시도합니다.")
                 self.download_finish_sound()
         except Exception as e:
-            print(f"기본 소리 파일 확인 중 오류: {e}")
+            log.error("기본 소리 파일 확인 중 오류: %s", e)
 
     def download_default_sound(self):
         """기본 소리 파일을 다운로드"""
         try:
-            print(f"기본 소리 파일 다운로드 중: {DEFAULT_SOUND_URL}")
-            response = requests.get(DEFAULT_SOUND_URL, stream=True)
-            
-            if response.status_code == 200:
-                with open(DEFAULT_SOUND_FILE, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                print(f"기본 소리 파일이 다운로드되었습니다: {DEFAULT_SOUND_FILE}")
+            log.info("기본 소리 파일 다운로드 중: %s", DEFAULT_SOUND_URL)
+            # 이미 받은 파일이면 조건부 요청으로 바뀐 경우에만 다시 받음
+            status = download_file(DEFAULT_SOUND_URL, DEFAULT_SOUND_FILE)
+            
+            if status in (200, 304):
+                log.info("기본 소리 파일이 다운로드되었습니다: %s", DEFAULT_SOUND_FILE)
                 return True
             else:
-                print(f"소리 파일 다운로드 실패: {response.status_code}")
+                log.warning("소리 파일 다운로드 실패: %s", status)
                 return False
                 
         except Exception as e:
-            print(f"소리 파일 다운로드 오류: {e}")
+            log.error("소리 파일 다운로드 오류: %s", e)
             return False
 
     def download_tick_sound(self):
         """기본 틱 소리 파일을 다운로드"""
         try:
             # 기본 틱 소리가 없으면 생성 시도
-            print(f"기본 틱 소리 파일 다운로드 중: {DEFAULT_TICK_SOUND_URL}")
+            log.info("기본 틱 소리 파일 다운로드 중: %s", DEFAULT_TICK_SOUND_URL)
             
             try:
-                response = requests.get(DEFAULT_TICK_SOUND_URL, stream=True)
+                # 이미 받은 파일이면 조건부 요청으로 바뀐 경우에만 다시 받음
+                status = download_file(DEFAULT_TICK_SOUND_URL, DEFAULT_TICK_SOUND_FILE)
                 
-                if response.status_code == 200:
-                    with open(DEFAULT_TICK_SOUND_FILE, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    print(f"기본 틱 소리 파일이 다운로드되었습니다: {DEFAULT_TICK_SOUND_FILE}")
+                if status in (200, 304):
+                    log.info("기본 틱 소리 파일이 다운로드되었습니다: %s", DEFAULT_TICK_SOUND_FILE)
                     return True
                 else:
-                    print("틱 소리 다운로드 실패, 기본 파일 생성을 시도합니다.")
+                    log.warning("틱 소리 다운로드 실패, 기본 파일 생성을 시도합니다.")
                     return self.create_default_tick_sound()
             except Exception as e:
-                print(f"틱 소리 다운로드 오류: {e}")
+                log.error("틱 소리 다운로드 오류: %s", e)
                 return self.create_default_tick_sound()
                 
         except Exception as e:
-            print(f"틱 소리 준비 오류: {e}")
+            log.error("틱 소리 준비 오류: %s", e)
             return False
 
     def download_finish_sound(self):
         """기본 당첨 효과음 파일을 다운로드"""
         try:
-            print(f"기본 당첨 효과음 파일 다운로드 중: {DEFAULT_FINISH_SOUND_URL}")
-            response = requests.get(DEFAULT_FINISH_SOUND_URL, stream=True)
-            
-            if response.status_code == 200:
-                with open(DEFAULT_FINISH_SOUND_FILE, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                print(f"기본 당첨 효과음 파일이 다운로드되었습니다: {DEFAULT_FINISH_SOUND_FILE}")
+            log.info("기본 당첨 효과음 파일 다운로드 중: %s", DEFAULT_FINISH_SOUND_URL)
+            # 이미 받은 파일이면 조건부 요청으로 바뀐 경우에만 다시 받음
+            status = download_file(DEFAULT_FINISH_SOUND_URL, DEFAULT_FINISH_SOUND_FILE)
+            
+            if status in (200, 304):
+                log.info("기본 당첨 효과음 파일이 다운로드되었습니다: %s", DEFAULT_FINISH_SOUND_FILE)
                 return True
             else:
-                print(f"당첨 효과음 파일 다운로드 실패: {response.status_code}")
+                log.warning("당첨 효과음 파일 다운로드 실패: %s", status)
                 return False
                     
         except Exception as e:
-            print(f"당첨 효과음 파일 다운로드 오류: {e}")
+            log.error("당첨 효과음 파일 다운로드 오류: %s", e)
             return False
 
     def create_default_tick_sound(self):
@@ -1427,16 +1898,16 @@ class RouletteApp(QMainWindow):
             if os.path.exists(DEFAULT_SOUND_FILE):
                 import shutil
                 shutil.copy2(DEFAULT_SOUND_FILE, DEFAULT_TICK_SOUND_FILE)
-                print(f"기본 소리 파일을 틱 소리로 복사했습니다: {DEFAULT_TICK_SOUND_FILE}")
+                log.info("기본 소리 파일을 틱 소리로 복사했습니다: %s", DEFAULT_TICK_SOUND_FILE)
                 return True
                 
             # 기본 틱 소리를 생성하는 로직 (파이썬 wave, numpy 등 라이브러리 필요)
             # 생략 - 적절한 라이브러리로 구현 필요
                 
-            print("틱 소리 파일 생성 실패")
+            log.warning("틱 소리 파일 생성 실패")
             return False
         except Exception as e:
-            print(f"틱 소리 파일 생성 오류: {e}")
+            log.error("틱 소리 파일 생성 오류: %s", e)
             return False
 
     def mousePressEvent(self, event):
@@ -1486,18 +1957,14 @@ class RouletteApp(QMainWindow):
                 
                 # 표시 효과
                 self.indicator.show()
-                print(f"인디케이터 업데이트: {nickname}")
-                
-                # 현재 닉네임 저장
-                self._last_nickname = nickname
+                log.debug("인디케이터 업데이트: %s", nickname)
             else:
                 # 닉네임이 없거나 공백만 있으면 숨김
                 self.indicator.setText("")
                 self.indicator.hide()
-                print("닉네임이 없어 인디케이터를 숨깁니다.")
-                self._last_nickname = None
+                log.debug("닉네임이 없어 인디케이터를 숨깁니다.")
         except Exception as e:
-            print(f"인디케이터 업데이트 오류: {e}")
+            log.error("인디케이터 업데이트 오류: %s", e)
 
     def toggle_titlebar(self):
         """타이틀바 표시/숨김을 토글하는 메서드"""
@@ -1523,10 +1990,25 @@ class RouletteApp(QMainWindow):
             self.show()
             self.move(current_pos)
             
-            print(f"타이틀바 상태 변경: {'표시' if self.titlebar_visible else '숨김'}")
+            log.debug("타이틀바 상태 변경: %s", '표시' if self.titlebar_visible else '숨김')
             
         except Exception as e:
-            print(f"타이틀바 토글 오류: {e}")
+            log.error("타이틀바 토글 오류: %s", e)
+
+    def toggle_frame_overlay(self):
+        """프레임 통계 오버레이 표시/숨김"""
+        if self.frame_overlay.isVisible():
+            self.frame_overlay_timer.stop()
+            self.frame_overlay.hide()
+        else:
+            self.refresh_frame_overlay()
+            self.frame_overlay.show()
+            self.frame_overlay.raise_()
+            self.frame_overlay_timer.start()
+    
+    def refresh_frame_overlay(self):
+        self.frame_overlay.setText(self.frame_stats.overlay_text())
+        self.frame_overlay.adjustSize()
 
     def hide_elements(self):
         """룰렛 프레임과 인디케이터를 숨기고 플레이스홀더를 표시"""
@@ -1538,102 +2020,62 @@ class RouletteApp(QMainWindow):
             # 플레이스홀더 표시
             self.placeholder_spacer.show()
             
-            print("룰렛 종료: 요소가 숨겨지고 플레이스홀더가 표시되었습니다.")
+            log.info("룰렛 종료: 요소가 숨겨지고 플레이스홀더가 표시되었습니다.")
         except Exception as e:
-            print(f"요소 숨기기 오류: {e}")
+            log.error("요소 숨기기 오류: %s", e)
 
     def load_profiles(self):
-        profiles = []
-        try:
-            # 샘플 이미지 생성 (이미지 없는 경우를 위해)
-            sample_image_path = os.path.join(IMAGE_FOLDER, "sample.png")
-            if not os.path.exists(sample_image_path):
-                try:
-                    # 간단한 샘플 이미지 생성
-                    from PIL import Image, ImageDraw
-                    img = Image.new('RGB', (150, 150), color=(73, 109, 137))
-                    d = ImageDraw.Draw(img)
-                    d.text((50, 70), "샘플", fill=(255, 255, 255))
-                    img.save(sample_image_path)
-                    print(f"샘플 이미지 생성됨: {sample_image_path}")
-                except ImportError:
-                    print("PIL 라이브러리 없음, 샘플 이미지 생성 불가")
-            
-            # 모든 프로필 설정 파일 찾기
-            config_files = [f for f in os.listdir(CONFIG_FOLDER) if f.startswith("profile_") and f.endswith(".json")]
-            
-            if not config_files:
-                # 기본 프로필
-                profiles.append(Profile(name="프로필 1", items=[
-                    RouletteItem(name="항목 1", probability=25),
-                    RouletteItem(name="항목 2", probability=25),
-                    RouletteItem(name="항목 3", probability=25),
-                    RouletteItem(name="항목 4", probability=25)
-                ]))
-                return profiles
-            
-            for config_file in sorted(config_files):
-                file_path = os.path.join(CONFIG_FOLDER, config_file)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    try:
-                        data = json.load(f)
-                        profile = Profile.from_dict(data)
-                        profiles.append(profile)
-                    except json.JSONDecodeError:
-                        print(f"파일 '{config_file}'의 JSON 형식이 잘못되었습니다.")
-        except Exception as e:
-            print(f"프로필 로드 오류: {e}")
-            # 오류 발생 시 기본 프로필
-            profiles.append(Profile(name="프로필 1", items=[
-                RouletteItem(name="항목 1", probability=25),
-                RouletteItem(name="항목 2", probability=25),
-                RouletteItem(name="항목 3", probability=25),
-                RouletteItem(name="항목 4", probability=25)
-            ]))
-        
-        return profiles
-
-    def save_profiles(self):
+        """샘플 이미지를 준비하고 엔진에서 프로필 목록을 불러옴"""
+        # 샘플 이미지 생성 (이미지 없는 경우를 위해)
+        sample_image_path = os.path.join(IMAGE_FOLDER, "sample.png")
+        if not os.path.exists(sample_image_path):
+            try:
+                # 간단한 샘플 이미지 생성
+                from PIL import Image, ImageDraw
+                img = Image.new('RGB', (150, 150), color=(73, 109, 137))
+                d = ImageDraw.Draw(img)
+                d.text((50, 70), "샘플", fill=(255, 255, 255))
+                img.save(sample_image_path)
+                log.info("샘플 이미지 생성됨: %s", sample_image_path)
+            except ImportError:
+                log.warning("PIL 라이브러리 없음, 샘플 이미지 생성 불가")
+            except Exception as e:
+                log.error("샘플 이미지 생성 오류: %s", e)
+        
+        return self.engine.load_profiles()
+
+    def save_profiles(self, immediate=False):
+        """변경된 프로필 저장 예약 (immediate=True면 바로 저장하고 완료까지 대기)"""
+        if immediate:
+            self.save_timer.stop()
+            self.engine.flush_profiles()
+        else:
+            # 연속된 변경은 마지막 변경 후 한 번만 저장
+            self.save_timer.start(PROFILE_SAVE_DELAY_MS)
+    
+    def write_dirty_profiles(self):
+        """변경된 프로필만 저장 스레드로 전달"""
         try:
-            # 이전 설정 파일 모두 삭제
-            for file in os.listdir(CONFIG_FOLDER):
-                if file.startswith("profile_") and file.endswith(".json"):
-                    os.remove(os.path.join(CONFIG_FOLDER, file))
-            
-            # 새 설정 파일 저장
-            for i, profile in enumerate(self.profiles):
-                file_path = os.path.join(CONFIG_FOLDER, f"profile_{i+1}.json")
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(profile.to_dict(), f, ensure_ascii=False, indent=2)
+            self.engine.write_dirty_profiles()
         except Exception as e:
-            print(f"프로필 저장 오류: {e}")
+            log.error("프로필 저장 오류: %s", e)
             QMessageBox.critical(self, "저장 오류", f"프로필 저장 중 오류가 발생했습니다: {e}")
+    
+    def on_profile_save_failed(self, error):
+        """저장 실패 시 다음 저장 때 모든 프로필을 다시 쓰도록 하고 오류 표시"""
+        self.engine.reset_saved_state()
+        QMessageBox.critical(self, "저장 오류", f"프로필 저장 중 오류가 발생했습니다: {error}")
 
     def change_profile(self, index):
-        if 0 <= index < len(self.profiles) and not self.animation_active:
-            self.current_profile_index = index
-            self.current_profile = self.profiles[index]
-            
-            # 링크 복사 버튼 텍스트 업데이트
-            profile_number = index + 1
-            self.copy_link_button.setToolTip(f"프로필 {profile_number} ({self.current_profile.name})의 링크 복사")
-            
-            self.update_roulette_items()
+        if not self.animation_active:
+            self.engine.select_profile(index)
 
     def add_profile(self):
-        if len(self.profiles) >= 10:
-            QMessageBox.warning(self, "프로필 제한", "프로필은 최대 10개까지만 추가할 수 있습니다.")
-            return
-        
         name, ok = QInputDialog.getText(self, "프로필 추가", "새 프로필 이름:", text=f"프로필 {len(self.profiles)+1}")
         
         if ok and name:
-            new_profile = Profile(name=name)
-            self.profiles.append(new_profile)
-            self.current_profile_index = len(self.profiles) - 1
-            self.current_profile = new_profile
+            self.engine.add_profile(name)
             self.update_profile_combo()
-            self.update_roulette_items()
             self.save_profiles()
 
     def rename_profile(self):
@@ -1646,6 +2088,7 @@ class RouletteApp(QMainWindow):
         
         if ok and new_name:
             self.current_profile.name = new_name
+            self.current_profile.mark_dirty()
             self.update_profile_combo()
             self.save_profiles()
 
@@ -1659,30 +2102,18 @@ class RouletteApp(QMainWindow):
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            del self.profiles[self.current_profile_index]
-            self.current_profile_index = 0
-            self.current_profile = self.profiles[0]
+            self.engine.delete_profile(self.current_profile_index)
             self.update_profile_combo()
-            self.update_roulette_items()
             self.save_profiles()
 
     # 최적화된 룰렛 항목 업데이트 메서드
     def update_roulette_items(self):
         try:
-            print("룰렛 아이템 업데이트 시작")
+            log.debug("룰렛 아이템 업데이트 시작")
             start_time = time.time()
             
-            # 레이아웃 초기화
-            if hasattr(self, 'roulette_layout'):
-                # 기존 아이템 위젯 제거
-                for widget in self.item_widgets:
-                    self.roulette_layout.removeWidget(widget)
-                    widget.setParent(None)  # 명시적으로 부모 관계 제거
-                    widget.deleteLater()
-                self.item_widgets.clear()
-            
-            # 가능한 아이템이 없으면 샘플 아이템 추가
-            if not self.current_profile.items:
+            # 가능한 아이템이 없으면 샘플 아이템 추가 (읽기에 실패한 프로필은 빈 채로 둠)
+            if not self.current_profile.items and not self.current_profile.load_failed:
                 self.current_profile.items = [
                     RouletteItem(name="항목 1", probability=25),
                     RouletteItem(name="항목 2", probability=25),
@@ -1690,15 +2121,20 @@ class RouletteApp(QMainWindow):
                     RouletteItem(name="항목 4", probability=25)
                 ]
             
+            # 현재 프로필의 효과음 미리 불러오기 (바뀐 경우에만, 창을 띄우기 전에는 생략)
+            if self.sounds_loaded:
+                self.sound_bank.load(self.current_profile.sound)
+            
             # 모든 항목을 표시
             self.selected_items = self.current_profile.items
+            self.animation_offset = 0  # 새로 그린 릴은 항목 순서 그대로 표시됨
             item_count = len(self.selected_items)
-            print(f"표시할 항목 수: {item_count}")
+            log.debug("표시할 항목 수: %s", item_count)
             
             if item_count == 0:
                 self.roulette_frame.hide()
                 self.placeholder_spacer.show()  # 플레이스홀더 표시
-                print("항목이 없어 룰렛 프레임을 숨깁니다.")
+                log.info("항목이 없어 룰렛 프레임을 숨깁니다.")
                 return
             
             # 플레이스홀더는 숨김
@@ -1710,16 +2146,13 @@ class RouletteApp(QMainWindow):
             # 아이템 크기를 항목 수에 따라 자동 조정
             available_width = self.width() - 40  # 여백 감안
             
-            # 아이템 생성을 일괄적으로 처리
+            # 릴 크기 계산 후 항목 타일을 미리 그림 (같은 항목과 설정이면 캐시 사용)
             self.create_roulette_items(item_count, available_width, display)
             
-            # 마지막에 한 번만 업데이트
-            self.roulette_frame.update()
-            
             end_time = time.time()
-            print(f"룰렛 아이템 업데이트 완료 (소요시간: {end_time - start_time:.3f}초)")
+            log.debug("룰렛 아이템 업데이트 완료 (소요시간: %.3f초)", end_time - start_time)
         except Exception as e:
-            print(f"룰렛 아이템 업데이트 오류: {e}")
+            log.error("룰렛 아이템 업데이트 오류: %s", e)
 
     # 아이템 생성 메서드 - 고정 슬롯 수 지원 추가
     def create_roulette_items(self, item_count, available_width, display):
@@ -1735,12 +2168,12 @@ class RouletteApp(QMainWindow):
             # 고정 슬롯 수 사용
             display_count = min(fixed_slot_count, item_count)
             item_width = max(min(available_width // fixed_slot_count, max_item_width), min_item_width)
-            print(f"고정 슬롯 수 사용: {fixed_slot_count}개 슬롯")
+            log.debug("고정 슬롯 수 사용: %s개 슬롯", fixed_slot_count)
         else:
             # 자동 (모든 항목 표시)
             display_count = item_count
             item_width = max(min(available_width // item_count, max_item_width), min_item_width)
-            print(f"자동 슬롯 수 사용: {item_count}개 항목 모두 표시")
+            log.debug("자동 슬롯 수 사용: %s개 항목 모두 표시", item_count)
             
         item_height = item_width  # 정사각형 비율 유지
         
@@ -1748,90 +2181,25 @@ class RouletteApp(QMainWindow):
         font_family = display.font_family
         font_size = display.font_size
         title_font_size = display.title_font_size
-        text_color = display.text_color
-        use_text_mode = display.use_text_mode
         
         # 폰트 크기 자동 조정 (정수형으로 변환)
         adjusted_font_size = int(max(min(font_size, item_width // 8), 8))  # 최소 8pt
         adjusted_title_size = int(max(min(title_font_size, item_width // 6), 10))  # 최소 10pt
         adjusted_name_size = int(max(min(font_size * 0.8, item_width // 10), 6))  # 이름 라벨용
         
-        print(f"항목 자동 크기 조정: {item_width}x{item_height}, 폰트: {adjusted_font_size}pt")
+        log.debug("항목 자동 크기 조정: %sx%s, 폰트: %spt", item_width, item_height, adjusted_font_size)
         
-        # 표시할 항목 선택
-        if fixed_slot_count > 0 and fixed_slot_count < item_count:
-            # 고정 슬롯 수가 있고, 아이템 수가 그보다 많으면 선택적으로 표시
-            center_idx = len(self.selected_items) // 2
-            start_idx = max(0, center_idx - (fixed_slot_count // 2))
-            end_idx = start_idx + fixed_slot_count
-            
-            if end_idx > len(self.selected_items):
-                end_idx = len(self.selected_items)
-                start_idx = max(0, end_idx - fixed_slot_count)
-                
-            display_items = self.selected_items[start_idx:end_idx]
-            print(f"슬롯 제한으로 {len(display_items)}개 항목만 표시 (전체 {item_count}개 중)")
-        else:
-            # 자동 모드이거나 아이템 수가 충분하지 않으면 모두 표시
-            display_items = self.selected_items
-        
-        # 항목 위젯 생성
-        for i, item in enumerate(display_items):
-            # 수직 레이아웃 컨테이너
-            item_widget = QFrame()
-            item_widget.setFrameStyle(QFrame.Box)
-            item_widget.setStyleSheet("background-color: rgba(50, 50, 50, 200); border: 1px solid #00AAFF;")
-            item_layout = QVBoxLayout(item_widget)
-            item_layout.setSpacing(2)  # 레이아웃 내 위젯 간격 줄이기
-            item_layout.setContentsMargins(4, 4, 4, 4)  # 여백 줄이기
-            
-            if use_text_mode:
-                # 텍스트 모드
-                text_label = QLabel(item.display_text or item.name)
-                text_label.setFixedSize(item_width, item_height)
-                text_label.setAlignment(Qt.AlignCenter)
-                text_label.setWordWrap(True)
-                text_label.setStyleSheet(f"color: {text_color}; background-color: rgba(60, 60, 60, 200); border: 1px solid #888;")
-                text_label.setFont(QFont(font_family, adjusted_font_size))
-                item_layout.addWidget(text_label)
-            else:
-                # 이미지 모드
-                img_label = QLabel()
-                img_label.setAlignment(Qt.AlignCenter)
-                
-                if os.path.exists(item.image_path):
-                    pixmap = QPixmap(item.image_path).scaled(
-                        item_width, item_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    img_label.setPixmap(pixmap)
-                    img_label.setStyleSheet("background-color: rgba(60, 60, 60, 200); border: 1px solid #888;")
-                else:
-                    # 이미지 없으면 텍스트로
-                    img_label.setText(item.name)
-                    img_label.setStyleSheet(f"color: {text_color}; background-color: rgba(60, 60, 60, 200); border: 1px solid #888;")
-                    img_label.setFont(QFont(font_family, adjusted_font_size))
-                
-                item_layout.addWidget(img_label)
-            
-            # 이름 라벨
-            name_label = QLabel(item.name)
-            name_label.setAlignment(Qt.AlignCenter)
-            name_label.setStyleSheet(f"color: {text_color}; background-color: transparent;")
-            name_label.setFont(QFont(font_family, adjusted_name_size))
-            name_label.setWordWrap(True)
-            name_label.setFixedWidth(item_width)
-            
-            # 배율 라벨
-            multiplier_label = QLabel(getattr(item, 'multiplier', 'X1'))
-            multiplier_label.setAlignment(Qt.AlignCenter)
-            multiplier_label.setStyleSheet(f"color: #FF6B6B; background-color: transparent; font-weight: bold;")
-            multiplier_label.setFont(QFont(font_family, adjusted_title_size, QFont.Bold))
-            
-            item_layout.addWidget(name_label)
-            item_layout.setAlignment(name_label, Qt.AlignHCenter)  # 레이블을 수평 가운데 정렬
-            item_layout.addWidget(multiplier_label)
-            
-            self.item_widgets.append(item_widget)
-            self.roulette_layout.addWidget(item_widget)
+        # 고정 슬롯 수가 있고 아이템 수가 그보다 많으면 가운데 부분만 표시
+        if display_count < item_count:
+            log.info("슬롯 제한으로 %s개 항목만 표시 (전체 %s개 중)", display_count, item_count)
+        
+        # 폰트는 타일마다 만들지 않고 한 번만 생성
+        text_font = QFont(font_family, adjusted_font_size)
+        name_font = QFont(font_family, adjusted_name_size)
+        title_font = QFont(font_family, adjusted_title_size, QFont.Bold)
+        
+        self.reel.set_items(self.selected_items, display_count, item_width, item_height, display,
+                            text_font, name_font, title_font)
         
     def open_settings(self):
         if self.animation_active:
@@ -1839,8 +2207,8 @@ class RouletteApp(QMainWindow):
             
         dialog = SettingsDialog(self, self.current_profile)
         if dialog.exec_() == QDialog.Accepted:
-            # 설정값 적용
-            self.current_profile = dialog.profile
+            # 설정값 적용 (대화상자는 현재 프로필을 직접 수정함)
+            self.current_profile.mark_dirty()
             self.update_roulette_items()
             self.save_profiles()
 
@@ -1850,30 +2218,19 @@ class RouletteApp(QMainWindow):
             # 소리 설정 확인
             sound_settings = self.current_profile.sound
             if not sound_settings.enabled:
-                print("소리 기능이 비활성화되어 있습니다.")
+                log.debug("소리 기능이 비활성화되어 있습니다.")
                 return False
             
-            # 소리 파일 경로 확인
-            sound_path = sound_settings.sound_path
-            if not os.path.exists(sound_path):
-                print(f"소리 파일이 존재하지 않습니다: {sound_path}")
+            # 미리 불러온 소리 재생 (파일 확인은 프로필 로드 시 완료)
+            if not self.sound_bank.play('start'):
+                log.warning("소리 파일이 존재하지 않습니다: %s", sound_settings.sound_path)
                 return False
-                
-            # 현재 재생중인 소리 중지
-            self.sound_player.stop()
-            
-            # 소리 로드 및 볼륨 설정
-            self.sound_player.setMedia(QMediaContent(QUrl.fromLocalFile(sound_path)))
-            self.sound_player.setVolume(sound_settings.volume)
-            
-            # 소리 재생
-            self.sound_player.play()
             
-            print(f"룰렛 소리 재생 시작: {sound_path} (볼륨: {sound_settings.volume}%)")
+            log.debug("룰렛 소리 재생 시작: %s (볼륨: %s%%)", self.sound_bank.paths['start'], sound_settings.volume)
             return True
             
         except Exception as e:
-            print(f"소리 재생 오류: {e}")
+            log.error("소리 재생 오류: %s", e)
             return False
 
     def play_tick_sound(self):
@@ -1884,12 +2241,6 @@ class RouletteApp(QMainWindow):
             if not sound_settings.enabled or not sound_settings.tick_enabled:
                 return False
             
-            # 소리 파일 경로 확인
-            tick_sound_path = sound_settings.tick_sound_path
-            if not os.path.exists(tick_sound_path):
-                print(f"틱 소리 파일이 존재하지 않습니다: {tick_sound_path}")
-                return False
-            
             # 현재 시간
             current_time = time.time()
             
@@ -1900,22 +2251,13 @@ class RouletteApp(QMainWindow):
                 
             self.last_tick_time = current_time
             
-            # 현재 재생중인 소리 중지
-            self.tick_player.stop()
-            
-            # 소리 로드 및 볼륨 설정
-            self.tick_player.setMedia(QMediaContent(QUrl.fromLocalFile(tick_sound_path)))
-            self.tick_player.setVolume(sound_settings.volume)
-            
-            # 소리 재생
-            self.tick_player.play()
-            
+            # 미리 불러온 틱 소리 재생 (파일이 없으면 프로필 로드 시 이미 안내됨)
             # 디버깅용 로그는 출력 부담이 크므로 비활성화
-            # print(f"틱 소리 재생 (간격: {self.tick_interval:.2f}초)")
-            return True
+            # log.debug("틱 소리 재생 (간격: %.2f초)", self.tick_interval)
+            return self.sound_bank.play('tick')
             
         except Exception as e:
-            print(f"틱 소리 재생 오류: {e}")
+            log.error("틱 소리 재생 오류: %s", e)
             return False
 
     def play_finish_sound(self):
@@ -1924,57 +2266,41 @@ class RouletteApp(QMainWindow):
             # 소리 설정 확인
             sound_settings = self.current_profile.sound
             if not sound_settings.enabled or not sound_settings.finish_enabled:
-                print("소리 기능 또는 당첨 효과음이 비활성화되어 있습니다.")
+                log.debug("소리 기능 또는 당첨 효과음이 비활성화되어 있습니다.")
                 return False
             
-            # 소리 파일 경로 확인
-            finish_sound_path = sound_settings.finish_sound_path
-            if not os.path.exists(finish_sound_path):
-                print(f"당첨 효과음 파일이 존재하지 않습니다: {finish_sound_path}")
-                # 기본 당첨 소리로 대체
-                if not os.path.exists(DEFAULT_FINISH_SOUND_FILE):
-                    self.download_finish_sound()
-                finish_sound_path = DEFAULT_FINISH_SOUND_FILE
-            
-            # 현재 재생중인 소리 중지
-            self.finish_player.stop()
-            
-            # 소리 로드 및 볼륨 설정
-            self.finish_player.setMedia(QMediaContent(QUrl.fromLocalFile(finish_sound_path)))
-            self.finish_player.setVolume(sound_settings.volume)
-            
-            # 소리 재생
-            self.finish_player.play()
+            # 미리 불러온 당첨 효과음 재생 (없는 파일은 로드 시 기본 당첨 소리로 대체됨)
+            if not self.sound_bank.play('finish'):
+                log.warning("당첨 효과음 파일이 존재하지 않습니다: %s", sound_settings.finish_sound_path)
+                return False
             
-            print(f"당첨 효과음 재생 시작: {finish_sound_path} (볼륨: {sound_settings.volume}%)")
+            log.debug("당첨 효과음 재생 시작: %s (볼륨: %s%%)", self.sound_bank.paths['finish'], sound_settings.volume)
             return True
                 
         except Exception as e:
-            print(f"당첨 효과음 재생 오류: {e}")
+            log.error("당첨 효과음 재생 오류: %s", e)
             return False
 
     def spin_roulette(self):
         if self.animation_active:
-            print("이미 애니메이션 실행 중, 요청은 큐에 있습니다.")
+            log.info("이미 애니메이션 실행 중, 요청은 큐에 있습니다.")
             return
         
         # 만약 숨김 타이머가 활성화 상태라면 취소
         if self.hide_timer is not None and self.hide_timer.isActive():
-            print("요소 숨기기 타이머 취소됨 - 수동 룰렛 실행")
+            log.debug("요소 숨기기 타이머 취소됨 - 수동 룰렛 실행")
             self.hide_timer.stop()
             self.hide_timer = None
 
         if not self.current_profile.items:
-            print("항목이 없습니다")
-            # 큐의 요청을 처리
+            log.warning("항목이 없습니다")
+            # 현재 요청은 결과 없이 완료하고 다음 요청이 있으면 처리
+            self.engine.complete_request()
             if self.request_queue:
-                self.request_queue.pop(0)  # 현재 요청 제거
-                # 다음 요청이 있으면 처리
-                if self.request_queue:
-                    QTimer.singleShot(100, self.process_next_request)
+                QTimer.singleShot(100, self.process_next_request)
             return
                 
-        print("룰렛 회전 시작")
+        log.info("룰렛 회전 시작")
         
         # 룰렛 프레임이 숨겨져 있으면 표시
         if not self.roulette_frame.isVisible():
@@ -1983,14 +2309,8 @@ class RouletteApp(QMainWindow):
             self.roulette_frame.show()
             self.placeholder_spacer.hide()  # 플레이스홀더 숨김
         
-        # 룰렛이 시작되기 전에 화면 업데이트
-        for widget in self.item_widgets:
-            if widget:
-                # 시작할 때 색상 변경
-                widget.setStyleSheet("background-color: rgba(70, 70, 70, 200); border: 2px solid #00aaff;")
-        
-        # 모든 위젯을 한 번에 업데이트
-        self.roulette_frame.update()
+        # 룰렛이 시작되기 전에 회전 중 표시로 변경
+        self.reel.set_state(RouletteReel.SPINNING)
         
         # 룰렛 소리 재생
         self.play_roulette_sound()
@@ -2006,203 +2326,110 @@ class RouletteApp(QMainWindow):
         # 애니메이션 시작
         self.start_animation()
 
-    def simulate_key_press(self, key, repeat_count):
-        """키보드 키 입력 시뮬레이션"""
-        try:
-            import keyboard
-            print(f"키 '{key}' {repeat_count}회 입력 시작")
-            
-            # 특수 키 설정
-            for i in range(repeat_count):
-                keyboard.press_and_release(key)
-                time.sleep(0.05)
-                
-                # 10회마다 좀 더 긴 대기
-                if i > 0 and i % 10 == 0:
-                    time.sleep(0.2)
-                    
-            print(f"키 '{key}' {repeat_count}회 입력 완료")
-            return True
-        except ImportError:
-            print("keyboard 라이브러리가 설치되지 않았습니다. 'pip install keyboard' 명령으로 설치하세요.")
-            return False
-        except Exception as e:
-            print(f"키 입력 시뮬레이션 오류: {e}")
-            return False
-
     def start_animation(self):
-        # 새 스레드에서 애니메이션 실행
-        animation_thread = threading.Thread(target=self.animate_roulette, daemon=True)
-        animation_thread.start()
-
-    def animate_roulette(self):
-        print("애니메이션 시작")
+        """당첨 항목을 먼저 정하고 메인 스레드 프레임 타이머로 회전 애니메이션 시작"""
+        log.debug("애니메이션 시작")
         
         try:
-            # 선택할 항목 결정 (확률 기반)
-            selected_item = self.select_item_by_probability()
-            if selected_item is None:
-                print("선택할 항목이 없습니다.")
-                self.spin_button.setEnabled(True)
-                self.settings_button.setEnabled(True)
-                self.animation_active = False
+            # 당첨 항목 결정 (엔진에서 확률 기반 추첨, 일괄 요청이면 가장 많이 나온 항목)
+            self.spin_result = self.engine.draw() if self.selected_items else None
+            if self.spin_result is None:
+                log.warning("선택할 항목이 없습니다.")
+                self.finish_roulette(-1)
                 return
-                
-            print(f"선택된 항목: {selected_item.name}")
-            
-            # 선택된 항목의 인덱스 찾기
-            try:
-                selected_index = self.current_profile.items.index(selected_item) % len(self.selected_items)
-            except ValueError:
-                selected_index = random.randint(0, len(self.selected_items)-1)
-            
-            # 룰렛 회전 시간
-            rotation_time = self.current_profile.rotation_time
-            start_time = time.time()
-            interval = 0.1  # 초기 속도
-            
-            # 임시 항목 리스트 생성 (회전용)
-            temp_items = self.selected_items.copy()
-            total_updates = 0
             
-            while time.time() - start_time < rotation_time:
-                # 아이템 회전
-                temp_items = temp_items[1:] + [temp_items[0]]
-                
-                # 메인 스레드에서 UI 업데이트
-                self.signals.update_images.emit(temp_items)
-                total_updates += 1
-                
-                # 틱 소리 재생 신호 발생
-                self.signals.play_tick_sound.emit()
-                
-                # 속도 점점 느려지게
-                progress = (time.time() - start_time) / rotation_time
-                interval = 0.1 + progress * 0.3  # 0.1초에서 시작해서 0.4초까지 늘어남
-                
-                # 틱 소리 간격도 함께 업데이트
-                self.tick_interval = interval
-                
-                time.sleep(interval)
-            
-            # 최종 결과 통지
-            self.signals.finish_animation.emit(selected_index)
-            print(f"총 {total_updates}번 업데이트됨, 최종 결과: {selected_item.name}")
+            # 선택된 항목의 인덱스
+            item_count = len(self.selected_items)
+            selected_index = self.spin_result.item_index % item_count
+            
+            # 마지막 칸에서 당첨 항목이 중앙에 오도록 총 이동 칸 수 계산
+            # (대기 요청이 많으면 빠른 진행 설정에 따라 회전 시간이 줄어듦)
+            rotation_time = self.engine.rotation_time()
+            final_offset = (selected_index - item_count // 2) % item_count
+            start_offset = self.animation_offset % item_count
+            desired_steps = max(item_count, int(rotation_time * ANIMATION_STEPS_PER_SECOND))
+            self.animation_total_steps = desired_steps + (final_offset - start_offset - desired_steps) % item_count
+            
+            self.animation_offset = start_offset
+            self.animation_result_index = selected_index
+            self.animation_duration_ms = max(1, int(rotation_time * 1000))
+            self.animation_updates = 0
+            self._animation_start_offset = start_offset
+            self._animation_last_step = 0
+            self._animation_last_step_ms = 0
+            
+            self.frame_stats.begin_spin()
+            self.animation_clock.start()
+            self.animation_timer.start()
         
         except Exception as e:
-            print(f"애니메이션 오류: {e}")
-            self.signals.finish_animation.emit(-1)
-
-    def select_item_by_probability(self):
-        """확률에 따라 항목을 선택"""
-        if not self.current_profile.items:
-            return None
-            
-        # 확률에 따른 가중치 계산
-        weights = [item.probability for item in self.current_profile.items]
-        total = sum(weights)
-        
-        if total <= 0:
-            # 모든 확률이 0이면 균등 확률 적용
-            return random.choice(self.current_profile.items)
-        
-        # 0~1 사이의 랜덤 값
-        r = random.uniform(0, total)
-        cumulative = 0
-        
-        for item, weight in zip(self.current_profile.items, weights):
-            cumulative += weight
-            if r <= cumulative:
-                return item
-        
-        # 마지막 항목 반환 (부동소수점 오류 방지)
-        return self.current_profile.items[-1]
+            log.error("애니메이션 오류: %s", e)
+            self.animation_timer.stop()
+            self.finish_roulette(-1)
 
-    def update_roulette_display(self, items):
-        """룰렛 UI 업데이트 - 성능 최적화"""
+    def advance_animation(self):
+        """프레임 타이머 콜백 - 경과 시간에 따라 이징 곡선 위치로 항목 링을 이동"""
         try:
-            # 현재 표시 설정
-            display = self.current_profile.display
-            font_family = display.font_family
-            font_size = display.font_size
-            text_color = display.text_color
-            use_text_mode = display.use_text_mode
-            fixed_slot_count = display.fixed_slot_count
-            
-            # 고정 슬롯 수가 설정된 경우, 표시할 항목 선택
-            if fixed_slot_count > 0 and fixed_slot_count < len(items):
-                # 선택된 항목 중심으로 표시 항목 결정
-                center_idx = len(items) // 2
-                start_idx = max(0, center_idx - (fixed_slot_count // 2))
-                end_idx = start_idx + fixed_slot_count
-                
-                if end_idx > len(items):
-                    end_idx = len(items)
-                    start_idx = max(0, end_idx - fixed_slot_count)
-                
-                display_items = items[start_idx:end_idx]
-            else:
-                display_items = items
-            
-            # 업데이트 전에 UI 이벤트 처리 일시 중지
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
-            # 위젯과 표시 항목의 수가 다를 수 있으므로 최소값 사용
-            for i, (widget, item) in enumerate(zip(self.item_widgets, display_items)):
-                # 위젯의 자식 찾기 (첫 번째만)
-                layout = widget.layout()
-                if not layout or layout.count() == 0:
-                    continue
-                    
-                # 첫 번째 자식 (이미지 또는 텍스트 라벨)
-                first_child = layout.itemAt(0).widget()
-                if not first_child:
-                    continue
-                    
-                if use_text_mode:
-                    # 텍스트 모드
-                    first_child.setText(item.display_text or item.name)
-                else:
-                    # 이미지 모드 - 캐시된 이미지 사용
-                    image_path = item.image_path
-                    if hasattr(item, '_cached_pixmap') and item._cached_pixmap:
-                        first_child.setPixmap(item._cached_pixmap)
-                    elif os.path.exists(image_path):
-                        pixmap = QPixmap(image_path).scaled(
-                            150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        # 픽스맵 캐싱
-                        item._cached_pixmap = pixmap
-                        first_child.setPixmap(pixmap)
-                    else:
-                        first_child.setText(item.name)
-                        
-                # 이름 라벨 (두 번째 자식)
-                if layout.count() > 1:
-                    name_label = layout.itemAt(1).widget()
-                    if name_label:
-                        name_label.setText(item.name)
+            frame_start = self.frame_stats.frame()
+            elapsed_ms = self.animation_clock.elapsed()
+            progress = min(1.0, elapsed_ms / self.animation_duration_ms)
+            position = self.animation_easing.valueForProgress(progress) * self.animation_total_steps
+            step = int(position)
+            
+            # 매 프레임 칸 사이 위치까지 부드럽게 이동 (릴은 미리 그린 띠를 복사만 함)
+            self.update_roulette_display(self._animation_start_offset + position)
+            self.animation_updates += 1
+            
+            if step != self._animation_last_step:
+                # 틱 소리 간격은 직전 칸 이동에 걸린 시간
+                self.tick_interval = max(0.001, (elapsed_ms - self._animation_last_step_ms) / 1000.0)
+                self._animation_last_step = step
+                self._animation_last_step_ms = elapsed_ms
                 
-                # 배율 라벨 (세 번째 자식)
-                if layout.count() > 2:
-                    multiplier_label = layout.itemAt(2).widget()
-                    if multiplier_label:
-                        multiplier_label.setText(getattr(item, 'multiplier', 'X1'))
-            
-            # UI 이벤트 처리 재개
-            QApplication.restoreOverrideCursor()
-            
-            # 부드러운 애니메이션을 위한 필수 이벤트 처리
-            QApplication.processEvents()
+                self.animation_offset = (self._animation_start_offset + step) % len(self.selected_items)
+                if self.play_tick_sound():
+                    self.frame_stats.tick_played(frame_start)
             
+            if progress >= 1.0:
+                self.animation_timer.stop()
+                selected_index = self.animation_result_index
+                log.info("총 %s번 업데이트됨, 최종 결과: %s", self.animation_updates, self.selected_items[selected_index].name)
+                self.report_frame_stats()
+                self.finish_roulette(selected_index)
+        
         except Exception as e:
-            print(f"UI 업데이트 오류: {e}")
-            QApplication.restoreOverrideCursor()
+            log.error("애니메이션 오류: %s", e)
+            self.animation_timer.stop()
+            self.finish_roulette(-1)
+
+    def report_frame_stats(self):
+        """이번 회전의 프레임 통계를 파일에 기록(기록 스레드)하고 요약 출력"""
+        report = self.frame_stats.end_spin(
+            profile=self.current_profile.name,
+            rotation_time_s=round(self.animation_duration_ms / 1000.0, 3),
+            item_count=len(self.selected_items),
+            slot_count=self.reel.slot_count,
+            queue_size=len(self.request_queue)
+        )
+        self.frame_stats.submit_report(report)
+        interval = report['interval_ms']
+        if interval['count']:
+            log.info("프레임 통계: %s프레임, %sfps, 끊김 %s프레임, 간격 p95 %.1fms / 최대 %.1fms",
+                     report['frames'], report['fps'], report['dropped_frames'], interval['p95'], interval['max'])
+
+    def update_roulette_display(self, offset):
+        """룰렛 UI 업데이트 - 항목 링(selected_items)의 offset 위치로 릴 이동 (소수면 칸 사이)"""
+        if self.selected_items:
+            self.reel.set_offset(offset)
             
     # finish_roulette 함수에 키 입력 시뮬레이션 추가
     def finish_roulette(self, selected_index):
         """룰렛 애니메이션 종료 및 결과 처리"""
         if selected_index < 0:
             # 오류 발생 또는 항목 없음
+            self.frame_stats.recording = False
+            self.engine.complete_request()
+            self.spin_result = None
             self.spin_button.setEnabled(True)
             self.settings_button.setEnabled(True)
             self.animation_active = False
@@ -2210,79 +2437,46 @@ class RouletteApp(QMainWindow):
             self.placeholder_spacer.show()  # 플레이스홀더 표시
             return
                 
-        # 선택된 인덱스 저장
-        self.selected_index = selected_index
-                
-        # 최종 배치 조정 (선택된 아이템이 중앙에 오도록)
-        final_items = []
-        center_idx = len(self.selected_items) // 2
-        
-        for i in range(len(self.selected_items)):
-            idx = (selected_index - center_idx + i) % len(self.selected_items)
-            final_items.append(self.selected_items[idx])
-        
-        # 최종 UI 업데이트
-        self.update_roulette_display(final_items)
-        
-        # 결과 알림 효과
-        fixed_slot_count = self.current_profile.display.fixed_slot_count
-        if fixed_slot_count > 0 and fixed_slot_count < len(self.selected_items):
-            # 고정 슬롯 모드에서는 항상 중앙 위젯이 선택됨
-            center_widget_idx = fixed_slot_count // 2
-            if center_widget_idx < len(self.item_widgets):
-                selected_widget = self.item_widgets[center_widget_idx]
-            else:
-                selected_widget = self.item_widgets[0] if self.item_widgets else None
-        else:
-            # 모든 항목 표시 모드에서는 선택된 항목의 인덱스 사용
-            center_idx = len(self.selected_items) // 2
-            selected_idx = (selected_index - center_idx) % len(self.item_widgets)
-            selected_widget = self.item_widgets[selected_idx] if 0 <= selected_idx < len(self.item_widgets) else None
-        
-        # 선택된 위젯 강조 후, 완료 소리 재생
-        if selected_widget:
-            selected_widget.setStyleSheet("background-color: rgba(100, 150, 100, 200); border: 3px solid gold;")
-            selected_widget.update()
+        # 당첨 항목을 중앙에 표시하고 강조
+        self.highlight_result(selected_index)
         
         # 완료 소리 재생
         self.play_finish_sound()
         
-        selected_item = self.selected_items[selected_index]
-        print(f"최종 선택 항목: {selected_item.name}, 배율: {selected_item.multiplier}")
-
-        # 배율 가져오기 (반복 횟수로 사용)
-        try:
-            repeat_count = int(selected_item.multiplier.replace('X', ''))
-        except (ValueError, AttributeError):
-            repeat_count = 1
-
-        # 키 입력 시뮬레이션 (선택된 항목에 키가 지정되어 있는 경우)
-        if hasattr(selected_item, 'key_press') and selected_item.key_press:
-            threading.Thread(target=self.simulate_key_press, 
-                        args=(selected_item.key_press, repeat_count)).start()
+        if self.spin_result.batch:
+            self.show_batch_summary(self.spin_result.batch_items())
         
-        # MCRCON 명령어 실행
-        if self.current_profile.mcrcon.enabled and selected_item.command:
-            threading.Thread(target=self.execute_mcrcon_command, 
-                        args=(selected_item.command,)).start()
-        
-        # 웹훅 전송
-        if self.current_profile.webhook.enabled:
-            threading.Thread(target=self.send_webhook_notification, 
-                        args=(selected_item,)).start()
+        # 키 입력, MCRCON, 웹훅 실행 후 요청 완료 (엔진)
+        self.engine.finish_spin(self.spin_result)
+        self.spin_result = None
         
         # 버튼 다시 활성화
         self.spin_button.setEnabled(True)
         self.settings_button.setEnabled(True)
         self.animation_active = False
         
-        # 다음 요청이 있는지 확인
-        has_next_request = len(self.request_queue) > 0
-        
-        # 다음 요청이 있으면 프레임을 숨기지 않고 1초 후 다음 요청 처리
-        if has_next_request:
-            print(f"다음 요청 준비 중... (남은 요청: {len(self.request_queue)})")
-            QTimer.singleShot(1000, self.process_next_request)
+        self.schedule_next_request()
+
+    def highlight_result(self, selected_index):
+        """당첨 항목이 중앙에 오도록 표시하고 해당 슬롯을 강조"""
+        # 선택된 인덱스 저장
+        self.selected_index = selected_index
+                
+        # 최종 배치 조정 (선택된 아이템이 중앙에 오도록)
+        center_idx = len(self.selected_items) // 2
+        self.animation_offset = (selected_index - center_idx) % len(self.selected_items)
+        
+        # 최종 UI 업데이트 후 가운데 칸(당첨 항목) 강조
+        self.update_roulette_display(self.animation_offset)
+        self.reel.set_state(RouletteReel.RESULT)
+
+    def schedule_next_request(self):
+        """다음 요청이 있으면 잠시 후 처리하고, 없으면 4초 후 룰렛을 숨김"""
+        # 다음 요청이 있으면 프레임을 숨기지 않고 잠시 후 다음 요청 처리 (대기 요청이 많을수록 짧게)
+        if self.request_queue:
+            delay_ms = self.engine.next_spin_delay_ms()
+            log.info("다음 요청 준비 중... (남은 요청: %s, %sms 후 시작)", len(self.request_queue), delay_ms)
+            QTimer.singleShot(delay_ms, self.process_next_request)
         else:
             # 다음 요청이 없을 때만 4초 후 룰렛 프레임과 인디케이터 숨기기
             if self.hide_timer is not None:
@@ -2295,7 +2489,57 @@ class RouletteApp(QMainWindow):
             self.hide_timer.setSingleShot(True)
             self.hide_timer.timeout.connect(self.hide_elements)
             self.hide_timer.start(4000)  # 4초로 변경
-            print("4초 후 요소를 숨기도록 예약됨")
+            log.debug("4초 후 요소를 숨기도록 예약됨")
+
+    def resolve_queued_instantly(self):
+        """대기 요청이 즉시 처리 기준 이상일 때 애니메이션 없이 추첨하고 결과를 요약 표시"""
+        results = self.engine.resolve_instantly()
+        log.info("빠른 처리: %s건, 남은 요청: %s", len(results), len(self.request_queue))
+        
+        if results:
+            # 마지막 결과를 룰렛에 표시하고, 처리한 요청을 한 줄로 요약
+            last = results[-1]
+            if self.selected_items and last.profile is self.current_profile:
+                self.highlight_result(last.item_index % len(self.selected_items))
+            self.show_instant_summary(results)
+        
+        if self.engine.current_request is not None:
+            # 대기 요청이 기준 아래로 줄어 남은 요청은 회전해서 처리
+            self.spin_roulette()
+        else:
+            self.schedule_next_request()
+
+    def show_instant_summary(self, results):
+        """빠른 처리 결과를 인디케이터에 요약 표시 (요청이 많으면 앞부분만)"""
+        try:
+            parts = []
+            for result in results[:INSTANT_SUMMARY_MAX_ENTRIES]:
+                nickname = (result.request.nickname if result.request else None) or "익명"
+                if result.batch:
+                    parts.append(f"{nickname}: " + " ".join(f"{item.name} x{hits}" for item, hits in result.batch_items()))
+                else:
+                    parts.append(f"{nickname}: {result.item.name}")
+            hidden = len(results) - len(parts)
+            if hidden > 0:
+                parts.append(f"외 {hidden}건")
+            self.indicator.setText(f"빠른 처리 {len(results)}건 - " + ", ".join(parts))
+            self.indicator.setWordWrap(True)
+            self.indicator.show()
+        except Exception as e:
+            log.error("빠른 처리 결과 표시 오류: %s", e)
+
+    def show_batch_summary(self, batch_results):
+        """일괄 추첨 결과를 인디케이터에 요약 표시"""
+        try:
+            total = sum(hits for _, hits in batch_results)
+            summary = ", ".join(f"{item.name} x{hits}" for item, hits in batch_results)
+            nickname = self.engine.last_nickname or "익명"
+            self.indicator.setText(f"{nickname} ({total}회): {summary}")
+            self.indicator.setWordWrap(True)
+            self.indicator.show()
+            log.info("일괄 추첨 결과 - %s (%s회): %s", nickname, total, summary)
+        except Exception as e:
+            log.error("일괄 결과 표시 오류: %s", e)
 
     def copy_profile_link(self):
         """프로필 링크 복사 (닉네임 매개변수 포함)"""
@@ -2303,8 +2547,8 @@ class RouletteApp(QMainWindow):
         profile_number = self.current_profile_index + 1
         
         # 현재 호스트와 포트 가져오기
-        host = "127.0.0.1"
-        port = 8080
+        host = SERVER_HOST
+        port = SERVER_PORT
         
         # URL 생성 (닉네임 매개변수 포함)
         url = f"http://{host}:{port}/r{profile_number}?nickname={{nickname}}"
@@ -2318,36 +2562,16 @@ class RouletteApp(QMainWindow):
                             f"프로필 '{self.current_profile.name}'의 URL이 클립보드에 복사되었습니다:\n{url}\n\n"
                             f"이 URL에서 'nickname=' 부분을 수정하여 사용자 닉네임을 지정할 수 있습니다.")
 
-    def add_roulette_request(self, profile_index, nickname=None):
-        """룰렛 요청을 큐에 추가하고 처리"""
-        # 최대 큐 크기 제한
-        MAX_QUEUE_SIZE = 15
-        
+    def add_roulette_request(self, profile_index, nickname=None, count=1, trace_id=None):
+        """룰렛 요청을 큐에 추가하고 처리 (count > 1이면 한 번의 회전으로 일괄 추첨, trace_id: HTTP 요청 추적 ID)"""
         # 만약 숨김 타이머가 활성화 상태라면 취소
         if self.hide_timer is not None and self.hide_timer.isActive():
-            print("요소 숨기기 타이머 취소됨 - 새 요청 감지")
+            log.debug("요소 숨기기 타이머 취소됨 - 새 요청 감지")
             self.hide_timer.stop()
             self.hide_timer = None
         
-        # 요청 객체 생성
-        request = RouletteRequest(profile_index, nickname)
-        
-        # 큐가 가득 찼을 때
-        if len(self.request_queue) >= MAX_QUEUE_SIZE:
-            print(f"요청 큐가 가득 찼습니다. 가장 오래된 요청을 제거합니다. (최대 {MAX_QUEUE_SIZE}개)")
-            self.request_queue.pop(0)  # 가장 오래된 요청 제거
-        
-        # 요청을 큐에 추가
-        self.request_queue.append(request)
-        queue_size = len(self.request_queue)
-        
-        # 닉네임이 있으면 로그에 표시, 없으면 익명으로 표시
-        nickname_display = nickname if nickname else "익명"
-        print(f"룰렛 요청 추가: 프로필 {profile_index+1}, 닉네임: {nickname_display}, 대기 중인 요청: {queue_size}")
-        
-        # 로그에 현재 시간 추가
-        current_time = time.strftime('%Y-%m-%d %H:%M:%S')
-        print(f"요청 시간: {current_time}")
+        # 요청을 큐에 추가 (큐가 가득 차면 가장 오래된 요청이 제거됨)
+        self.engine.submit_request(profile_index, nickname, count, request_id=trace_id)
         
         # 룰렛이 회전 중이 아니면 바로 실행
         if not self.animation_active:
@@ -2356,376 +2580,310 @@ class RouletteApp(QMainWindow):
     def process_next_request(self):
         """큐에서 다음 룰렛 요청을 처리 (같은 사용자의 요청은 연속해서)"""
         if not self.request_queue:
-            print("처리할 요청이 없습니다.")
+            log.debug("처리할 요청이 없습니다.")
             return
         
         if self.animation_active:
-            print("이미 애니메이션 실행 중, 3초 후 다시 시도합니다.")
+            log.debug("이미 애니메이션 실행 중, 3초 후 다시 시도합니다.")
             QTimer.singleShot(3000, self.process_next_request)
             return
         
-        # 직전 요청의 닉네임 기억 (연속성 처리용)
-        previous_nickname = self._last_nickname
-        
-        # 같은 사용자의 요청을 찾아서 우선 처리
-        next_index = 0
-        if previous_nickname:
-            for i, req in enumerate(self.request_queue):
-                if req.nickname == previous_nickname:
-                    next_index = i
-                    break
-        
-        # 선택된 요청 가져오기
-        next_request = self.request_queue.pop(next_index)
-        
-        profile_index = next_request.profile_index
-        nickname = next_request.nickname
-        
-        # 닉네임이 있으면 로그에 표시, 없으면 '익명'으로 표시
-        nickname_display = nickname if nickname else "익명"
-        print(f"처리 중인 요청: 프로필 {profile_index+1}, 닉네임: {nickname_display}")
-        
-        # 해당 프로필로 변경
-        if 0 <= profile_index < len(self.profiles):
-            if profile_index != self.current_profile_index:
-                self.current_profile_index = profile_index
-                self.current_profile = self.profiles[profile_index]
-                self.profile_combo.setCurrentIndex(profile_index)
-                self.update_roulette_items()
-        
-        # 닉네임 표시
-        self.update_indicator(nickname)
+        # 같은 사용자의 요청을 우선 꺼내고 해당 프로필로 변경 (프로필 변경, 닉네임 표시는 엔진 이벤트로)
+        self.engine.next_request()
 
         # 룰렛 프레임이 숨겨져 있으면 표시
         if not self.roulette_frame.isVisible():
             self.roulette_frame.show()
             self.placeholder_spacer.hide()  # 플레이스홀더 숨김
         
+        # 대기 요청이 많으면 애니메이션 없이 바로 처리 (빠른 진행 설정)
+        if self.engine.resolves_instantly():
+            self.resolve_queued_instantly()
+            return
+        
         # 룰렛 시작
         self.spin_roulette()
 
-    def execute_mcrcon_command(self, command):
-        """MCRCON 명령어 실행 (배율에 따라 반복 실행)"""
-        try:
-            mcrcon = self.current_profile.mcrcon
-            if not mcrcon.enabled or not command:
-                return
-            
-            # 선택된 항목 가져오기
-            selected_item = self.selected_items[self.selected_index]
-            
-            # 배율(반복 횟수) 가져오기
-            multiplier_str = getattr(selected_item, 'multiplier', 'X1')
-            try:
-                repeat_count = min(int(multiplier_str.replace('X', '')), 50)  # 최대 50회로 제한
-            except ValueError:
-                repeat_count = 1
-            
-            print(f"MCRCON 명령어 '{command}' {repeat_count}회 반복 실행 시작")
-            
-            def execute_commands():
-                try:
-                    with MCRcon(mcrcon.host, mcrcon.password, mcrcon.port) as mcr:
-                        for i in range(repeat_count):
-                            if i > 0 and i % 10 == 0:  # 10회마다 잠시 대기
-                                time.sleep(0.5)
-                            
-                            response = mcr.command(command)
-                            print(f"MCRCON 명령어 실행 결과 ({i+1}/{repeat_count}): {response}")
-                            # 적절한 지연
-                            time.sleep(0.1)
-                            
-                    print(f"MCRCON 명령어 {repeat_count}회 반복 실행 완료")
-                except Exception as e:
-                    print(f"MCRCON 명령어 실행 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            threading.Thread(target=execute_commands, daemon=True).start()
-                
-        except Exception as e:
-            print(f"MCRCON 명령어 실행 준비 오류: {e}")
-            
-    def send_webhook_notification(self, item):
-        """웹훅 알림 전송 (배율에 따라 반복 전송)"""
-        try:
-            webhook = self.current_profile.webhook
-            
-            # 항목별 웹훅 URL이 있으면 해당 URL 사용, 없으면 기본 URL 사용
-            webhook_url = item.webhook_url if hasattr(item, 'webhook_url') and item.webhook_url else webhook.url
-            
-            if not webhook.enabled or not webhook_url:
-                return
-            
-            # 배율(반복 횟수) 가져오기
-            multiplier_str = getattr(item, 'multiplier', 'X1')
-            try:
-                repeat_count = min(int(multiplier_str.replace('X', '')), 30)  # 최대 30회로 제한
-            except ValueError:
-                repeat_count = 1
-                
-            print(f"웹훅 알림 {repeat_count}회 반복 전송 시작")
-            
-            def send_webhooks():
-                try:
-                    
-                    username = webhook.username or "룰렛 봇"
-                    
-                    for i in range(repeat_count):
-                        # 웹훅 메시지 작성
-                        payload = {
-                            "content": f"룰렛 결과: **{item.name}** (반복 {i+1}/{repeat_count})",
-                            "username": username,
-                            "embeds": [
-                                {
-                                    "title": "룰렛 결과",
-                                    "description": f"**{item.name}** 항목이 선택되었습니다!",
-                                    "color": 5814783,  # 보라색
-                                    "fields": [
-                                        {
-                                            "name": "배율(반복 횟수)",
-                                            "value": multiplier_str,
-                                            "inline": True
-                                        },
-                                        {
-                                            "name": "확률",
-                                            "value": f"{item.probability}%",
-                                            "inline": True
-                                        }
-                                    ],
-                                    "footer": {
-                                        "text": f"제공: 턴스튜디오의 룰렛 시스템"
-                                    }
-                                }
-                            ]
-                        }
-                        
-                        # 현재 요청한 사용자의 닉네임이 있으면 추가
-                        if self._last_nickname:
-                            payload["embeds"][0]["fields"].append({
-                                "name": "요청자",
-                                "value": self._last_nickname,
-                                "inline": True
-                            })
-                        
-                        # 명령어가 있다면 추가
-                        if item.command:
-                            payload["embeds"][0]["fields"].append({
-                                "name": "명령어",
-                                "value": f"`{item.command}`"
-                            })
-                        
-                        # 아바타 URL 추가
-                        if webhook.avatar_url:
-                            payload["avatar_url"] = webhook.avatar_url
-                        
-                        # 웹훅 전송
-                        try:
-                            response = requests.post(webhook_url, json=payload, timeout=3)
-                            
-                            if response.status_code != 204:
-                                print(f"웹훅 전송 실패 ({i+1}/{repeat_count}): {response.status_code}")
-                            else:
-                                print(f"웹훅 전송 성공 ({i+1}/{repeat_count})")
-                        except requests.exceptions.RequestException as e:
-                            print(f"웹훅 요청 오류 ({i+1}/{repeat_count}): {e}")
-                        
-                        # 지연 시간 관리
-                        if i > 0 and i % 5 == 0:  # 5회마다 좀 더 긴 대기
-                            time.sleep(1.0)
-                        elif i < repeat_count - 1:
-                            time.sleep(0.3)
-                    
-                    print(f"웹훅 알림 {repeat_count}회 반복 전송 완료")
-                except Exception as e:
-                    print(f"웹훅 전송 처리 오류: {e}")
-            
-            # 별도 스레드에서 실행
-            threading.Thread(target=send_webhooks, daemon=True).start()
-                
-        except Exception as e:
-            print(f"웹훅 전송 준비 오류: {e}")
-    
     def closeEvent(self, event):
-        """창 닫힐 때 설정 저장"""
-        self.save_profiles()
+        """창 닫힐 때 설정 저장 및 남은 부가 작업 정리"""
+        self.save_timer.stop()
+        # 대기 중인 요청은 기록에 남아 다음 실행 때 복구됨
+        self.engine.shutdown()
         super().closeEvent(event)
 
-class RouletteHandler(BaseHTTPRequestHandler):
-    def extract_profile_and_params(self):
-        """URL에서 프로필 번호와 쿼리 파라미터 추출"""
-        import re
-        from urllib.parse import urlparse, parse_qs
-        
-        # URL 파싱
-        parsed_url = urlparse(self.path)
-        query_params = parse_qs(parsed_url.query)
-        
-        # 경로에서 프로필 번호 추출 (예: /r1 -> 1)
-        profile_match = re.match(r'/r(\d+)', parsed_url.path)
-        profile_number = int(profile_match.group(1)) if profile_match else None
-        
-        return profile_number, query_params
+# 받은 파일 기록 클래스
+class AssetManifest:
+    """다운로드한 파일의 출처(ETag, Last-Modified)와 내용(CRC32, 크기, 수정 시간)을 기록하는 목록
     
-    def do_GET(self):
+    파일이 기록과 같은지는 stat만으로 확인하므로, 바뀐 것이 없으면 파일을 다시 읽거나
+    쓰지 않습니다. 출처 기록은 다음 다운로드 때 조건부 요청(If-None-Match 등)에 사용합니다.
+    여러 스레드에서 함께 쓸 때는 lock을 잡고 읽고 고칩니다 (shared_asset_manifest 참고).
+    """
+    def __init__(self, path=ASSET_MANIFEST_FILE):
+        self.path = path
+        self.lock = threading.RLock()
+        self.sources = {}  # URL → {'etag', 'last_modified', 'files': [경로, ...]}
+        self.files = {}  # 경로 → {'crc', 'size', 'mtime_ns'}
+        self._changed = False
         try:
-            profile_number, query_params = self.extract_profile_and_params()
-            
-            if profile_number is not None:
-                # 닉네임 파라미터 추출 - 빈 문자열이면 None으로 처리
-                nickname = query_params.get('nickname', [''])[0] or None
-                
-                if hasattr(self.server, 'app') and self.server.app:
-                    profile_index = profile_number - 1
-                    # 룰렛 요청 추가 (닉네임 포함)
-                    self.server.app.add_roulette_request(profile_index, nickname)
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                
-                response_data = {
-                    'status': 'success',
-                    'message': '요청이 처리되었습니다.',
-                    'nickname': nickname or '익명'
-                }
-                self.wfile.write(json.dumps(response_data, ensure_ascii=False).encode('utf-8'))
-            else:
-                self.send_error(404, "경로를 찾을 수 없습니다")
-        except Exception as e:
-            print(f"GET 요청 처리 중 오류: {e}")
-            self.send_error(500, str(e))
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.sources = data.get('sources', {})
+            self.files = data.get('files', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            log.warning("다운로드 기록을 읽을 수 없어 새로 만듭니다: %s", e)
     
-    def do_POST(self):
+    def is_intact(self, path, crc=None, size=None):
+        """path가 기록된 그대로인지 확인 (crc, size를 주면 그 값과도 비교)"""
+        record = self.files.get(path)
+        if record is None:
+            return False
         try:
-            profile_number, query_params = self.extract_profile_and_params()
-            
-            if profile_number is not None:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                
-                # 닉네임 파라미터 추출 - 빈 문자열이면 None으로 처리
-                nickname = query_params.get('nickname', [''])[0] or None
-                
-                if hasattr(self.server, 'app') and self.server.app:
-                    profile_index = profile_number - 1
-                    # 룰렛 요청 추가 (닉네임 포함)
-                    self.server.app.add_roulette_request(profile_index, nickname)
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                
-                response_data = {
-                    'status': 'success',
-                    'message': '요청이 처리되었습니다.',
-                    'nickname': nickname or '익명',
-                    'queue_size': len(self.server.app.request_queue) if hasattr(self.server, 'app') else 0
-                }
-                self.wfile.write(json.dumps(response_data, ensure_ascii=False).encode('utf-8'))
-            else:
-                self.send_error(404, "경로를 찾을 수 없습니다")
-        except Exception as e:
-            print(f"POST 요청 처리 중 오류: {e}")
-            self.send_error(500, str(e))
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != record['size'] or stat.st_mtime_ns != record['mtime_ns']:
+            return False
+        if crc is not None and record['crc'] != crc:
+            return False
+        if size is not None and record['size'] != size:
+            return False
+        return True
     
-    # 로그 출력 방지
-    def log_message(self, format, *args):
-        return
-
-def start_server(app):
-    try:
-        server = HTTPServer(('127.0.0.1', 8080), RouletteHandler)
-        server.app = app  # 서버에 앱 참조 저장
-        
-        # 사용 가능한 URL 경로 표시
-        profile_count = len(app.profiles)
-        print(f"서버가 다음 URL에서 실행 중입니다:")
-        print(f"사용자: 턴스튜디오")
-        for i in range(profile_count):
-            profile_name = app.profiles[i].name
-            print(f"프로필 {i+1} ({profile_name}): http://127.0.0.1:8080/r{i+1}")
-            print(f"닉네임 지정: http://127.0.0.1:8080/r{i+1}?nickname={{nickname}}")
-            
-        server.serve_forever()
-    except OSError as e:
-        print(f"서버 실행 중 오류 발생: {e}")
-        print("다른 포트를 사용하려면 코드의 포트 번호를 변경하세요.")
-
-def main():
-    app = QApplication(sys.argv)
+    def conditional_headers(self, url, path=None):
+        """이전에 받은 파일(path를 주면 그 파일 포함)이 모두 그대로면 조건부 요청 헤더 반환"""
+        source = self.sources.get(url)
+        if not source or (path is not None and path not in source.get('files', [])):
+            return {}
+        if not all(self.is_intact(file_path) for file_path in source.get('files', [])):
+            return {}
+        headers = {}
+        if source.get('etag'):
+            headers['If-None-Match'] = source['etag']
+        if source.get('last_modified'):
+            headers['If-Modified-Since'] = source['last_modified']
+        return headers
     
-    # QTimer import 누락 방지
-    from PyQt5.QtCore import QTimer
+    def record_file(self, path, crc):
+        stat = os.stat(path)
+        self.files[path] = {'crc': crc, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        self._changed = True
     
-    # 스타일 설정
-    app.setStyle('Fusion')
-    def download_and_extract_images():
-        import requests
-        import zipfile
-        import os
-        from io import BytesIO
-        
-        # URL for the zip file
-        zip_url = "https://docs.google.com/uc?export=download&id=1gMJXIwkvcS6BmEbjD9JppHD9dtw2R80S"
-        
+    def record_source(self, url, response, files):
+        self.sources[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'files': list(files),
+        }
+        self._changed = True
+    
+    def save(self):
+        """바뀐 내용이 있으면 저장 (임시 파일 → 교체)"""
+        with self.lock:
+            if not self._changed:
+                return
+            temp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'sources': self.sources, 'files': self.files}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._changed = False
+
+_asset_manifest = None  # Qt 스레드와 다운로드 스레드가 함께 쓰는 기록 (처음 쓸 때 읽음)
+_asset_manifest_lock = threading.Lock()
+
+def shared_asset_manifest():
+    """기본 다운로드 기록 (한 번만 읽고 모든 스레드가 같은 객체를 사용)"""
+    global _asset_manifest
+    with _asset_manifest_lock:
+        if _asset_manifest is None:
+            _asset_manifest = AssetManifest()
+        return _asset_manifest
+
+def download_file(url, path, manifest=None):
+    """url의 파일을 path에 저장하고 HTTP 상태 코드를 반환 (바뀌지 않았으면 304, 파일은 그대로)"""
+    import requests
+    manifest = manifest or shared_asset_manifest()
+    with manifest.lock:
+        headers = manifest.conditional_headers(url, path)
+    with requests.get(url, stream=True, headers=headers) as response:
+        if response.status_code != 200:
+            return response.status_code
+        
+        # 같은 파일을 동시에 받는 경우를 위해 스레드별 임시 파일 사용
+        crc = 0
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
         try:
-            print("이미지 패키지 다운로드 중...")
-            # Download the zip file
-            response = requests.get(zip_url, stream=True)
-            
-            if response.status_code == 200:
-                # Extract the zip file in-memory
-                print("이미지 패키지 압축 해제 중...")
-                zip_data = BytesIO(response.content)
-                
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        crc = zlib.crc32(chunk, crc)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        with manifest.lock:
+            manifest.record_file(path, crc)
+            manifest.record_source(url, response, [path])
+            manifest.save()
+        return response.status_code
+
+def safe_image_target(entry_name, folder=IMAGE_FOLDER):
+    """zip 항목 이름을 이미지 폴더 안의 경로로 변환 (폴더 항목이나 폴더 밖을 가리키면 None)"""
+    # 폴더 구조는 무시하고 파일 이름만 사용 (Windows 형식 구분자 포함)
+    file_name = entry_name.replace('\\', '/').rsplit('/', 1)[-1]
+    if not file_name or file_name in ('.', '..') or '\0' in file_name or ':' in file_name:
+        return None
+    
+    root = os.path.realpath(folder)
+    target_path = os.path.join(folder, file_name)
+    if os.path.dirname(os.path.realpath(target_path)) != root:
+        return None  # 심볼릭 링크 등으로 폴더 밖을 가리키는 경우
+    return target_path
+
+def extract_zip_entry(zip_ref, file_info, target_path):
+    """zip 항목 하나를 조금씩 읽어 임시 파일에 풀고 교체 (여러 스레드에서 동시에 호출 가능)"""
+    import shutil
+    temp_path = f"{target_path}.{threading.get_ident()}.tmp"
+    try:
+        with zip_ref.open(file_info) as source, open(temp_path, "wb") as target:
+            shutil.copyfileobj(source, target, DOWNLOAD_CHUNK_SIZE)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def download_and_extract_images(progress=None, url=IMAGE_PACKAGE_URL, manifest=None,
+                                workers=IMAGE_EXTRACT_WORKERS):
+    """이미지 패키지(zip)를 받아 이미지 폴더에 풀기 (progress: 진행 메시지를 받을 함수)
+    
+    패키지는 메모리에 올리지 않고 임시 파일에 받은 뒤, 내용(CRC)이 달라진 항목만
+    workers개의 스레드로 나눠 조금씩 풀어 씁니다. 패키지가 바뀌지 않았으면(304) 아무것도 쓰지 않습니다.
+    """
+    import requests
+    import tempfile
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def report(message):
+        log.info("%s", message)
+        if progress:
+            progress(message)
+    
+    manifest = manifest or shared_asset_manifest()
+    try:
+        report("이미지 패키지 확인 중...")
+        # 이전에 받은 패키지가 그대로 있으면 조건부 요청
+        with manifest.lock:
+            headers = manifest.conditional_headers(url)
+        with requests.get(url, stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                report("이미지 패키지가 최신입니다.")
+            elif response.status_code == 200:
                 # Make sure images folder exists
                 if not os.path.exists(IMAGE_FOLDER):
                     os.makedirs(IMAGE_FOLDER)
-                    print(f"'{IMAGE_FOLDER}' 폴더 생성됨")
+                    log.info("'%s' 폴더 생성됨", IMAGE_FOLDER)
                 
-                with zipfile.ZipFile(zip_data) as zip_ref:
-                    # Extract all contents into the images folder, overwriting existing files
-                    for file_info in zip_ref.infolist():
-                        try:
-                            # Get filename without directory structure
-                            file_name = os.path.basename(file_info.filename)
-                            
-                            # Skip if it's a directory entry
-                            if not file_name:
+                # 임시 파일에 받기 (메모리 사용량은 청크 크기로 제한)
+                with tempfile.TemporaryFile() as spool:
+                    total = int(response.headers.get('Content-Length', 0) or 0)
+                    received = 0
+                    last_percent = -1
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        spool.write(chunk)
+                        received += len(chunk)
+                        if total:
+                            percent = received * 100 // total
+                            if percent // 10 != last_percent // 10:  # 10% 단위로 표시
+                                last_percent = percent
+                                report(f"이미지 패키지 다운로드 중... {percent}%")
+                    spool.seek(0)
+                    
+                    report("이미지 패키지 압축 해제 중...")
+                    extracted_files = []
+                    jobs = []  # (항목, 대상 경로) - 새로 풀어야 하는 항목
+                    with zipfile.ZipFile(spool) as zip_ref:
+                        for file_info in zip_ref.infolist():
+                            if file_info.is_dir():
                                 continue
-                                
-                            # Set target path in the images folder
-                            target_path = os.path.join(IMAGE_FOLDER, file_name)
-                            
-                            # Extract the file (will overwrite if exists)
-                            with zip_ref.open(file_info) as source, open(target_path, "wb") as target:
-                                target.write(source.read())
-                                
-                            print(f"파일 추출: {file_name} → {target_path}")
-                        except Exception as e:
-                            print(f"파일 추출 오류 ({file_info.filename}): {e}")
+                            target_path = safe_image_target(file_info.filename, IMAGE_FOLDER)
+                            if target_path is None:
+                                log.warning("잘못된 경로의 항목을 건너뜁니다: %s", file_info.filename)
+                                continue
+                            extracted_files.append(target_path)
                             
-                print("이미지 패키지 설치 완료!")
-            else:
-                print(f"다운로드 실패: 상태 코드 {response.status_code}")
+                            # 이미 같은 내용(CRC, 크기)으로 풀어둔 파일은 건너뜀
+                            if not manifest.is_intact(target_path, crc=file_info.CRC, size=file_info.file_size):
+                                jobs.append((file_info, target_path))
+                        
+                        def extract(job):
+                            file_info, target_path = job
+                            try:
+                                extract_zip_entry(zip_ref, file_info, target_path)
+                                log.debug("파일 추출: %s → %s", file_info.filename, target_path)
+                                return True
+                            except Exception as e:
+                                log.error("파일 추출 오류 (%s): %s", file_info.filename, e)
+                                return False
+                        
+                        if workers > 1 and len(jobs) > 1:
+                            with ThreadPoolExecutor(max_workers=workers) as pool:
+                                results = list(pool.map(extract, jobs))
+                        else:
+                            results = [extract(job) for job in jobs]
                 
-        except Exception as e:
-            print(f"이미지 패키지 다운로드/설치 오류: {e}")
+                # 기록은 메인 작업 스레드에서 한 번에 갱신
+                written = 0
+                with manifest.lock:
+                    for (file_info, target_path), ok in zip(jobs, results):
+                        if ok:
+                            manifest.record_file(target_path, file_info.CRC)
+                            written += 1
+                    manifest.record_source(url, response, extracted_files)
+                    manifest.save()
+                report(f"이미지 패키지 설치 완료! (변경된 파일 {written}개)")
+            else:
+                report(f"다운로드 실패: 상태 코드 {response.status_code}")
+    except Exception as e:
+        report(f"이미지 패키지 다운로드/설치 오류: {e}")
 
-    # 디버깅 메시지 출력
-    print("룰렛 애플리케이션 시작 중...")
-    download_and_extract_images()
+def main():
+    app = QApplication(sys.argv)
+    
+    # QTimer import 누락 방지
+    from PyQt5.QtCore import QTimer
+    
+    # 스타일 설정
+    app.setStyle('Fusion')
+    # 로그는 전용 스레드에서 파일/콘솔로 기록 (화면 갱신과 HTTP 처리를 막지 않음)
+    setup_logging()
+    log.info("룰렛 애플리케이션 시작 중...")
     # 메인 윈도우 생성
     window = RouletteApp()
+    if not FAST_START:
+        # 다운로드가 끝난 뒤 창 표시 (이전 방식)
+        window.start_asset_downloads(background=False)
     window.show()
-    print("메인 윈도우가 표시되었습니다.")
+    log.info("메인 윈도우가 표시되었습니다.")
     
     # HTTP 서버 시작 (별도 스레드에서)
     server_thread = threading.Thread(target=start_server, args=(window,), daemon=True)
     server_thread.start()
     
+    if FAST_START:
+        # 창과 서버가 준비된 뒤 백그라운드에서 다운로드
+        window.start_asset_downloads(background=True)
+    
     # 애플리케이션 실행
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    stop_logging()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,2504 @@
+"""룰렛 엔진 - Qt 없이 동작하는 요청 큐, 확률 추첨, 프로필 저장소, 부가 작업 처리
+
+룰렛 창(mainf.py)은 RouletteEngine의 이벤트를 받아 화면만 그립니다.
+`python roulette_engine.py`로 실행하면 창 없이 HTTP 요청만 받아 바로 추첨하는
+서버로 동작합니다 (애니메이션과 소리 없음).
+"""
+import os
+import time
+import random
+import json
+import threading
+import queue
+import uuid
+import sqlite3
+import logging
+import logging.handlers
+from collections import deque, Counter, OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# requests, mcrcon, keyboard는 시작 시간을 줄이기 위해 처음 사용할 때 불러옴
+
+# MCRCON 라이브러리가 설치되지 않은 경우 사용할 대체 클래스
+class MissingMCRcon:
+    def __init__(self, host, password, port=25575):
+        self.host = host
+        self.password = password
+        self.port = port
+    
+    def connect(self):
+        log.warning("MCRCON 라이브러리가 설치되지 않았습니다. pip install mcrcon 명령으로 설치해주세요.")
+        log.info("MCRCON 연결 시도: %s:%s", self.host, self.port)
+    
+    def command(self, cmd):
+        log.info("MCRCON 명령어 실행 (라이브러리 없음): %s", cmd)
+        return "MCRCON 라이브러리가 설치되지 않아 명령을 실행할 수 없습니다."
+    
+    def __enter__(self):
+        self.connect()
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+    
+    def disconnect(self):
+        pass
+
+_mcrcon_class = None
+
+def get_mcrcon_class():
+    """mcrcon 라이브러리의 MCRcon 클래스 (설치 필요: pip install mcrcon, 없으면 대체 클래스)"""
+    global _mcrcon_class
+    if _mcrcon_class is None:
+        try:
+            from mcrcon import MCRcon
+            _mcrcon_class = MCRcon
+        except ImportError:
+            _mcrcon_class = MissingMCRcon
+    return _mcrcon_class
+
+# 기본 폴더 설정
+CONFIG_FOLDER = "config"
+IMAGE_FOLDER = "images"
+SOUND_FOLDER = "sounds"  # 소리 파일 저장할 폴더 추가
+DEFAULT_CONFIG_FILE = os.path.join(CONFIG_FOLDER, "profile_1.json")
+DEFAULT_SOUND_URL = "https://cdn.dpvm.xyz/sound.mp3"  # 기본 소리 URL
+DEFAULT_SOUND_FILE = os.path.join(SOUND_FOLDER, "default_sound.mp3")  # 기본 소리 파일 경로
+DEFAULT_TICK_SOUND_URL = "https://docs.google.com/uc?export=download&id=15No95c9IjxJCbP_2xx6UKRY3uhNbyCPZ"  # 기본 틱 소리 URL (없으면 생성해야 함)
+DEFAULT_TICK_SOUND_FILE = os.path.join(SOUND_FOLDER, "tick.mp3")  # 기본 틱 소리 파일 경로
+DEFAULT_FINISH_SOUND_URL = "https://docs.google.com/uc?export=download&id=1UbFAUtkoUjj6L_rvMffuSq2B-N0p2nCH"  # 완료 소리 URL
+DEFAULT_FINISH_SOUND_FILE = os.path.join(SOUND_FOLDER, "finish.mp3")  # 완료 소리 파일 경로
+
+# HTTP 서버 설정
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8080
+SERVER_MAX_WORKERS = 32  # 동시에 처리할 최대 연결 수
+SERVER_LISTEN_BACKLOG = 128  # 대기 가능한 연결 수 (listen backlog)
+SERVER_KEEP_ALIVE_TIMEOUT = 5.0  # keep-alive 연결 유휴 시간 제한 (초)
+
+# 요청 큐 설정
+MAX_QUEUE_SIZE = 15  # 최대 대기 요청 수 (초과 시 가장 오래된 요청 제거)
+MAX_BATCH_COUNT = 100  # 한 번의 요청으로 추첨할 수 있는 최대 횟수 (count 파라미터)
+REQUEST_JOURNAL_FILE = os.path.join(CONFIG_FOLDER, "request_journal.log")  # 요청 큐 기록 파일 (재시작 시 복구)
+REQUEST_JOURNAL_COMPACT_RECORDS = 1000  # 완료/제거된 요청이 이만큼 쌓이면 남은 요청만으로 기록 파일을 새로 씀
+NEXT_SPIN_DELAY_MS = 1000  # 회전이 끝난 뒤 다음 요청을 시작하기까지 기다리는 시간 (빠른 진행 배율 적용 전)
+
+# 빠른 진행 설정 (대기 요청이 많을 때 회전 시간과 다음 요청까지의 대기 시간을 줄임)
+TURBO_DEFAULT_CURVE = ((0, 1.0), (2, 0.7), (5, 0.4), (10, 0.2))  # (대기 요청 수, 배율) - 점 사이는 직선 보간
+TURBO_MIN_ROTATION_TIME = 0.8  # 빠른 진행 중 최소 회전 시간 (초)
+
+# 프로필 저장 설정
+PROFILE_DB_FILE = os.path.join(CONFIG_FOLDER, "profiles.db")  # 모든 프로필을 담는 SQLite 파일
+
+# MCRCON 설정
+MCRCON_DEFAULT_RATE_LIMIT = 100.0  # 초당 최대 명령어 수 (0 = 제한 없음)
+MCRCON_RATE_BURST = 50  # 속도 제한 없이 연속으로 보낼 수 있는 명령어 수 (X50 결과 하나는 기다리지 않고 전송)
+MCRCON_SEND_ATTEMPTS = 2  # 연결이 끊겼을 때 재연결 후 다시 보내는 횟수 포함 시도 횟수
+MCRCON_CLOSE_TIMEOUT = 1.0  # 종료 시 진행 중인 전송이 멈추기를 기다리는 최대 시간 (초)
+
+# 웹훅 전송 설정
+WEBHOOK_MAX_WORKERS = 4  # 웹훅 전송 스레드 수 (요청이 몰려도 이 이상 늘지 않음)
+WEBHOOK_MAX_RETRIES = 5  # 429/5xx/연결 오류 시 재시도 횟수
+WEBHOOK_TIMEOUT = 3  # 요청 타임아웃 (초)
+WEBHOOK_DELIVERY_BUDGET = 30.0  # 한 번의 전송(메시지 여러 건)에서 재시도 대기에 쓸 수 있는 최대 시간 (초)
+
+# 부가 작업(키 입력, MCRCON, 웹훅) 실행 설정
+SIDE_EFFECT_LIMITS = {
+    'key': 1,  # 키 입력은 겹치지 않도록 하나씩
+    'mcrcon': 2,
+    'webhook': WEBHOOK_MAX_WORKERS,
+}
+SIDE_EFFECT_SHUTDOWN_TIMEOUT = 5.0  # 종료 시 남은 작업을 기다리는 최대 시간 (초)
+
+# 운영 지표(/metrics) 설정 - 히스토그램 구간 상한 (초)
+METRICS_QUEUE_WAIT_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+METRICS_SPIN_DURATION_BUCKETS = (0.1, 0.5, 1, 2, 3, 5, 7.5, 10, 15)
+METRICS_SIDE_EFFECT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+METRICS_SHARD_SWEEP_THRESHOLD = 64  # 조각이 이만큼 쌓이면 새 조각을 등록할 때 끝난 스레드의 조각을 정리
+
+# 요청 추적 설정
+TRACE_BUFFER_SIZE = 512  # 단계별 시각을 보관할 최근 요청 수 (/traces)
+TRACE_QUERY_LIMIT = 50  # /traces 기본 반환 개수
+
+# 로그 설정
+LOG_LEVEL = "INFO"  # DEBUG로 바꾸면 추첨/전송마다 자세한 로그를 남김 (낮은 수준의 로그는 메시지를 만들지 않고 버림)
+LOG_FILE = os.path.join(CONFIG_FOLDER, "roulette.log")  # JSON 한 줄씩 기록하는 로그 파일
+LOG_MAX_BYTES = 2 * 1024 * 1024  # 로그 파일이 이 크기를 넘으면 .1, .2 ...로 옮기고 새로 시작
+LOG_BACKUP_COUNT = 3  # 보관할 이전 로그 파일 수
+LOG_CONSOLE = True  # 콘솔에도 출력 (파일과 마찬가지로 로그 스레드에서 출력)
+
+# 엔진과 룰렛 창이 함께 쓰는 로거 (setup_logging() 전에는 경고 이상만 stderr로 출력)
+log = logging.getLogger("roulette")
+_log_listener = None
+
+# JSON 로그 형식
+class JsonLogFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 변환 (extra로 넘긴 trace_id 등도 함께 기록)"""
+    _RECORD_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+    
+    def format(self, record):
+        entry = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self._RECORD_FIELDS:
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def setup_logging(level=LOG_LEVEL, path=LOG_FILE, console=LOG_CONSOLE):
+    """로그를 큐에 넣고 전용 스레드에서 파일(JSON, 크기별 교체)과 콘솔로 기록하도록 설정
+    
+    로그를 남기는 Qt/HTTP/부가 작업 스레드는 큐에 넣기만 하므로 콘솔과 파일 입출력을
+    기다리지 않습니다. 여러 번 호출해도 한 번만 설정됩니다.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return log
+    
+    handlers = []
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+        file_handler.setFormatter(JsonLogFormatter())
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"로그 파일을 열 수 없습니다: {e}")
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(console_handler)
+    
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(level)
+    log.propagate = False
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    return log
+
+def stop_logging():
+    """남은 로그를 모두 기록하고 로그 스레드 종료"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+    log.propagate = True
+
+# 운영 지표 클래스 (/metrics, Prometheus 텍스트 형식)
+class Metrics:
+    """카운터와 히스토그램을 스레드별 조각에 기록하고 수집할 때 합산하는 지표 저장소
+    
+    각 스레드는 자기 조각(사전)만 수정하므로 기록할 때 잠금이 없고, render()는 조각을
+    복사해서 합산하므로 Qt/엔진 스레드를 기다리지 않습니다. 연결마다 생기는 HTTP
+    스레드처럼 잠깐 쓰는 스레드는 끝날 때 retire_thread()로 조각을 누적값에 합치고,
+    그 밖의 끝난 스레드 조각은 render()나 조각이 많이 쌓였을 때 정리합니다. 게이지는 render()에서 등록된 함수를
+    호출해 읽으므로 len()처럼 다른 스레드에서 읽어도 안전한 값만 반환해야 합니다.
+    """
+    def __init__(self):
+        self._definitions = {}  # 이름 → (종류, 설명, 히스토그램 구간)
+        self._gauges = {}  # 이름 → (설명, 함수)
+        self._shards = []  # (스레드, 조각) - 조각: (이름, 레이블) → 값
+        self._retired = {}  # 끝난 스레드의 값
+        self._lock = threading.Lock()  # 조각 등록/정리에만 사용
+        self._local = threading.local()
+    
+    def counter(self, name, help_text):
+        self._definitions[name] = ('counter', help_text, None)
+    
+    def histogram(self, name, help_text, buckets):
+        self._definitions[name] = ('histogram', help_text, tuple(buckets))
+    
+    def gauge(self, name, help_text, func):
+        """func()은 숫자 또는 [(레이블 사전, 값), ...]을 반환"""
+        self._gauges[name] = (help_text, func)
+    
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                if len(self._shards) >= METRICS_SHARD_SWEEP_THRESHOLD:
+                    self._sweep()
+                self._shards.append((threading.current_thread(), shard))
+            self._local.shard = shard
+        return shard
+    
+    def retire_thread(self):
+        """현재 스레드의 조각을 누적값에 합치고 등록 해제 (스레드가 끝나기 직전에 호출)"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            return
+        self._local.shard = None
+        with self._lock:
+            self._shards = [entry for entry in self._shards if entry[1] is not shard]
+            self._merge(self._retired, shard)
+    
+    def _sweep(self):
+        # 끝난 스레드의 조각을 누적값에 합침 (_lock을 잡은 상태에서 호출)
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                self._merge(self._retired, shard)
+        self._shards = alive
+    
+    def inc(self, name, amount=1, **labels):
+        """카운터 증가"""
+        shard = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+        shard[key] = shard.get(key, 0) + amount
+    
+    def observe(self, name, value, **labels):
+        """히스토그램에 값 기록"""
+        buckets = self._definitions[name][2]
+        shard = self._shard()
+        key = (name, tuple(sorted(labels.items())))
+        data = shard.get(key)
+        if data is None:
+            data = shard[key] = [0] * (len(buckets) + 2)  # 구간별 개수, 합계, 전체 개수
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                data[i] += 1
+                break
+        data[-2] += value
+        data[-1] += 1
+    
+    @staticmethod
+    def _merge(target, shard):
+        for key, value in list(shard.items()):
+            if isinstance(value, list):
+                current = target.get(key)
+                if current is None:
+                    target[key] = list(value)
+                else:
+                    for i, part in enumerate(value):
+                        current[i] += part
+            else:
+                target[key] = target.get(key, 0) + value
+    
+    def snapshot(self):
+        """모든 스레드의 값을 합산한 사전 ((이름, 레이블) → 값)"""
+        with self._lock:
+            self._sweep()
+            alive = self._shards
+            totals = {}
+            self._merge(totals, self._retired)
+        for _, shard in alive:
+            self._merge(totals, shard)
+        return totals
+    
+    @staticmethod
+    def _labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ""
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                   for _, value in pairs)
+        return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+    
+    def render(self):
+        """Prometheus 텍스트 형식(0.0.4)으로 출력"""
+        totals = self.snapshot()
+        by_name = {}
+        for (name, labels), value in totals.items():
+            by_name.setdefault(name, []).append((labels, value))
+        
+        lines = []
+        for name, (kind, help_text, buckets) in self._definitions.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            samples = sorted(by_name.get(name, []))
+            if kind == 'counter':
+                if not samples:
+                    lines.append(f"{name} 0")
+                for labels, value in samples:
+                    lines.append(f"{name}{self._labels(labels)} {value:g}")
+            else:
+                for labels, data in samples:
+                    cumulative = 0
+                    for bound, count in zip(buckets, data):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{self._labels(labels, [('le', f'{bound:g}')])} {cumulative}")
+                    lines.append(f"{name}_bucket{self._labels(labels, [('le', '+Inf')])} {data[-1]}")
+                    lines.append(f"{name}_sum{self._labels(labels)} {data[-2]:g}")
+                    lines.append(f"{name}_count{self._labels(labels)} {data[-1]}")
+        
+        for name, (help_text, func) in self._gauges.items():
+            try:
+                value = func()
+            except Exception as e:
+                log.warning("지표 읽기 오류 (%s): %s", name, e)
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            if isinstance(value, (int, float)):
+                lines.append(f"{name} {value:g}")
+            else:
+                for labels, sample in value:
+                    lines.append(f"{name}{self._labels(sorted(labels.items()))} {sample:g}")
+        return "\n".join(lines) + "\n"
+
+# 모든 스레드가 공유하는 지표 저장소
+metrics = Metrics()
+metrics.counter('roulette_requests_total', "프로필별로 큐에 추가된 룰렛 요청 수")
+metrics.counter('roulette_queue_evictions_total', "대기 큐가 가득 차서 처리하지 못하고 제거된 요청 수")
+metrics.histogram('roulette_queue_wait_seconds', "요청이 큐에 들어온 뒤 처리를 시작하기까지 기다린 시간",
+                  METRICS_QUEUE_WAIT_BUCKETS)
+metrics.histogram('roulette_spin_duration_seconds', "추첨 시작부터 결과 처리까지 걸린 시간 (애니메이션 포함)",
+                  METRICS_SPIN_DURATION_BUCKETS)
+metrics.histogram('roulette_side_effect_seconds', "부가 작업(키 입력, MCRCON, 웹훅) 실행 시간",
+                  METRICS_SIDE_EFFECT_BUCKETS)
+metrics.counter('roulette_side_effect_failures_total', "실패한 부가 작업 수")
+metrics.counter('roulette_http_requests_total', "경로와 상태 코드별 HTTP 요청 수")
+
+# 요청 추적 기록 클래스
+class TraceLog:
+    """요청별 처리 단계 시각을 최근 size개까지 보관하는 링 버퍼
+    
+    추적 ID는 요청 ID(RouletteRequest.request_id)를 그대로 사용하며, HTTP로 받은
+    요청은 받은 시점에 ID를 만들어 응답으로 돌려줍니다. 단계 기록은 HTTP, 엔진,
+    부가 작업 스레드에서 호출되므로 짧은 잠금으로 보호합니다.
+    
+    단계: received, enqueued, restored, evicted, dequeued, spin_start, result,
+    {key,mcrcon,webhook}_delivered, {key,mcrcon,webhook}_failed
+    """
+    def __init__(self, size=TRACE_BUFFER_SIZE):
+        self.size = size
+        self._traces = OrderedDict()  # 추적 ID → {'info': {...}, 'stages': [(단계, 시각), ...]}
+        self._lock = threading.Lock()
+    
+    def record(self, trace_id, stage, **info):
+        """trace_id의 단계 시각 기록 (info는 요청 정보로 함께 저장)"""
+        if not trace_id:
+            return
+        now = time.time()
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                trace = self._traces[trace_id] = {'info': {}, 'stages': []}
+                if len(self._traces) > self.size:
+                    self._traces.popitem(last=False)
+            trace['stages'].append((stage, now))
+            if info:
+                trace['info'].update(info)
+    
+    def get(self, trace_id):
+        """추적 기록 하나 (없으면 None)"""
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            return self._format(trace_id, trace) if trace is not None else None
+    
+    def recent(self, limit=50):
+        """최근 추적 기록 (새 요청부터)"""
+        with self._lock:
+            items = list(self._traces.items())[-limit:] if limit > 0 else []
+            return [self._format(trace_id, trace) for trace_id, trace in reversed(items)]
+    
+    @staticmethod
+    def _format(trace_id, trace):
+        stages = trace['stages']
+        start = stages[0][1]
+        return dict(trace['info'],
+                    trace_id=trace_id,
+                    started_at=time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(start)),
+                    total_ms=round((stages[-1][1] - start) * 1000, 1),
+                    stages=[{'stage': stage, 'elapsed_ms': round((at - start) * 1000, 1)}
+                            for stage, at in stages])
+
+# 모든 스레드가 공유하는 요청 추적 기록
+traces = TraceLog()
+
+# 룰렛 요청 정보를 저장하는 클래스
+class RouletteRequest:
+    """룰렛 요청 정보를 저장하는 클래스"""
+    def __init__(self, profile_index, nickname=None, count=1, request_id=None, timestamp=None):
+        self.profile_index = profile_index
+        self.nickname = nickname  # None이면 닉네임 없음
+        self.count = count  # 한 번에 추첨할 횟수 (일괄 요청)
+        self.request_id = request_id or uuid.uuid4().hex  # 기록 파일에서 요청을 구분하는 ID
+        self.timestamp = timestamp if timestamp is not None else time.time()
+    
+    def __str__(self):
+        nickname_display = self.nickname if self.nickname else "익명"
+        count_display = f", {self.count}회" if self.count > 1 else ""
+        return f"요청: 프로필 {self.profile_index+1}, 닉네임: {nickname_display}{count_display}"
+
+# 요청 큐 기록(저널) 클래스
+class RequestJournal:
+    """룰렛 요청의 추가/처리 시작/완료/제거를 파일 끝에 이어 쓰는 기록
+    
+    기록은 전용 스레드가 모아서 한 번에 쓰고 fsync하므로(그룹 커밋) 요청 추가는
+    큐에 넣는 즉시 반환됩니다. 프로그램이 비정상 종료되어도 open()으로 기록을 다시 읽어
+    완료되지 않은 요청(처리 중이던 요청 포함)을 복구할 수 있습니다.
+    쓰기 스레드는 남은 요청을 기억해 두었다가, 완료/제거된 요청이 compact_records개
+    쌓이면 남은 요청만으로 파일을 새로 쓰므로 오래 실행해도 파일이 커지지 않습니다.
+    """
+    def __init__(self, path=REQUEST_JOURNAL_FILE, compact_records=REQUEST_JOURNAL_COMPACT_RECORDS):
+        self.path = path
+        self.compact_records = compact_records
+        self._queue = queue.Queue()
+        self._file = None
+        self._thread = None
+        self._live = {}  # 남은 요청 ID → [추가 기록 줄, 처리 시작 기록 줄 또는 None] (쓰기 스레드 전용)
+        self._finished = 0  # 마지막 정리 이후 완료/제거된 요청 수
+    
+    def open(self):
+        """기록을 읽어 완료되지 않은 요청 목록을 반환하고, 기록 파일을 정리한 뒤 쓰기 시작"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        pending = self._replay()
+        
+        # 남은 요청만 담아 파일을 새로 씀
+        self._live = {request.request_id: [self._encode('enqueue', request)[2], None] for request in pending}
+        self._compact()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="request-journal")
+        self._thread.start()
+        return pending
+    
+    def enqueue(self, request):
+        self._queue.put(self._encode('enqueue', request))
+    
+    def dequeue(self, request):
+        """요청 처리 시작 (완료 전에 종료되면 다음 실행 때 다시 처리)"""
+        self._queue.put(self._encode('dequeue', request))
+    
+    def complete(self, request):
+        self._queue.put(self._encode('complete', request))
+    
+    def drop(self, request):
+        """회전 없이 버려진 요청 (큐가 가득 차서 제거된 경우 등)"""
+        self._queue.put(self._encode('drop', request))
+    
+    def _compact(self):
+        """남은 요청만 담아 파일을 새로 씀 (임시 파일 → 교체, 쓰기 스레드나 시작 전에만 호출)"""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for lines in self._live.values():
+                f.write("".join(line for line in lines if line))
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+        try:
+            os.replace(temp_path, self.path)
+        finally:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._finished = 0
+    
+    def close(self):
+        """남은 기록을 모두 쓰고 파일 닫기"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._file.close()
+    
+    @staticmethod
+    def _encode(op, request):
+        """(작업, 요청 ID, 기록 줄) - 쓰기 스레드가 기록 줄을 다시 해석하지 않도록 함께 전달"""
+        record = {'op': op, 'id': request.request_id}
+        if op == 'enqueue':
+            record.update(profile=request.profile_index, nickname=request.nickname,
+                          count=request.count, ts=request.timestamp)
+        return op, request.request_id, json.dumps(record, ensure_ascii=False) + "\n"
+    
+    def _replay(self):
+        """기록 파일에서 완료/제거되지 않은 요청을 순서대로 복원 (처리 중이던 요청이 먼저)"""
+        if not os.path.exists(self.path):
+            return []
+        
+        waiting = {}  # ID → 요청 (추가 순서 유지)
+        in_flight = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 비정상 종료로 잘린 마지막 줄
+                op = record.get('op')
+                request_id = record.get('id')
+                if op == 'enqueue':
+                    waiting[request_id] = RouletteRequest(
+                        record['profile'], record.get('nickname'), record.get('count', 1),
+                        request_id=request_id, timestamp=record.get('ts'))
+                elif op == 'dequeue' and request_id in waiting:
+                    in_flight[request_id] = waiting.pop(request_id)
+                elif op in ('complete', 'drop'):
+                    waiting.pop(request_id, None)
+                    in_flight.pop(request_id, None)
+        
+        pending = list(in_flight.values()) + list(waiting.values())
+        if pending:
+            log.info("요청 기록에서 완료되지 않은 요청 %s개를 복구했습니다.", len(pending))
+        return pending
+    
+    def _run(self):
+        running = True
+        while running:
+            # 쓰는 동안 쌓인 기록을 한 번에 모아서 씀
+            records = [self._queue.get()]
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in records:
+                running = False
+                records = [record for record in records if record is not None]
+            if not records:
+                continue
+            
+            for op, request_id, line in records:
+                if op == 'enqueue':
+                    self._live[request_id] = [line, None]
+                elif op == 'dequeue':
+                    if request_id in self._live:
+                        self._live[request_id][1] = line
+                elif self._live.pop(request_id, None) is not None:
+                    self._finished += 1
+            if self._finished >= self.compact_records:
+                try:
+                    self._compact()  # 새 파일에 이번 기록까지 반영됨
+                    continue
+                except OSError as e:
+                    # 정리하지 못하면 이번 기록은 기존 파일에 이어 쓰고 다음에 다시 시도
+                    log.error("요청 기록 정리 오류: %s", e)
+                    self._finished = 0
+            try:
+                self._file.write("".join(line for _, _, line in records))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                log.error("요청 기록 저장 오류: %s", e)
+
+# 룰렛 요청 큐 클래스
+class RouletteRequestQueue:
+    """닉네임별 인덱스를 가진 룰렛 요청 큐
+    
+    전체 요청 순서는 deque로, 닉네임별 대기 요청은 닉네임 → deque 사전으로 관리합니다.
+    같은 닉네임의 요청을 먼저 꺼낼 때 전체 deque에서 바로 지우지 않고 처리 표시만 해두고,
+    앞쪽에 도달했을 때 버립니다. 덕분에 추가, 오래된 요청 제거, 닉네임 검색이 모두 O(1)입니다.
+    """
+    def __init__(self, max_size=MAX_QUEUE_SIZE):
+        self.max_size = max_size
+        self._order = deque()  # [요청, 대기 여부] 항목 (추가 순서)
+        self._by_nickname = {}  # 닉네임 → 해당 닉네임의 [요청, 대기 여부] 항목 deque
+        self._size = 0
+    
+    def __len__(self):
+        return self._size
+    
+    def __bool__(self):
+        return self._size > 0
+    
+    def __iter__(self):
+        return (entry[0] for entry in self._order if entry[1])
+    
+    def append(self, request):
+        """요청 추가. 큐가 가득 차면 가장 오래된 요청을 제거하고 반환"""
+        evicted = None
+        if self.max_size and self._size >= self.max_size:
+            evicted = self.popleft()
+        
+        entry = [request, True]
+        self._order.append(entry)
+        self._by_nickname.setdefault(request.nickname, deque()).append(entry)
+        self._size += 1
+        return evicted
+    
+    def popleft(self):
+        """가장 오래된 요청을 꺼냄 (없으면 None)"""
+        self._discard_taken()
+        if not self._order:
+            return None
+        entry = self._order.popleft()
+        # 가장 오래된 요청은 해당 닉네임 deque에서도 맨 앞에 있음
+        self._pop_nickname_entry(entry[0].nickname)
+        entry[1] = False
+        self._size -= 1
+        return entry[0]
+    
+    def pop_next(self, preferred_nickname=None):
+        """다음 요청을 꺼냄. preferred_nickname의 요청이 있으면 그 요청을 먼저 꺼냄"""
+        if preferred_nickname and preferred_nickname in self._by_nickname:
+            entry = self._pop_nickname_entry(preferred_nickname)
+            entry[1] = False  # 전체 순서 deque에서는 앞쪽에 도달했을 때 버림
+            self._size -= 1
+            self._discard_taken()
+            return entry[0]
+        return self.popleft()
+    
+    def count_for(self, nickname):
+        """해당 닉네임의 대기 요청 수"""
+        pending = self._by_nickname.get(nickname)
+        return len(pending) if pending else 0
+    
+    def clear(self):
+        self._order.clear()
+        self._by_nickname.clear()
+        self._size = 0
+    
+    def _pop_nickname_entry(self, nickname):
+        pending = self._by_nickname[nickname]
+        entry = pending.popleft()
+        if not pending:
+            del self._by_nickname[nickname]
+        return entry
+    
+    def _discard_taken(self):
+        # 이미 닉네임 우선 처리로 꺼낸 항목을 앞쪽에서 정리
+        while self._order and not self._order[0][1]:
+            self._order.popleft()
+
+def parse_multiplier(value):
+    """저장된 배율 값("X5", "5", 5)을 정수로 변환 (잘못된 값은 1)"""
+    if isinstance(value, int):
+        return max(1, value)
+    try:
+        return max(1, int(str(value).strip().upper().lstrip('X')))
+    except ValueError:
+        return 1
+
+# 룰렛 항목 클래스
+# RouletteItem 클래스에 key_press 속성 추가
+class RouletteItem:
+    __slots__ = ('name', 'image_path', 'command', 'probability', 'display_text',
+                 'multiplier', 'webhook_url', 'key_press')
+    
+    def __init__(self, name="룰렛 항목", image_path="", command="", probability=25.0, 
+                 display_text="", webhook_url="", key_press="", multiplier=1):
+        self.name = name
+        self.image_path = image_path
+        self.command = command
+        self.probability = probability
+        self.display_text = display_text  # 텍스트 모드에서 표시할 텍스트
+        self.multiplier = multiplier  # 배율 (반복 횟수, 정수)
+        self.webhook_url = webhook_url  # 개별 항목의 웹훅 URL
+        self.key_press = key_press  # 눌릴 키 (예: "a", "space", "enter" 등)
+    
+    @property
+    def multiplier_text(self):
+        """화면과 파일에 쓰는 배율 표기 (예: "X5")"""
+        return f"X{self.multiplier}"
+    
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'image_path': self.image_path,
+            'command': self.command,
+            'probability': self.probability,
+            'display_text': self.display_text,
+            'multiplier': f"X{self.multiplier}",  # 이전 버전과 같은 "X5" 형식으로 저장
+            'webhook_url': self.webhook_url,
+            'key_press': self.key_press  # 키 설정 저장
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        get = data.get
+        return RouletteItem(
+            name=get('name', "룰렛 항목"),
+            image_path=get('image_path', ""),
+            command=get('command', ""),
+            probability=float(get('probability', 25.0)),
+            display_text=get('display_text', ""),
+            webhook_url=get('webhook_url', ""),
+            key_press=get('key_press', ""),  # 키 설정 로드
+            multiplier=parse_multiplier(get('multiplier', 1))
+        )
+    
+# MCRCON 설정 클래스
+class MCRCONSettings:
+    __slots__ = ('host', 'port', 'password', 'enabled', 'rate_limit')
+    
+    def __init__(self, host="localhost", port=25575, password="", enabled=False,
+                 rate_limit=MCRCON_DEFAULT_RATE_LIMIT):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.enabled = enabled
+        self.rate_limit = rate_limit  # 초당 최대 명령어 수 (0 = 제한 없음)
+    
+    def to_dict(self):
+        return {
+            'host': self.host,
+            'port': self.port,
+            'password': self.password,
+            'enabled': self.enabled,
+            'rate_limit': self.rate_limit
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        return MCRCONSettings(
+            host=data.get('host', 'localhost'),
+            port=data.get('port', 25575),
+            password=data.get('password', ''),
+            enabled=data.get('enabled', False),
+            rate_limit=data.get('rate_limit', MCRCON_DEFAULT_RATE_LIMIT)
+        )
+
+# 부가 작업 실행기 클래스
+class SideEffectExecutor:
+    """당첨 후 부가 작업(키 입력, MCRCON, 웹훅)을 종류별 고정 스레드로 실행하는 클래스
+    
+    종류마다 limits에 지정된 수의 작업 스레드와 대기 큐를 두므로 요청이 몰려도
+    스레드 수가 늘지 않습니다. stats()로 종류별 대기/실행/완료/실패 수를 볼 수 있습니다.
+    """
+    def __init__(self, limits=SIDE_EFFECT_LIMITS):
+        self._lock = threading.Lock()
+        self._closed = False
+        self._queues = {}
+        self._workers = {}
+        self._stats = {}
+        for kind, limit in limits.items():
+            self._queues[kind] = queue.Queue()
+            self._stats[kind] = {'workers': limit, 'active': 0, 'completed': 0, 'failed': 0}
+            self._workers[kind] = [
+                threading.Thread(target=self._run, args=(kind,), daemon=True,
+                                 name=f"side-effect-{kind}-{i+1}")
+                for i in range(limit)
+            ]
+            for worker in self._workers[kind]:
+                worker.start()
+    
+    def submit(self, kind, func, *args, trace_id=None):
+        """kind 종류의 작업으로 func(*args)를 예약 (종료 중이면 False)
+        
+        trace_id가 있으면 끝난 뒤 요청 추적에 '{kind}_delivered' 또는 '{kind}_failed'를 기록
+        """
+        if self._closed:
+            log.warning("종료 중이라 부가 작업을 실행하지 않습니다: %s", kind)
+            return False
+        self._queues[kind].put((func, args, trace_id))
+        return True
+    
+    def pending(self, kind):
+        """kind 종류의 대기 중인 작업 수 (종료 신호는 제외)"""
+        work_queue = self._queues[kind]
+        with work_queue.mutex:
+            return sum(1 for job in work_queue.queue if job is not None)
+    
+    def stats(self):
+        """종류별 작업 통계 (대기/실행/완료/실패/스레드 수)"""
+        with self._lock:
+            return {kind: dict(values, pending=self.pending(kind))
+                    for kind, values in self._stats.items()}
+    
+    def shutdown(self, timeout=SIDE_EFFECT_SHUTDOWN_TIMEOUT):
+        """새 작업을 막고, 이미 예약된 작업이 끝나기를 최대 timeout초 동안 기다림"""
+        self._closed = True
+        for kind, workers in self._workers.items():
+            for _ in workers:
+                self._queues[kind].put(None)  # 남은 작업 뒤에 종료 신호
+        
+        deadline = time.monotonic() + timeout
+        for workers in self._workers.values():
+            for worker in workers:
+                worker.join(max(0.0, deadline - time.monotonic()))
+        
+        unfinished = {kind: values['pending'] + values['active']
+                      for kind, values in self.stats().items()
+                      if values['pending'] + values['active'] > 0}
+        if unfinished:
+            log.warning("종료 시간 초과로 완료하지 못한 부가 작업: %s", unfinished)
+    
+    def _run(self, kind):
+        work_queue = self._queues[kind]
+        stats = self._stats[kind]
+        while True:
+            job = work_queue.get()
+            if job is None:
+                break
+            func, args, trace_id = job
+            with self._lock:
+                stats['active'] += 1
+            failed = False
+            started = time.monotonic()
+            try:
+                func(*args)
+            except Exception as e:
+                failed = True
+                log.error("부가 작업 실행 오류 (%s): %s", kind, e)
+            metrics.observe('roulette_side_effect_seconds', time.monotonic() - started, kind=kind)
+            if failed:
+                metrics.inc('roulette_side_effect_failures_total', kind=kind)
+            traces.record(trace_id, f"{kind}_failed" if failed else f"{kind}_delivered")
+            with self._lock:
+                stats['active'] -= 1
+                stats['failed' if failed else 'completed'] += 1
+
+# 속도 제한 클래스 (토큰 버킷)
+class RateLimiter:
+    """초당 rate개까지 허용하고 burst개까지는 연속 허용하는 토큰 버킷"""
+    def __init__(self, rate, burst=MCRCON_RATE_BURST):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+    
+    def acquire(self):
+        """토큰 하나를 사용 (부족하면 필요한 만큼만 대기)"""
+        if not self.rate or self.rate <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens < 1.0:
+            wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+            self._last = time.monotonic()
+            self._tokens = 0.0
+        else:
+            self._tokens -= 1.0
+
+# MCRCON 연결 클래스 (서버별로 하나씩 유지)
+class MCRCONConnection:
+    """하나의 RCON 서버에 대한 지속 연결
+    
+    run()은 부가 작업 실행기의 스레드에서 호출되며, 같은 서버로 가는 명령어는
+    잠금으로 순서대로 같은 연결을 통해 전송합니다.
+    연결이 끊기면 다음 명령어를 보낼 때 다시 연결합니다. close() 후에는 진행 중인
+    반복 전송도 다음 명령어 전에 멈추므로 종료가 전송 횟수만큼 늘어지지 않습니다.
+    """
+    def __init__(self, host, port, password, rate_limit=MCRCON_DEFAULT_RATE_LIMIT):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.limiter = RateLimiter(rate_limit)
+        self._client = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def run(self, command, repeat_count=1):
+        """명령어를 repeat_count회 전송 (실패하거나 연결이 닫히면 예외 발생)"""
+        with self._lock:
+            sent = 0
+            try:
+                for i in range(repeat_count):
+                    if self._closed:
+                        raise RuntimeError("종료 중이라 전송을 중단했습니다")
+                    self.limiter.acquire()
+                    response = self._send(command)
+                    sent += 1
+                    log.debug("MCRCON 명령어 실행 결과 (%s/%s): %s", i + 1, repeat_count, response)
+                log.info("MCRCON 명령어 %s회 반복 실행 완료", repeat_count)
+            except Exception as e:
+                log.error("MCRCON 명령어 실행 오류 (%s/%s 완료): %s", sent, repeat_count, e)
+                raise
+            finally:
+                if self._closed:
+                    self._disconnect()
+    
+    def close(self):
+        """연결 종료 (전송 중이면 잠깐만 기다리고, 못 잡으면 전송 스레드가 다음 명령어 전에 멈추고 닫음)"""
+        self._closed = True
+        if self._lock.acquire(timeout=MCRCON_CLOSE_TIMEOUT):
+            try:
+                self._disconnect()
+            finally:
+                self._lock.release()
+    
+    def _send(self, command):
+        for attempt in range(MCRCON_SEND_ATTEMPTS):
+            try:
+                if self._client is None:
+                    client = get_mcrcon_class()(self.host, self.password, self.port)
+                    client.connect()
+                    self._client = client
+                return self._client.command(command)
+            except Exception as e:
+                self._disconnect()
+                if attempt + 1 >= MCRCON_SEND_ATTEMPTS:
+                    raise
+                log.warning("MCRCON 연결 끊김, 다시 연결합니다: %s", e)
+    
+    def _disconnect(self):
+        if self._client is not None:
+            try:
+                self._client.disconnect()
+            except Exception:
+                pass
+            self._client = None
+
+# MCRCON 연결 풀 클래스
+class MCRCONPool:
+    """(호스트, 포트, 비밀번호)별 MCRCONConnection을 재사용하는 풀"""
+    def __init__(self, executor):
+        self.executor = executor
+        self._connections = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, settings, command, repeat_count=1, trace_id=None):
+        """settings의 서버로 명령어를 repeat_count회 보내도록 예약"""
+        key = (settings.host, settings.port, settings.password)
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                connection = MCRCONConnection(settings.host, settings.port, settings.password,
+                                              settings.rate_limit)
+                self._connections[key] = connection
+            else:
+                connection.limiter.rate = settings.rate_limit
+        self.executor.submit('mcrcon', connection.run, command, repeat_count, trace_id=trace_id)
+    
+    def close_all(self):
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+# 웹훅 설정 클래스
+class WebhookSettings:
+    __slots__ = ('url', 'username', 'avatar_url', 'enabled', 'coalesce')
+    
+    def __init__(self, url="", username="룰렛 봇", avatar_url="", enabled=False, coalesce=False):
+        self.url = url
+        self.username = username
+        self.avatar_url = avatar_url
+        self.enabled = enabled
+        self.coalesce = coalesce  # 배율만큼 반복하지 않고 하나의 메시지로 합쳐서 전송
+    
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'username': self.username,
+            'avatar_url': self.avatar_url,
+            'enabled': self.enabled,
+            'coalesce': self.coalesce
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        return WebhookSettings(
+            url=data.get('url', ''),
+            username=data.get('username', '룰렛 봇'),
+            avatar_url=data.get('avatar_url', ''),
+            enabled=data.get('enabled', False),
+            coalesce=data.get('coalesce', False)
+        )
+
+# 웹훅 전송 클래스
+class WebhookDispatcher:
+    """부가 작업 실행기의 'webhook' 스레드로 웹훅을 전송하는 클래스
+    
+    URL마다 requests.Session을 재사용해 연결을 유지하고, Discord의 429 응답
+    (Retry-After)과 X-RateLimit 헤더를 따라 필요한 만큼만 대기합니다.
+    재시도 대기는 전송마다 WEBHOOK_DELIVERY_BUDGET초 안에서만 하며, stop_retries() 후에는
+    기다리지 않고 바로 포기하므로 응답하지 않는 URL이 작업 스레드를 오래 잡지 않습니다.
+    """
+    def __init__(self, executor):
+        self.executor = executor
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._stopping = threading.Event()  # 설정되면 재시도 대기를 멈추고 포기
+    
+    def submit(self, url, payloads, trace_id=None):
+        """payloads(메시지 리스트)를 url로 순서대로 전송하도록 예약 (바로 반환)"""
+        if url and payloads:
+            self.executor.submit('webhook', self._deliver, url, list(payloads), trace_id=trace_id)
+    
+    def stop_retries(self):
+        """진행 중인 재시도 대기를 깨우고 이후 재시도 없이 한 번씩만 전송 (종료 시작 시 호출)"""
+        self._stopping.set()
+    
+    def shutdown(self):
+        """연결 종료 (실행기 종료 후 호출)"""
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+    
+    def _session(self, url):
+        with self._sessions_lock:
+            session = self._sessions.get(url)
+            if session is None:
+                import requests
+                session = requests.Session()
+                self._sessions[url] = session
+            return session
+    
+    def _deliver(self, url, payloads):
+        """메시지들을 순서대로 전송 (하나라도 실패하면 예외 발생)
+        
+        한 메시지가 재시도를 모두 쓰고도 실패하면 URL이 응답하지 않는 것으로 보고
+        같은 URL로 가는 남은 메시지는 보내지 않습니다.
+        """
+        deadline = time.monotonic() + WEBHOOK_DELIVERY_BUDGET
+        total = len(payloads)
+        failed = 0
+        for i, payload in enumerate(payloads):
+            result = self._post(url, payload, deadline)
+            if result:
+                log.debug("웹훅 전송 성공 (%s/%s)", i + 1, total)
+            elif result is None:
+                failed += total - i
+                log.warning("웹훅 URL이 응답하지 않아 전송을 중단합니다 (%s/%s에서 중단, 남은 %s건 생략)",
+                            i + 1, total, total - i - 1)
+                break
+            else:
+                failed += 1
+                log.warning("웹훅 전송 실패 (%s/%s)", i + 1, total)
+        if failed:
+            raise RuntimeError(f"웹훅 {total}건 중 {failed}건 전송 실패")
+        log.info("웹훅 알림 %s건 전송 완료", total)
+    
+    def _post(self, url, payload, deadline):
+        """메시지 하나 전송 (속도 제한/일시 오류는 deadline까지 재시도)
+        
+        성공하면 True, 서버가 거절하면 False, 재시도를 모두 쓰거나 시간이 다 되었거나
+        종료 중이라 포기하면 None을 반환합니다.
+        """
+        import requests
+        session = self._session(url)
+        for attempt in range(WEBHOOK_MAX_RETRIES + 1):
+            try:
+                response = session.post(url, json=payload, timeout=WEBHOOK_TIMEOUT)
+            except requests.exceptions.RequestException as e:
+                log.warning("웹훅 요청 오류: %s", e)
+                delay = 0.5 * (2 ** attempt)
+            else:
+                if response.status_code == 429:
+                    # 속도 제한: 서버가 알려준 시간만큼 대기 후 재시도
+                    delay = self._retry_after(response)
+                elif response.status_code >= 500:
+                    delay = 0.5 * (2 ** attempt)
+                else:
+                    # 남은 요청 수가 0이면 다음 요청 전에 초기화 시간까지 대기
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        try:
+                            self._wait(float(response.headers.get('X-RateLimit-Reset-After', 0)), deadline)
+                        except ValueError:
+                            pass
+                    
+                    if response.status_code not in (200, 204):
+                        log.warning("웹훅 응답 코드: %s", response.status_code)
+                        return False
+                    return True
+            
+            if attempt == WEBHOOK_MAX_RETRIES or not self._wait(delay, deadline):
+                return None
+        return None
+    
+    def _wait(self, delay, deadline):
+        """delay초 대기 (종료 중이거나 deadline을 넘기게 되면 기다리지 않고 False)"""
+        if self._stopping.is_set() or time.monotonic() + delay > deadline:
+            return False
+        return not self._stopping.wait(delay)
+    
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return float(response.json().get('retry_after'))
+        except (ValueError, TypeError, AttributeError):
+            pass
+        try:
+            return float(response.headers.get('Retry-After', 1.0))
+        except (TypeError, ValueError):
+            return 1.0
+
+# 소리 설정 클래스 - 결과 효과음 옵션 추가
+class SoundSettings:
+    __slots__ = ('sound_path', 'enabled', 'volume', 'tick_enabled', 'tick_sound_path',
+                 'finish_sound_path', 'finish_enabled')
+    
+    def __init__(self, sound_path=DEFAULT_SOUND_FILE, enabled=True, volume=80, 
+                 tick_enabled=True, tick_sound_path=DEFAULT_TICK_SOUND_FILE,
+                 finish_sound_path=DEFAULT_FINISH_SOUND_FILE, finish_enabled=True):
+        self.sound_path = sound_path
+        self.enabled = enabled
+        self.volume = volume  # 0-100 범위의 볼륨
+        self.tick_enabled = tick_enabled  # 틱 소리 활성화 여부
+        self.tick_sound_path = tick_sound_path  # 틱 소리 파일 경로
+        self.finish_sound_path = finish_sound_path  # 결과 효과음 파일 경로
+        self.finish_enabled = finish_enabled  # 결과 효과음 활성화 여부
+    
+    def to_dict(self):
+        return {
+            'sound_path': self.sound_path,
+            'enabled': self.enabled,
+            'volume': self.volume,
+            'tick_enabled': self.tick_enabled,
+            'tick_sound_path': self.tick_sound_path,
+            'finish_sound_path': self.finish_sound_path,
+            'finish_enabled': self.finish_enabled
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        return SoundSettings(
+            sound_path=data.get('sound_path', DEFAULT_SOUND_FILE),
+            enabled=data.get('enabled', True),
+            volume=data.get('volume', 80),
+            tick_enabled=data.get('tick_enabled', True),
+            tick_sound_path=data.get('tick_sound_path', DEFAULT_TICK_SOUND_FILE),
+            finish_sound_path=data.get('finish_sound_path', DEFAULT_FINISH_SOUND_FILE),
+            finish_enabled=data.get('finish_enabled', True)
+        )
+
+# 폰트 및 표시 설정 클래스
+class DisplaySettings:
+    __slots__ = ('font_family', 'font_size', 'text_color', 'use_text_mode', 'title_font_size',
+                 'fixed_slot_count')
+    
+    def __init__(self, font_family="Arial", font_size=12, text_color="#ffffff", 
+                 use_text_mode=False, title_font_size=16, fixed_slot_count=0):
+        self.font_family = font_family
+        self.font_size = font_size
+        self.text_color = text_color
+        self.use_text_mode = use_text_mode
+        self.title_font_size = title_font_size
+        self.fixed_slot_count = fixed_slot_count  # 0 = 자동, 그 외 = 고정 슬롯 수
+    
+    def to_dict(self):
+        return {
+            'font_family': self.font_family,
+            'font_size': self.font_size,
+            'text_color': self.text_color,
+            'use_text_mode': self.use_text_mode,
+            'title_font_size': self.title_font_size,
+            'fixed_slot_count': self.fixed_slot_count
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        return DisplaySettings(
+            font_family=data.get('font_family', 'Arial'),
+            font_size=data.get('font_size', 12),
+            text_color=data.get('text_color', '#ffffff'),
+            use_text_mode=data.get('use_text_mode', False),
+            title_font_size=data.get('title_font_size', 16),
+            fixed_slot_count=data.get('fixed_slot_count', 0)
+        )
+
+# 빠른 진행 설정 클래스
+class TurboSettings:
+    """대기 요청 수에 따라 회전 시간과 다음 요청까지의 대기 시간을 줄이는 설정
+    
+    curve는 (대기 요청 수, 배율) 점의 목록이며, 점 사이는 직선으로 보간하고
+    마지막 점 이후는 마지막 배율을 유지합니다.
+    """
+    __slots__ = ('enabled', 'curve', 'min_rotation_time', 'instant_threshold')
+    
+    def __init__(self, enabled=True, curve=TURBO_DEFAULT_CURVE, min_rotation_time=TURBO_MIN_ROTATION_TIME,
+                 instant_threshold=0):
+        self.enabled = enabled
+        self.curve = TurboSettings.normalize_curve(curve)
+        self.min_rotation_time = min_rotation_time
+        self.instant_threshold = instant_threshold  # 대기 요청이 이 수 이상이면 애니메이션 없이 바로 추첨 (0 = 사용 안 함)
+    
+    @staticmethod
+    def normalize_curve(curve):
+        """대기 요청 수 순으로 정렬하고 같은 대기 요청 수는 마지막 값만 남김"""
+        points = {}
+        for depth, scale in curve:
+            depth, scale = int(depth), float(scale)
+            if depth < 0 or scale <= 0:
+                raise ValueError(f"잘못된 배율 곡선 점: {depth}:{scale}")
+            points[depth] = scale
+        return sorted(points.items())
+    
+    @staticmethod
+    def parse_curve(text):
+        """'0:1, 2:0.7, 5:0.4' 형식의 문자열을 곡선으로 변환 (형식이 틀리면 ValueError)"""
+        points = []
+        for part in text.split(','):
+            if part.strip():
+                depth, _, scale = part.partition(':')
+                points.append((int(depth), float(scale)))
+        if not points:
+            raise ValueError("배율 곡선이 비어 있습니다")
+        return TurboSettings.normalize_curve(points)
+    
+    @property
+    def curve_text(self):
+        return ", ".join(f"{depth}:{scale:g}" for depth, scale in self.curve)
+    
+    def scale(self, queue_depth):
+        """대기 요청 수에 따른 회전 시간/대기 시간 배율"""
+        if not self.enabled or not self.curve:
+            return 1.0
+        prev_depth, prev_scale = self.curve[0]
+        if queue_depth <= prev_depth:
+            return prev_scale
+        for depth, scale in self.curve[1:]:
+            if queue_depth <= depth:
+                return prev_scale + (scale - prev_scale) * (queue_depth - prev_depth) / (depth - prev_depth)
+            prev_depth, prev_scale = depth, scale
+        return prev_scale
+    
+    def resolves_instantly(self, queue_depth):
+        """대기 요청 수가 즉시 처리 기준 이상인지 여부"""
+        return self.enabled and 0 < self.instant_threshold <= queue_depth
+    
+    def to_dict(self):
+        return {
+            'enabled': self.enabled,
+            'curve': [list(point) for point in self.curve],
+            'min_rotation_time': self.min_rotation_time,
+            'instant_threshold': self.instant_threshold
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        try:
+            curve = TurboSettings.normalize_curve(data.get('curve', TURBO_DEFAULT_CURVE))
+        except (TypeError, ValueError):
+            curve = TURBO_DEFAULT_CURVE
+        return TurboSettings(
+            enabled=data.get('enabled', True),
+            curve=curve,
+            min_rotation_time=data.get('min_rotation_time', TURBO_MIN_ROTATION_TIME),
+            instant_threshold=data.get('instant_threshold', 0)
+        )
+
+# 확률 기반 항목 선택기 (Walker/Vose 별칭 방법)
+class ProbabilitySampler:
+    """항목 확률로 별칭 테이블을 미리 만들어 두고 O(1)로 추첨하는 클래스
+    
+    테이블 생성은 O(n)이며, 항목이나 확률이 바뀌지 않는 한 다시 만들 필요가 없습니다.
+    모든 확률이 0 이하이면 균등 확률로 추첨합니다.
+    """
+    def __init__(self, weights):
+        count = len(weights)
+        self.size = count
+        self._prob = [1.0] * count
+        self._alias = list(range(count))
+        
+        total = sum(w for w in weights if w > 0)
+        if count == 0 or total <= 0:
+            # 모든 확률이 0이면 균등 확률 적용
+            return
+        
+        scaled = [(w * count / total if w > 0 else 0.0) for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        
+        # 남은 항목은 부동소수점 오차를 무시하고 확률 1로 처리
+        for i in small + large:
+            self._prob[i] = 1.0
+    
+    def draw(self, rng=random):
+        """항목 인덱스 하나를 추첨 (항목이 없으면 None)"""
+        if self.size == 0:
+            return None
+        r = rng.random() * self.size
+        column = int(r)
+        if column >= self.size:
+            column = self.size - 1
+        # 같은 난수의 소수 부분으로 별칭 여부 결정
+        return column if (r - column) < self._prob[column] else self._alias[column]
+    
+    def draw_many(self, count, rng=random):
+        """항목 인덱스를 count개 추첨 (대량 추첨용)"""
+        if self.size == 0 or count <= 0:
+            return []
+        size = self.size
+        prob = self._prob
+        alias = self._alias
+        random_value = rng.random
+        results = []
+        for _ in range(count):
+            r = random_value() * size
+            column = int(r)
+            if column >= size:
+                column = size - 1
+            results.append(column if (r - column) < prob[column] else alias[column])
+        return results
+
+# 프로필 클래스 - 소리 설정 추가
+class Profile:
+    # 저장소에서 불러온 프로필은 이 값들을 처음 사용할 때 읽어옴
+    LAZY_FIELDS = ('items', 'webhook', 'mcrcon', 'display', 'sound', 'turbo', 'rotation_time')
+    __slots__ = LAZY_FIELDS + ('profile_id', 'name', 'dirty', 'load_failed', '_sampler', '_sampler_items', '_store')
+    
+    def __init__(self, name="프로필 1", items=None, webhook=None, mcrcon=None, display=None, sound=None,
+                 turbo=None, profile_id=None):
+        self._store = None  # 아직 읽지 않은 내용이 있으면 ProfileStore
+        self.profile_id = profile_id or uuid.uuid4().hex  # 저장소에서 프로필을 구분하는 ID
+        self.name = name
+        self.items = items if items else []
+        self.webhook = webhook if webhook else WebhookSettings()
+        self.mcrcon = mcrcon if mcrcon else MCRCONSettings()
+        self.display = display if display else DisplaySettings()
+        self.sound = sound if sound else SoundSettings()  # 소리 설정 추가
+        self.turbo = turbo if turbo else TurboSettings()  # 빠른 진행 설정
+        self.rotation_time = 5.0  # 기본 회전 시간
+        self.dirty = True  # 마지막 저장 이후 변경 여부 (새 프로필은 저장 필요)
+        self.load_failed = False  # 저장소에서 읽지 못해 빈 값으로 임시 표시 중인지 (저장하지 않음)
+        self._sampler = None  # 확률 선택기 캐시
+        self._sampler_items = None  # 캐시를 만들 때 사용한 항목 리스트
+    
+    def get_sampler(self):
+        """캐시된 확률 선택기 반환 (없거나 항목 리스트가 교체되었으면 새로 생성)"""
+        sampler = self._sampler
+        if (sampler is None or self._sampler_items is not self.items
+                or sampler.size != len(self.items)):
+            sampler = ProbabilitySampler([item.probability for item in self.items])
+            self._sampler = sampler
+            self._sampler_items = self.items
+        return sampler
+    
+    def invalidate_sampler(self):
+        """항목이나 확률이 변경되었을 때 호출하여 확률 선택기 캐시를 무효화"""
+        self._sampler = None
+        self._sampler_items = None
+    
+    def mark_dirty(self):
+        """설정이 변경되어 다음 저장 때 저장소에 써야 함을 표시"""
+        self.dirty = True
+    
+    @staticmethod
+    def from_store(store, profile_id, name):
+        """이름만 채운 프로필 생성 (항목과 설정은 처음 사용할 때 store에서 읽음)"""
+        profile = Profile.__new__(Profile)
+        profile.profile_id = profile_id
+        profile.name = name
+        profile.dirty = False
+        profile.load_failed = False
+        profile._sampler = None
+        profile._sampler_items = None
+        profile._store = store
+        return profile
+    
+    @property
+    def loaded(self):
+        """항목과 설정을 이미 읽었는지 여부"""
+        return self._store is None
+    
+    def __getattr__(self, name):
+        # 아직 읽지 않은 항목/설정에 처음 접근할 때만 호출됨
+        if name in Profile.LAZY_FIELDS and self._store is not None:
+            self._hydrate()
+            return object.__getattribute__(self, name)
+        raise AttributeError(name)
+    
+    def _hydrate(self):
+        try:
+            loaded = Profile.from_dict(self._store.load_data(self.profile_id) or {})
+        except Exception as e:
+            # 읽기 실패: 빈 값으로 임시 표시하되 저장소 내용을 덮어쓰지 않도록 표시
+            # (_store는 남겨 두고 retry_load()로 다시 읽음)
+            log.error("프로필 '%s' 불러오기 오류: %s", self.name, e)
+            self.load_failed = True
+            loaded = Profile()
+        else:
+            self._store = None
+            self.load_failed = False
+        for field in Profile.LAZY_FIELDS:
+            try:
+                object.__getattribute__(self, field)  # 읽기 전에 새로 지정한 값은 유지
+            except AttributeError:
+                setattr(self, field, getattr(loaded, field))
+    
+    def retry_load(self):
+        """읽기에 실패했던 프로필을 저장소에서 다시 읽음 (성공했거나 실패한 적이 없으면 True)
+        
+        임시 값에 한 변경은 저장할 수 없으므로 버리고 저장소 내용으로 바꿉니다.
+        """
+        if not self.load_failed:
+            return True
+        for field in Profile.LAZY_FIELDS:
+            try:
+                object.__delattr__(self, field)
+            except AttributeError:
+                pass
+        self.invalidate_sampler()
+        self._hydrate()
+        return not self.load_failed
+    
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'items': [item.to_dict() for item in self.items],
+            'webhook': self.webhook.to_dict(),
+            'mcrcon': self.mcrcon.to_dict(),
+            'display': self.display.to_dict(),
+            'sound': self.sound.to_dict(),  # 소리 설정 저장
+            'turbo': self.turbo.to_dict(),
+            'rotation_time': self.rotation_time
+        }
+    
+    @staticmethod
+    def from_dict(data, profile_id=None):
+        profile = Profile(
+            name=data.get('name', "프로필 1"),
+            profile_id=profile_id
+        )
+        profile.rotation_time = data.get('rotation_time', 5.0)
+        
+        if 'items' in data:
+            profile.items = [RouletteItem.from_dict(item_data) for item_data in data['items']]
+        
+        if 'webhook' in data:
+            profile.webhook = WebhookSettings.from_dict(data['webhook'])
+        
+        if 'mcrcon' in data:
+            profile.mcrcon = MCRCONSettings.from_dict(data['mcrcon'])
+            
+        if 'display' in data:
+            profile.display = DisplaySettings.from_dict(data['display'])
+            
+        # 소리 설정 로드
+        if 'sound' in data:
+            profile.sound = SoundSettings.from_dict(data['sound'])
+        
+        if 'turbo' in data:
+            profile.turbo = TurboSettings.from_dict(data['turbo'])
+            
+        return profile
+
+# 프로필 저장소 클래스
+class ProfileStore:
+    """모든 프로필을 하나의 SQLite 파일에 보관하는 저장소
+    
+    프로필 ID, 순서, 이름은 따로 열에 두어 시작할 때는 이것만 읽고,
+    항목과 설정(JSON)은 프로필을 처음 사용할 때 ID로 읽습니다.
+    SQLite 연결은 스레드마다 connect()로 따로 만들어 사용합니다.
+    """
+    def __init__(self, path=PROFILE_DB_FILE):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # 엔진용 연결 (목록, 프로필 읽기) - 엔진을 사용하는 스레드 하나에서만 사용하지만,
+        # 창 없이 실행하면 엔진을 만든 스레드와 사용하는 스레드가 다름
+        self._conn = self.connect(check_same_thread=False)
+    
+    def connect(self, check_same_thread=True):
+        conn = sqlite3.connect(self.path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")  # 저장 중에도 다른 연결에서 읽기 가능
+        conn.execute("""CREATE TABLE IF NOT EXISTS profiles (
+                            id TEXT PRIMARY KEY,
+                            position INTEGER NOT NULL,
+                            name TEXT NOT NULL,
+                            data TEXT NOT NULL)""")
+        conn.execute("CREATE INDEX IF NOT EXISTS profiles_position ON profiles (position)")
+        conn.commit()
+        return conn
+    
+    def list_profiles(self):
+        """순서대로 (ID, 이름) 목록 반환"""
+        return self._conn.execute("SELECT id, name FROM profiles ORDER BY position").fetchall()
+    
+    def load_data(self, profile_id):
+        """프로필의 항목과 설정 데이터 (없으면 None)"""
+        row = self._conn.execute("SELECT data FROM profiles WHERE id = ?", (profile_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def import_json_files(self, folder):
+        """이전 버전의 profile_N.json 파일들을 저장소로 옮김 (저장소가 비어 있을 때만)"""
+        if self._conn.execute("SELECT 1 FROM profiles LIMIT 1").fetchone():
+            return 0
+        
+        def file_number(name):
+            number = name[len("profile_"):-len(".json")]
+            return int(number) if number.isdigit() else float('inf')
+        
+        config_files = [f for f in os.listdir(folder) if f.startswith("profile_") and f.endswith(".json")]
+        rows = []
+        for config_file in sorted(config_files, key=lambda name: (file_number(name), name)):
+            try:
+                with open(os.path.join(folder, config_file), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except json.JSONDecodeError:
+                log.warning("파일 '%s'의 JSON 형식이 잘못되었습니다.", config_file)
+                continue
+            rows.append((uuid.uuid4().hex, len(rows), data.get('name', "프로필 1"),
+                         json.dumps(data, ensure_ascii=False)))
+        
+        if rows:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO profiles (id, position, name, data) VALUES (?, ?, ?, ?)", rows)
+            log.info("프로필 파일 %s개를 저장소로 옮겼습니다: %s", len(rows), self.path)
+        return len(rows)
+    
+    @staticmethod
+    def apply(conn, operations):
+        """저장 작업들을 하나의 트랜잭션으로 실행
+        
+        operations: ('upsert', ID, 순서, 데이터) / ('move', ID, 순서) / ('delete', ID)
+        """
+        with conn:
+            for operation in operations:
+                if operation[0] == 'upsert':
+                    _, profile_id, position, data = operation
+                    conn.execute(
+                        "INSERT INTO profiles (id, position, name, data) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(id) DO UPDATE SET position = excluded.position, "
+                        "name = excluded.name, data = excluded.data",
+                        (profile_id, position, data.get('name', ""), json.dumps(data, ensure_ascii=False)))
+                elif operation[0] == 'move':
+                    _, profile_id, position = operation
+                    conn.execute("UPDATE profiles SET position = ? WHERE id = ?", (position, profile_id))
+                elif operation[0] == 'delete':
+                    conn.execute("DELETE FROM profiles WHERE id = ?", (operation[1],))
+    
+    def close(self):
+        self._conn.close()
+
+# 프로필 저장 클래스
+class ProfileWriter:
+    """프로필 변경 사항을 백그라운드 스레드에서 저장소에 쓰는 클래스
+    
+    쓰는 동안 쌓인 작업을 모아 하나의 트랜잭션으로 저장하므로, 저장 중에 프로그램이
+    종료되어도 저장소는 이전 상태나 새 상태 중 하나로 남습니다.
+    """
+    def __init__(self, store, on_error=None):
+        self.store = store
+        self.on_error = on_error  # 저장 실패 시 호출 (작업 스레드에서 호출됨)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="profile-writer")
+        self._thread.start()
+    
+    def submit(self, operations):
+        """저장 작업 목록을 예약 (ProfileStore.apply 참고)"""
+        self._queue.put(list(operations))
+    
+    def flush(self):
+        """예약된 저장이 모두 끝날 때까지 대기"""
+        self._queue.join()
+    
+    def _run(self):
+        conn = self.store.connect()  # SQLite 연결은 이 스레드 전용
+        while True:
+            jobs = [self._queue.get()]
+            while True:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            operations = [operation for job in jobs for operation in job]
+            try:
+                ProfileStore.apply(conn, operations)
+                log.info("프로필 저장 완료 (작업 %s개)", len(operations))
+            except Exception as e:
+                log.error("프로필 저장 오류: %s", e)
+                if self.on_error:
+                    self.on_error(str(e))
+            finally:
+                for _ in jobs:
+                    self._queue.task_done()
+
+# 키 입력 시뮬레이션
+def simulate_key_press(key, repeat_count):
+    """키보드 키 입력 시뮬레이션"""
+    try:
+        import keyboard
+        log.debug("키 '%s' %s회 입력 시작", key, repeat_count)
+        
+        # 특수 키 설정
+        for i in range(repeat_count):
+            keyboard.press_and_release(key)
+            time.sleep(0.05)
+            
+            # 10회마다 좀 더 긴 대기
+            if i > 0 and i % 10 == 0:
+                time.sleep(0.2)
+                
+        log.info("키 '%s' %s회 입력 완료", key, repeat_count)
+        return True
+    except ImportError:
+        log.warning("keyboard 라이브러리가 설치되지 않았습니다. 'pip install keyboard' 명령으로 설치하세요.")
+        return False
+    except Exception as e:
+        log.error("키 입력 시뮬레이션 오류: %s", e)
+        return False
+
+# 회전 결과 클래스
+class SpinResult:
+    """한 번의 회전 결과 (일괄 요청이면 항목별 당첨 횟수 포함)"""
+    __slots__ = ('request', 'profile', 'item_index', 'batch')
+    
+    def __init__(self, request, profile, item_index, batch=None):
+        self.request = request  # 수동 회전이면 None
+        self.profile = profile
+        self.item_index = item_index  # 화면에서 멈출 항목 (일괄 요청이면 가장 많이 나온 항목)
+        self.batch = batch  # 일괄 추첨 결과 [(항목 인덱스, 당첨 횟수), ...] (단일 추첨이면 None)
+    
+    @property
+    def item(self):
+        return self.profile.items[self.item_index]
+    
+    def batch_items(self):
+        """일괄 추첨 결과를 [(항목, 당첨 횟수), ...]로 반환"""
+        items = self.profile.items
+        return [(items[index], hits) for index, hits in self.batch or ()]
+
+# 룰렛 엔진 클래스
+class RouletteEngine:
+    """창 없이 동작하는 룰렛 엔진
+    
+    요청 큐(기록 포함), 프로필과 저장소, 확률 추첨, 당첨 후 부가 작업을 관리합니다.
+    메서드는 한 스레드(창이 있으면 Qt 메인 스레드)에서만 호출해야 합니다.
+    상태가 바뀌면 subscribe()로 등록한 함수를 listener(이벤트 이름, 데이터 사전)로 호출합니다.
+    
+    이벤트: request_queued, request_dropped, request_started, spin_started, spin_finished,
+    profile_changed, profile_save_failed (이것만 프로필 저장 스레드에서 호출됨)
+    """
+    def __init__(self, profile_store=None, request_journal=None, max_queue_size=MAX_QUEUE_SIZE,
+                 side_effect_limits=SIDE_EFFECT_LIMITS, key_press_handler=simulate_key_press):
+        # 프로필
+        self.profile_store = profile_store or ProfileStore(PROFILE_DB_FILE)
+        self.profile_writer = ProfileWriter(self.profile_store, on_error=self._on_save_failed)
+        self.saved_positions = {}  # 프로필 ID → 저장소에 마지막으로 저장된 순서
+        self.profiles = []
+        self.current_profile_index = 0  # 현재 사용 중인 프로필 인덱스
+        self.current_profile = Profile()
+        
+        # 요청 큐
+        self.request_queue = RouletteRequestQueue(max_queue_size)  # 대기 중인 룰렛 요청
+        self.request_journal = request_journal or RequestJournal(REQUEST_JOURNAL_FILE)  # 재시작 시 요청 복구용 기록
+        self.current_request = None  # 현재 처리 중인 요청 (수동 회전이면 None)
+        self.last_nickname = None  # 마지막으로 처리한 요청의 닉네임 (같은 사용자 우선 처리, 웹훅 표시용)
+        
+        # 부가 작업 (키 입력, MCRCON, 웹훅 - 종류별 스레드 수 고정)
+        self.side_effects = SideEffectExecutor(side_effect_limits)
+        self.mcrcon_pool = MCRCONPool(self.side_effects)
+        self.webhook_dispatcher = WebhookDispatcher(self.side_effects)
+        self.key_press_handler = key_press_handler  # None이면 키 입력 생략 (서버 환경 등)
+        
+        self.rng = random  # 추첨에 사용할 난수 생성기 (테스트에서 random.Random(seed)로 교체 가능)
+        self.spin_started = None  # 현재 추첨을 시작한 시각 (time.monotonic)
+        self._listeners = []
+        
+        # /metrics에서 읽는 게이지 (HTTP 스레드에서 호출되므로 len()/qsize()만 사용)
+        metrics.gauge('roulette_queue_depth', "대기 중인 룰렛 요청 수",
+                      lambda: len(self.request_queue))
+        metrics.gauge('roulette_side_effect_pending', "종류별 대기 중인 부가 작업 수",
+                      lambda: [({'kind': kind}, self.side_effects.pending(kind)) for kind in side_effect_limits])
+    
+    # ----- 이벤트 -----
+    
+    def subscribe(self, listener):
+        """이벤트를 받을 함수 등록 (listener(이벤트 이름, 데이터 사전))"""
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _emit(self, event, **data):
+        for listener in list(self._listeners):
+            try:
+                listener(event, data)
+            except Exception as e:
+                log.error("엔진 이벤트 처리 오류 (%s): %s", event, e)
+    
+    # ----- 프로필 -----
+    
+    def load_profiles(self):
+        """저장소에서 프로필 목록을 불러옴 (이름과 순서만, 항목과 설정은 처음 사용할 때)"""
+        profiles = []
+        self.saved_positions = {}
+        try:
+            # 이전 버전의 프로필 파일이 있으면 저장소로 옮김 (처음 한 번)
+            self.profile_store.import_json_files(CONFIG_FOLDER)
+            
+            for position, (profile_id, name) in enumerate(self.profile_store.list_profiles()):
+                profiles.append(Profile.from_store(self.profile_store, profile_id, name))
+                self.saved_positions[profile_id] = position
+        except Exception as e:
+            log.error("프로필 로드 오류: %s", e)
+            profiles = []
+        
+        if not profiles:
+            # 기본 프로필
+            profiles.append(Profile(name="프로필 1", items=[
+                RouletteItem(name="항목 1", probability=25),
+                RouletteItem(name="항목 2", probability=25),
+                RouletteItem(name="항목 3", probability=25),
+                RouletteItem(name="항목 4", probability=25)
+            ]))
+        
+        self.profiles = profiles
+        self.current_profile_index = 0
+        self.current_profile = profiles[0]
+        return profiles
+    
+    def select_profile(self, index):
+        """index번째 프로필로 변경 (바뀌었으면 True)"""
+        if not (0 <= index < len(self.profiles)) or index == self.current_profile_index:
+            return False
+        self.profiles[index].retry_load()  # 전에 읽지 못했으면 다시 시도
+        self.current_profile_index = index
+        self.current_profile = self.profiles[index]
+        self._emit('profile_changed', index=index, profile=self.current_profile)
+        return True
+    
+    def add_profile(self, name):
+        """새 프로필을 추가하고 선택"""
+        profile = Profile(name=name)
+        self.profiles.append(profile)
+        self.select_profile(len(self.profiles) - 1)
+        return profile
+    
+    def delete_profile(self, index):
+        """프로필 삭제 (최소 하나는 유지) 후 첫 번째 프로필 선택"""
+        if len(self.profiles) <= 1 or not (0 <= index < len(self.profiles)):
+            return False
+        del self.profiles[index]
+        self.current_profile_index = -1  # 같은 인덱스라도 다시 선택되도록
+        self.select_profile(0)
+        return True
+    
+    def write_dirty_profiles(self):
+        """변경되었거나 순서가 바뀐 프로필만 저장 스레드로 전달"""
+        positions = {profile.profile_id: i for i, profile in enumerate(self.profiles)}
+        
+        # 삭제된 프로필
+        operations = [('delete', profile_id) for profile_id in self.saved_positions
+                      if profile_id not in positions]
+        
+        for i, profile in enumerate(self.profiles):
+            saved_position = self.saved_positions.get(profile.profile_id)
+            if profile.load_failed:
+                # 읽지 못한 프로필은 임시 값으로 덮어쓰지 않음 (순서만 반영)
+                if saved_position is not None and saved_position != i:
+                    operations.append(('move', profile.profile_id, i))
+                continue
+            if profile.dirty or saved_position is None:
+                operations.append(('upsert', profile.profile_id, i, profile.to_dict()))
+                profile.dirty = False
+            elif saved_position != i:
+                # 순서만 바뀐 경우 내용은 다시 쓰지 않음 (읽지 않은 프로필도 그대로)
+                operations.append(('move', profile.profile_id, i))
+        
+        self.saved_positions = positions
+        
+        if operations:
+            self.profile_writer.submit(operations)
+    
+    def flush_profiles(self):
+        """변경된 프로필을 바로 저장하고 완료까지 대기"""
+        self.write_dirty_profiles()
+        self.profile_writer.flush()
+    
+    def reset_saved_state(self):
+        """저장 실패 후 저장소 상태를 다시 읽고, 다음 저장 때 모든 프로필을 다시 쓰도록 표시"""
+        try:
+            rows = self.profile_store.list_profiles()
+            self.saved_positions = {profile_id: i for i, (profile_id, _) in enumerate(rows)}
+        except sqlite3.Error:
+            self.saved_positions = {}
+        for profile in self.profiles:
+            profile.mark_dirty()
+    
+    def _on_save_failed(self, error):
+        self._emit('profile_save_failed', error=error)
+    
+    # ----- 요청 큐 -----
+    
+    def restore_requests(self):
+        """이전 실행에서 처리하지 못한 요청을 기록에서 복구 (복구한 요청 수 반환)"""
+        try:
+            pending_requests = self.request_journal.open()
+        except OSError as e:
+            log.error("요청 기록을 열 수 없습니다: %s", e)
+            return 0
+        for request in pending_requests:
+            traces.record(request.request_id, 'restored', profile=request.profile_index + 1,
+                          nickname=request.nickname, count=request.count)
+            evicted = self.request_queue.append(request)
+            if evicted is not None:
+                self.request_journal.drop(evicted)
+                metrics.inc('roulette_queue_evictions_total')
+                traces.record(evicted.request_id, 'evicted')
+        return len(pending_requests)
+    
+    def submit_request(self, profile_index, nickname=None, count=1, request_id=None):
+        """룰렛 요청을 큐에 추가 (큐가 가득 차면 가장 오래된 요청이 제거됨)
+        
+        request_id는 HTTP에서 받을 때 만든 추적 ID (없으면 새로 만듦)
+        """
+        request = RouletteRequest(profile_index, nickname, max(1, min(count, MAX_BATCH_COUNT)),
+                                  request_id=request_id)
+        
+        self.request_journal.enqueue(request)
+        metrics.inc('roulette_requests_total', profile=profile_index + 1)
+        traces.record(request.request_id, 'enqueued', profile=profile_index + 1,
+                      nickname=nickname, count=request.count)
+        evicted = self.request_queue.append(request)
+        if evicted is not None:
+            self.request_journal.drop(evicted)
+            metrics.inc('roulette_queue_evictions_total')
+            traces.record(evicted.request_id, 'evicted')
+            log.warning("요청 큐가 가득 찼습니다. 가장 오래된 요청을 제거했습니다. (최대 %s개, 제거: %s)",
+                        self.request_queue.max_size, evicted, extra={'trace_id': evicted.request_id})
+            self._emit('request_dropped', request=evicted)
+        queue_size = len(self.request_queue)
+        
+        # 닉네임이 있으면 로그에 표시, 없으면 익명으로 표시
+        nickname_display = nickname if nickname else "익명"
+        log.info("룰렛 요청 추가: 프로필 %s, 닉네임: %s, 횟수: %s, 대기 중인 요청: %s",
+                 profile_index + 1, nickname_display, request.count, queue_size,
+                 extra={'trace_id': request.request_id, 'queue_size': queue_size})
+        
+        self._emit('request_queued', request=request, queue_size=queue_size)
+        return request
+    
+    def next_request(self):
+        """큐에서 다음 요청을 꺼내 처리 시작 (같은 사용자의 요청은 연속해서, 없으면 None)"""
+        if not self.request_queue:
+            return None
+        
+        # 같은 사용자의 요청이 있으면 우선 처리, 없으면 가장 오래된 요청
+        request = self.request_queue.pop_next(self.last_nickname)
+        self.request_journal.dequeue(request)
+        self.current_request = request
+        metrics.observe('roulette_queue_wait_seconds', max(0.0, time.time() - request.timestamp))
+        traces.record(request.request_id, 'dequeued')
+        
+        nickname = request.nickname
+        self.last_nickname = nickname if nickname and nickname.strip() else None
+        
+        # 닉네임이 있으면 로그에 표시, 없으면 '익명'으로 표시
+        log.info("처리 중인 요청: 프로필 %s, 닉네임: %s", request.profile_index + 1, nickname or '익명',
+                 extra={'trace_id': request.request_id})
+        
+        # 해당 프로필로 변경
+        self.select_profile(request.profile_index)
+        self._emit('request_started', request=request)
+        return request
+    
+    def complete_request(self):
+        """현재 요청 처리 완료 (결과가 없어도 다시 처리하지 않음)"""
+        if self.current_request is not None:
+            self.request_journal.complete(self.current_request)
+        self.current_request = None
+    
+    # ----- 빠른 진행 -----
+    
+    def rotation_time(self):
+        """대기 요청 수에 맞춘 이번 회전 시간 (초)"""
+        profile = self.current_profile
+        base = profile.rotation_time
+        scale = profile.turbo.scale(len(self.request_queue))
+        if scale >= 1.0:
+            return base
+        return max(min(base, profile.turbo.min_rotation_time), base * scale)
+    
+    def next_spin_delay_ms(self):
+        """대기 요청 수에 맞춘 다음 요청까지의 대기 시간 (밀리초)"""
+        return int(NEXT_SPIN_DELAY_MS * self.current_profile.turbo.scale(len(self.request_queue)))
+    
+    @property
+    def current_trace_id(self):
+        """현재 요청의 추적 ID (수동 회전이면 None)"""
+        return self.current_request.request_id if self.current_request is not None else None
+    
+    def resolves_instantly(self):
+        """현재 요청을 애니메이션 없이 바로 처리해야 하는지 (현재 프로필 설정과 대기 요청 수 기준)"""
+        return (self.current_request is not None
+                and self.current_profile.turbo.resolves_instantly(len(self.request_queue)))
+    
+    def resolve_instantly(self):
+        """현재 요청부터, 즉시 처리 기준을 넘는 동안 대기 요청을 애니메이션 없이 처리
+        
+        처리한 결과 목록을 반환합니다. 마지막으로 꺼낸 요청이 기준 아래로 내려가면
+        처리하지 않고 current_request로 남겨 둡니다 (화면에서 회전).
+        """
+        results = []
+        while True:
+            result = self.draw()
+            if result is None:
+                self.complete_request()
+            else:
+                self.finish_spin(result)
+                results.append(result)
+            if not self.request_queue:
+                break
+            self.next_request()
+            if not self.resolves_instantly():
+                break
+        return results
+    
+    # ----- 추첨과 결과 처리 -----
+    
+    def draw(self):
+        """현재 프로필에서 당첨 항목을 추첨 (항목이 없으면 None)
+        
+        현재 요청의 count가 1보다 크면 한 번에 모두 추첨하고 같은 결과끼리 합산합니다.
+        """
+        profile = self.current_profile
+        if not profile.items:
+            return None
+        
+        self.spin_started = time.monotonic()
+        traces.record(self.current_trace_id, 'spin_start')
+        spin_count = self.current_request.count if self.current_request else 1
+        sampler = profile.get_sampler()
+        if spin_count > 1:
+            # 일괄 요청: 한 번에 모두 추첨하고 같은 결과끼리 합산
+            batch = Counter(sampler.draw_many(spin_count, self.rng)).most_common()
+            # 화면은 가장 많이 나온 항목에서 멈춤
+            result = SpinResult(self.current_request, profile, batch[0][0], batch)
+            log.debug("일괄 추첨 %s회 완료: %s종류 결과", spin_count, len(batch))
+        else:
+            result = SpinResult(self.current_request, profile, sampler.draw(self.rng))
+        
+        log.debug("선택된 항목: %s", result.item.name)
+        self._emit('spin_started', result=result)
+        return result
+    
+    def finish_spin(self, result):
+        """당첨 결과의 부가 작업을 실행하고 현재 요청을 완료 (화면 회전이 끝난 뒤 호출)"""
+        # 회전이 끝나 결과가 확정된 시점 (spin_start부터 여기까지가 회전 시간)
+        traces.record(self.current_trace_id, 'result', item=result.item.name)
+        if result.batch:
+            # 일괄 요청: 합산된 결과별로 한 번씩만 처리
+            batch_items = result.batch_items()
+            for item, hits in batch_items:
+                self.dispatch_result(item, hits, notify_webhook=False)
+            # 웹훅은 전체 결과를 요약한 메시지 하나로 전송
+            if self.current_profile.webhook.enabled:
+                self.send_batch_webhook_notification(batch_items)
+        else:
+            selected_item = result.item
+            log.info("최종 선택 항목: %s, 배율: %s", selected_item.name, selected_item.multiplier_text,
+                     extra={'trace_id': self.current_trace_id})
+            self.dispatch_result(selected_item)
+        
+        self.complete_request()
+        if self.spin_started is not None:
+            metrics.observe('roulette_spin_duration_seconds', time.monotonic() - self.spin_started)
+            self.spin_started = None
+        self._emit('spin_finished', result=result)
+    
+    def spin_once(self):
+        """애니메이션 없이 다음 요청(없으면 수동 회전 한 번)을 바로 추첨하고 처리"""
+        self.next_request()
+        result = self.draw()
+        if result is None:
+            log.warning("항목이 없습니다")
+            self.complete_request()
+            return None
+        self.finish_spin(result)
+        return result
+    
+    def run_pending(self):
+        """대기 중인 요청을 모두 바로 처리 (처리한 요청 수 반환)"""
+        processed = 0
+        while self.request_queue:
+            self.spin_once()
+            processed += 1
+        return processed
+    
+    def dispatch_result(self, selected_item, spins=1, notify_webhook=True):
+        """당첨 항목의 키 입력, MCRCON 명령어, 웹훅을 실행 (spins: 같은 항목의 당첨 횟수)"""
+        # 배율 가져오기 (반복 횟수로 사용)
+        repeat_count = selected_item.multiplier
+
+        # 키 입력 시뮬레이션 (선택된 항목에 키가 지정되어 있는 경우)
+        if selected_item.key_press and self.key_press_handler:
+            self.side_effects.submit('key', self.key_press_handler,
+                                     selected_item.key_press, repeat_count * spins,
+                                     trace_id=self.current_trace_id)
+        
+        # MCRCON 명령어 실행 (실행기 큐에 넣기만 하므로 바로 반환됨)
+        if self.current_profile.mcrcon.enabled and selected_item.command:
+            self.execute_mcrcon_command(selected_item.command, selected_item, spins)
+        
+        # 웹훅 전송 (실행기 큐에 넣기만 하므로 바로 반환됨)
+        if notify_webhook and self.current_profile.webhook.enabled:
+            self.send_webhook_notification(selected_item)
+    
+    def execute_mcrcon_command(self, command, selected_item, spins=1):
+        """MCRCON 명령어 실행 (배율에 따라 반복 실행, spins: 일괄 요청의 당첨 횟수)"""
+        try:
+            mcrcon = self.current_profile.mcrcon
+            if not mcrcon.enabled or not command:
+                return
+            
+            # 배율(반복 횟수) 가져오기
+            repeat_count = min(selected_item.multiplier, 50) * spins  # 회당 최대 50회로 제한
+            
+            log.debug("MCRCON 명령어 '%s' %s회 반복 실행 시작", command, repeat_count)
+            
+            # 서버별 지속 연결로 전송하도록 예약 (전송은 부가 작업 스레드에서 처리)
+            self.mcrcon_pool.submit(mcrcon, command, repeat_count, trace_id=self.current_trace_id)
+                
+        except Exception as e:
+            log.error("MCRCON 명령어 실행 준비 오류: %s", e)
+            
+    def send_webhook_notification(self, item):
+        """웹훅 알림 전송 (배율에 따라 반복 전송)"""
+        try:
+            webhook = self.current_profile.webhook
+            
+            # 항목별 웹훅 URL이 있으면 해당 URL 사용, 없으면 기본 URL 사용
+            webhook_url = item.webhook_url or webhook.url
+            
+            if not webhook.enabled or not webhook_url:
+                return
+            
+            # 배율(반복 횟수) 가져오기
+            repeat_count = min(item.multiplier, 30)  # 최대 30회로 제한
+                
+            log.debug("웹훅 알림 %s회 반복 전송 시작", repeat_count)
+            
+            username = webhook.username or "룰렛 봇"
+            
+            # 합치기 옵션이면 반복 횟수를 표시한 메시지 하나만 전송
+            message_count = 1 if webhook.coalesce else repeat_count
+            payloads = []
+            for i in range(message_count):
+                if webhook.coalesce:
+                    content = f"룰렛 결과: **{item.name}** (x{repeat_count})"
+                else:
+                    content = f"룰렛 결과: **{item.name}** (반복 {i+1}/{repeat_count})"
+                
+                # 웹훅 메시지 작성
+                payload = {
+                    "content": content,
+                    "username": username,
+                    "embeds": [
+                        {
+                            "title": "룰렛 결과",
+                            "description": f"**{item.name}** 항목이 선택되었습니다!",
+                            "color": 5814783,  # 보라색
+                            "fields": [
+                                {
+                                    "name": "배율(반복 횟수)",
+                                    "value": item.multiplier_text,
+                                    "inline": True
+                                },
+                                {
+                                    "name": "확률",
+                                    "value": f"{item.probability}%",
+                                    "inline": True
+                                }
+                            ],
+                            "footer": {
+                                "text": f"제공: 턴스튜디오의 룰렛 시스템"
+                            }
+                        }
+                    ]
+                }
+                
+                # 현재 요청한 사용자의 닉네임이 있으면 추가
+                if self.last_nickname:
+                    payload["embeds"][0]["fields"].append({
+                        "name": "요청자",
+                        "value": self.last_nickname,
+                        "inline": True
+                    })
+                
+                # 명령어가 있다면 추가
+                if item.command:
+                    payload["embeds"][0]["fields"].append({
+                        "name": "명령어",
+                        "value": f"`{item.command}`"
+                    })
+                
+                # 아바타 URL 추가
+                if webhook.avatar_url:
+                    payload["avatar_url"] = webhook.avatar_url
+                
+                payloads.append(payload)
+            
+            # 전송기 큐에 추가 (전송, 속도 제한 대기, 재시도는 작업 스레드에서 처리)
+            self.webhook_dispatcher.submit(webhook_url, payloads, trace_id=self.current_trace_id)
+                
+        except Exception as e:
+            log.error("웹훅 전송 준비 오류: %s", e)
+    
+    def send_batch_webhook_notification(self, batch_results):
+        """일괄 추첨 결과를 웹훅 URL별로 하나의 메시지로 요약 전송
+        
+        단일 추첨과 같이 항목별 웹훅 URL이 있으면 그 URL로, 없으면 기본 URL로 보냅니다.
+        """
+        try:
+            webhook = self.current_profile.webhook
+            if not webhook.enabled:
+                return
+            
+            # 항목별 웹훅 URL이 있으면 해당 URL, 없으면 기본 URL로 묶음 (URL이 없는 항목은 제외)
+            groups = {}
+            for item, hits in batch_results:
+                webhook_url = item.webhook_url or webhook.url
+                if webhook_url:
+                    groups.setdefault(webhook_url, []).append((item, hits))
+            
+            total = sum(hits for _, hits in batch_results)
+            for webhook_url, results in groups.items():
+                group_total = sum(hits for _, hits in results)
+                content = f"룰렛 일괄 결과: **{total}회** 추첨"
+                if group_total != total:
+                    content += f" (이 채널 항목 {group_total}회)"
+                fields = [
+                    {
+                        "name": item.name,
+                        "value": f"{hits}회 (배율 {item.multiplier_text})",
+                        "inline": True
+                    }
+                    for item, hits in results[:25]  # Discord 임베드 필드 최대 25개
+                ]
+                payload = {
+                    "content": content,
+                    "username": webhook.username or "룰렛 봇",
+                    "embeds": [
+                        {
+                            "title": "룰렛 일괄 결과",
+                            "description": f"요청자: {self.last_nickname or '익명'}",
+                            "color": 5814783,  # 보라색
+                            "fields": fields,
+                            "footer": {
+                                "text": f"제공: 턴스튜디오의 룰렛 시스템"
+                            }
+                        }
+                    ]
+                }
+                if webhook.avatar_url:
+                    payload["avatar_url"] = webhook.avatar_url
+                
+                self.webhook_dispatcher.submit(webhook_url, [payload], trace_id=self.current_trace_id)
+        except Exception as e:
+            log.error("일괄 결과 웹훅 전송 오류: %s", e)
+    
+    def shutdown(self, timeout=SIDE_EFFECT_SHUTDOWN_TIMEOUT):
+        """프로필 저장, 남은 부가 작업 정리 (대기 중인 요청은 기록에 남아 다음 실행 때 복구됨)"""
+        self.flush_profiles()
+        self.profile_store.close()
+        # 이미 당첨된 보상이 전달되도록 남은 작업을 잠시 기다린 뒤 연결 종료
+        # (웹훅은 재시도 대기 없이 한 번씩만 시도)
+        self.webhook_dispatcher.stop_retries()
+        self.side_effects.shutdown(timeout)
+        self.mcrcon_pool.close_all()
+        self.webhook_dispatcher.shutdown()
+        self.request_journal.close()
+
+class RouletteHandler(BaseHTTPRequestHandler):
+    # keep-alive 지원 (HTTP/1.1) - 모든 응답에 Content-Length를 포함해야 함
+    protocol_version = "HTTP/1.1"
+    # 유휴 keep-alive 연결이 워커를 계속 점유하지 않도록 소켓 타임아웃 설정
+    timeout = SERVER_KEEP_ALIVE_TIMEOUT
+
+    def extract_profile_and_params(self):
+        """URL에서 프로필 번호와 쿼리 파라미터 추출"""
+        import re
+        from urllib.parse import urlparse, parse_qs
+        
+        # URL 파싱
+        parsed_url = urlparse(self.path)
+        query_params = parse_qs(parsed_url.query)
+        
+        # 경로에서 프로필 번호 추출 (예: /r1 -> 1)
+        profile_match = re.match(r'/r(\d+)', parsed_url.path)
+        profile_number = int(profile_match.group(1)) if profile_match else None
+        
+        return profile_number, query_params
+    
+    def send_json(self, status_code, response_data):
+        """JSON 응답 전송 (keep-alive를 위해 Content-Length 포함)
+        
+        send_error()는 메시지를 latin-1로 인코딩하므로 한글 메시지는 이 메서드로 보냄
+        """
+        body = json.dumps(response_data, ensure_ascii=False).encode('utf-8')
+        self.send_body(status_code, 'application/json', body)
+    
+    def send_body(self, status_code, content_type, body):
+        """응답 전송 후 경로/상태 코드별 요청 수 기록"""
+        self.send_response(status_code)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        metrics.inc('roulette_http_requests_total', route=self.route(), status=status_code)
+    
+    def route(self):
+        """지표용 경로 이름 (/r1, /r2 ...는 /r 하나로 묶음)"""
+        import re
+        path = self.path.split('?', 1)[0]
+        if re.match(r'/r\d+', path):
+            return "/r"
+        if path.startswith("/traces"):
+            return "/traces"
+        return path if path in ("/metrics",) else "other"
+    
+    def send_metrics(self):
+        """운영 지표를 Prometheus 텍스트 형식으로 전송 (엔진/Qt 스레드를 기다리지 않음)"""
+        body = metrics.render().encode('utf-8')
+        self.send_body(200, 'text/plain; version=0.0.4; charset=utf-8', body)
+    
+    def send_traces(self):
+        """요청 추적 기록 전송
+        
+        /traces?limit=N: 최근 요청 N개 (새 요청부터), /traces/{추적 ID}: 요청 하나
+        """
+        from urllib.parse import urlparse, parse_qs
+        parsed = urlparse(self.path)
+        trace_id = parsed.path[len("/traces"):].strip('/')
+        if trace_id:
+            trace = traces.get(trace_id)
+            if trace is None:
+                self.send_json(404, {'status': 'error', 'message': '추적 기록을 찾을 수 없습니다'})
+            else:
+                self.send_json(200, trace)
+            return
+        try:
+            limit = int(parse_qs(parsed.query).get('limit', [TRACE_QUERY_LIMIT])[0])
+        except ValueError:
+            self.send_json(400, {'status': 'error', 'message': '잘못된 limit 값입니다'})
+            return
+        self.send_json(200, {'traces': traces.recent(max(0, min(limit, TRACE_BUFFER_SIZE)))})
+    
+    def parse_count(self, value):
+        """추첨 횟수 파라미터 검증 (1 ~ MAX_BATCH_COUNT)"""
+        if value in (None, ''):
+            return 1
+        count = int(value)
+        if count < 1:
+            raise ValueError("count는 1 이상이어야 합니다")
+        return min(count, MAX_BATCH_COUNT)
+    
+    def enqueue_request(self, profile_number, nickname, count=1):
+        """룰렛 요청을 엔진 스레드로 전달하고 추적 ID를 반환 - HTTP 스레드는 큐 처리를 기다리지 않음"""
+        trace_id = uuid.uuid4().hex
+        traces.record(trace_id, 'received', profile=profile_number, nickname=nickname, count=count)
+        app = getattr(self.server, 'app', None)
+        if app:
+            profile_index = profile_number - 1
+            # 룰렛 요청 추가 (닉네임 포함) - request_roulette은 스레드 안전하게 엔진 스레드로 넘김
+            app.request_roulette(profile_index, nickname, count, trace_id)
+        return trace_id
+    
+    def do_GET(self):
+        try:
+            path = self.path.split('?', 1)[0]
+            if path == "/metrics":
+                self.send_metrics()
+                return
+            if path == "/traces" or path.startswith("/traces/"):
+                self.send_traces()
+                return
+            
+            profile_number, query_params = self.extract_profile_and_params()
+            
+            if profile_number is not None:
+                # 닉네임 파라미터 추출 - 빈 문자열이면 None으로 처리
+                nickname = query_params.get('nickname', [''])[0] or None
+                
+                try:
+                    count = self.parse_count(query_params.get('count', [''])[0])
+                except ValueError:
+                    self.send_json(400, {'status': 'error', 'message': '잘못된 count 값입니다'})
+                    return
+                
+                trace_id = self.enqueue_request(profile_number, nickname, count)
+                
+                response_data = {
+                    'status': 'success',
+                    'message': '요청이 처리되었습니다.',
+                    'nickname': nickname or '익명',
+                    'count': count,
+                    'trace_id': trace_id
+                }
+                self.send_json(200, response_data)
+            else:
+                self.send_json(404, {'status': 'error', 'message': '경로를 찾을 수 없습니다'})
+        except Exception as e:
+            log.error("GET 요청 처리 중 오류: %s", e)
+            self.send_json(500, {'status': 'error', 'message': str(e)})
+    
+    def do_POST(self):
+        try:
+            profile_number, query_params = self.extract_profile_and_params()
+            
+            # keep-alive 연결에서는 본문을 항상 끝까지 읽어야 다음 요청을 올바르게 파싱할 수 있음
+            content_length = int(self.headers.get('Content-Length', 0) or 0)
+            post_data = self.rfile.read(content_length) if content_length > 0 else b''
+            
+            if profile_number is not None:
+                # 닉네임 파라미터 추출 - 빈 문자열이면 None으로 처리
+                nickname = query_params.get('nickname', [''])[0] or None
+                count_param = query_params.get('count', [''])[0]
+                
+                # JSON 본문 지원: {"nickname": "...", "count": 50} (쿼리 파라미터가 우선)
+                # JSON이 아닌 본문은 기존처럼 무시
+                try:
+                    body = json.loads(post_data.decode('utf-8')) if post_data.strip() else {}
+                except (ValueError, UnicodeDecodeError):
+                    body = {}
+                if isinstance(body, dict):
+                    if not nickname and body.get('nickname'):
+                        nickname = str(body['nickname'])
+                    if not count_param and body.get('count') is not None:
+                        count_param = str(body['count'])
+                
+                try:
+                    count = self.parse_count(count_param)
+                except ValueError:
+                    self.send_json(400, {'status': 'error', 'message': '잘못된 count 값입니다'})
+                    return
+                
+                trace_id = self.enqueue_request(profile_number, nickname, count)
+                
+                app = getattr(self.server, 'app', None)
+                response_data = {
+                    'status': 'success',
+                    'message': '요청이 처리되었습니다.',
+                    'nickname': nickname or '익명',
+                    'count': count,
+                    'queue_size': len(app.request_queue) if app else 0,
+                    'trace_id': trace_id
+                }
+                self.send_json(200, response_data)
+            else:
+                self.send_json(404, {'status': 'error', 'message': '경로를 찾을 수 없습니다'})
+        except Exception as e:
+            log.error("POST 요청 처리 중 오류: %s", e)
+            self.send_json(500, {'status': 'error', 'message': str(e)})
+    
+    # 로그 출력 방지
+    def log_message(self, format, *args):
+        return
+
+class RouletteHTTPServer(ThreadingHTTPServer):
+    """요청마다 스레드로 처리하는 HTTP 서버 (동시 처리 수 제한 포함)
+    
+    느린 클라이언트 하나가 다른 요청을 막지 않도록 연결마다 별도 스레드에서 처리하고,
+    동시에 처리하는 연결 수는 max_workers로 제한합니다. 한도에 도달하면 새 연결은
+    listen backlog에서 대기합니다.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, server_address, handler_class, app=None,
+                 max_workers=SERVER_MAX_WORKERS, backlog=SERVER_LISTEN_BACKLOG):
+        # request_queue_size는 server_activate()의 listen()에서 사용되므로 초기화 전에 설정
+        self.request_queue_size = backlog
+        self.max_workers = max_workers
+        self._worker_slots = threading.BoundedSemaphore(max_workers)
+        self.app = app  # 요청을 받을 앱 (request_roulette, profiles, request_queue 제공)
+        super().__init__(server_address, handler_class)
+    
+    def process_request(self, request, client_address):
+        # 워커 슬롯이 빌 때까지 대기 (남은 연결은 커널 backlog에 쌓임)
+        self._worker_slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self._worker_slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            # 연결마다 새 스레드이므로 지표 조각을 남기지 않고 합침
+            metrics.retire_thread()
+            self._worker_slots.release()
+
+def start_server(app, host=SERVER_HOST, port=SERVER_PORT,
+                 max_workers=SERVER_MAX_WORKERS, backlog=SERVER_LISTEN_BACKLOG):
+    try:
+        server = RouletteHTTPServer((host, port), RouletteHandler, app=app,
+                                    max_workers=max_workers, backlog=backlog)
+        
+        # 사용 가능한 URL 경로 표시
+        profile_count = len(app.profiles)
+        log.info("서버가 다음 URL에서 실행 중입니다: (동시 연결 %s개, backlog %s)", max_workers, backlog)
+        log.info("사용자: 턴스튜디오")
+        for i in range(profile_count):
+            profile_name = app.profiles[i].name
+            log.info("프로필 %s (%s): http://%s:%s/r%s", i + 1, profile_name, host, port, i + 1)
+            log.info("닉네임 지정: http://%s:%s/r%s?nickname={nickname}", host, port, i + 1)
+        log.info("운영 지표: http://%s:%s/metrics", host, port)
+        log.info("요청 추적: http://%s:%s/traces", host, port)
+            
+        server.serve_forever()
+    except OSError as e:
+        log.error("서버 실행 중 오류 발생: %s", e)
+        log.error("다른 포트를 사용하려면 SERVER_PORT 설정을 변경하세요.")
+
+# 창 없이 실행하는 룰렛
+class HeadlessRoulette:
+    """HTTP 요청을 받아 애니메이션 없이 바로 추첨하는 실행기
+    
+    request_roulette()는 어느 스레드에서나 호출할 수 있으며, 엔진은 전용 스레드
+    하나에서만 사용합니다.
+    """
+    def __init__(self, engine):
+        self.engine = engine
+        self._inbox = queue.Queue()
+        self._thread = None
+    
+    @property
+    def profiles(self):
+        return self.engine.profiles
+    
+    @property
+    def request_queue(self):
+        return self.engine.request_queue
+    
+    def request_roulette(self, profile_index, nickname=None, count=1, trace_id=None):
+        """요청을 엔진 스레드로 전달 (바로 반환)"""
+        self._inbox.put((profile_index, nickname, count, trace_id))
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="roulette-engine")
+        self._thread.start()
+    
+    def stop(self):
+        """남은 요청을 처리한 뒤 엔진 종료"""
+        if self._thread is not None:
+            self._inbox.put(None)
+            self._thread.join()
+            self._thread = None
+        self.engine.shutdown()
+    
+    def _run(self):
+        engine = self.engine
+        engine.run_pending()  # 기록에서 복구한 요청
+        while True:
+            job = self._inbox.get()
+            if job is None:
+                break
+            engine.submit_request(*job)
+            engine.run_pending()
+
+def main():
+    """창 없이 HTTP 요청만 처리하는 서버로 실행"""
+    setup_logging()
+    engine = RouletteEngine()
+    engine.load_profiles()
+    restored = engine.restore_requests()
+    if restored:
+        log.info("복구한 요청 %s개를 처리합니다.", restored)
+    
+    runner = HeadlessRoulette(engine)
+    runner.start()
+    try:
+        start_server(runner)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runner.stop()
+        stop_logging()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""download_file / download_and_extract_images 조건부 다운로드 테스트 (로컬 HTTP 서버 사용)"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+mainf = None  # setUpModule에서 임시 폴더로 옮긴 뒤 불러옴 (불러올 때 config/images/sounds 폴더를 만듦)
+_old_cwd = None
+_work_dir = None
+
+
+def setUpModule():
+    global mainf, _old_cwd, _work_dir
+    _old_cwd = os.getcwd()
+    _work_dir = tempfile.mkdtemp(prefix="roulette-download-test-")
+    os.chdir(_work_dir)
+    import mainf as module
+    mainf = module
+
+
+def tearDownModule():
+    os.chdir(_old_cwd)
+    shutil.rmtree(_work_dir, ignore_errors=True)
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zip_file:
+        for name, data in files.items():
+            zip_file.writestr(name, data)
+    return buffer.getvalue()
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    """server.assets(경로 → (ETag, 내용))를 보내고 If-None-Match가 맞으면 304로 응답"""
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+        etag, body = self.server.assets[self.path]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), AssetHandler)
+        self.server.assets = {}
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.dir = tempfile.mkdtemp(dir=_work_dir)
+        self.manifest = mainf.AssetManifest(os.path.join(self.dir, "manifest.json"))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_download_file_not_modified(self):
+        self.server.assets['/tick.mp3'] = ('"v1"', b"tick" * 1000)
+        url = self.base_url + '/tick.mp3'
+        path = os.path.join(self.dir, "tick.mp3")
+
+        self.assertEqual(mainf.download_file(url, path, self.manifest), 200)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b"tick" * 1000)
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        # 파일이 그대로면 조건부 요청 → 304, 파일은 다시 쓰지 않음
+        self.assertEqual(mainf.download_file(url, path, self.manifest), 304)
+        self.assertEqual(self.server.requests[-1], ('/tick.mp3', '"v1"'))
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime_ns)
+        self.assertEqual([name for name in os.listdir(self.dir) if name.endswith(".tmp")], [])
+
+        # 기록은 파일로도 남아 다음 실행에서 같은 조건부 요청을 보냄
+        reloaded = mainf.AssetManifest(self.manifest.path)
+        self.assertEqual(reloaded.conditional_headers(url, path), {'If-None-Match': '"v1"'})
+
+    def test_download_file_local_change_refetches(self):
+        self.server.assets['/tick.mp3'] = ('"v1"', b"tick")
+        url = self.base_url + '/tick.mp3'
+        path = os.path.join(self.dir, "tick.mp3")
+        mainf.download_file(url, path, self.manifest)
+
+        # 받은 뒤 파일이 바뀌었으면 조건 없이 다시 받음
+        with open(path, 'wb') as f:
+            f.write(b"broken")
+        self.assertEqual(mainf.download_file(url, path, self.manifest), 200)
+        self.assertEqual(self.server.requests[-1], ('/tick.mp3', None))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b"tick")
+
+    def test_image_package_skips_unchanged_files(self):
+        url = self.base_url + '/images.zip'
+        self.server.assets['/images.zip'] = ('"v1"', make_zip({'a.png': b"aaaa", 'b.png': b"bbbb"}))
+        mainf.download_and_extract_images(url=url, manifest=self.manifest, workers=2)
+        a_path = os.path.join(mainf.IMAGE_FOLDER, 'a.png')
+        b_path = os.path.join(mainf.IMAGE_FOLDER, 'b.png')
+        a_mtime = os.stat(a_path).st_mtime_ns
+
+        # 패키지가 바뀌어도 내용(CRC)이 같은 항목은 다시 풀지 않음
+        self.server.assets['/images.zip'] = ('"v2"', make_zip({'a.png': b"aaaa", 'b.png': b"BBBBBB"}))
+        mainf.download_and_extract_images(url=url, manifest=self.manifest, workers=2)
+        self.assertEqual(os.stat(a_path).st_mtime_ns, a_mtime)
+        with open(b_path, 'rb') as f:
+            self.assertEqual(f.read(), b"BBBBBB")
+
+        # 패키지가 그대로면 304, 아무 파일도 쓰지 않음
+        b_mtime = os.stat(b_path).st_mtime_ns
+        mainf.download_and_extract_images(url=url, manifest=self.manifest)
+        self.assertEqual(self.server.requests[-1], ('/images.zip', '"v2"'))
+        self.assertEqual(os.stat(a_path).st_mtime_ns, a_mtime)
+        self.assertEqual(os.stat(b_path).st_mtime_ns, b_mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()